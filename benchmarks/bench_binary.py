@@ -0,0 +1,84 @@
+"""
+Benchmark the binary format against the CSV, JSON and JSON Lines formats for size and throughput.
+
+Each format serializes the same records to a file and reads them back with deserialize_iter(), the path used
+by the import command. The binary format is also read through BinaryReader, which memory-maps the file and
+decodes its blocks without validating the records, and by random access to single records.
+
+Usage:
+    python benchmarks/bench_binary.py [--rows 1000000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from personal_data_manager.models.record_batch import RecordBatch  # noqa: E402
+from personal_data_manager.serializers import SerializerFactory  # noqa: E402
+from personal_data_manager.serializers.binary_ser import BinaryReader  # noqa: E402
+
+
+def timed(func) -> float:
+    """
+    Run a function and return its wall time.
+
+    Args:
+        func (Callable): The function to run.
+
+    Returns:
+        float: The wall time in seconds.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Entry point of the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Binary format benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows (default: 1000000)")
+    args = parser.parse_args()
+
+    records = RecordBatch.from_rows((f"Person {i}", f"{i} Main St, Springfield", f"555-{i % 1000:03d}-{i % 10000:04d}")
+                                    for i in range(args.rows))
+    batches = [records[start:start + 1000] for start in range(0, len(records), 1000)]
+
+    print(f"{'format':<8} {'size':>10} {'write':>9} {'write/s':>11} {'read':>9} {'read/s':>11}")
+    with tempfile.TemporaryDirectory() as tempdir:
+        for fmt in ("csv", "json", "jsonl", "binary"):
+            serializer = SerializerFactory.create_serializer(fmt)
+            file_name = os.path.join(tempdir, f"address_book.{fmt}")
+
+            def write() -> None:
+                with open(file_name, "wb" if serializer.binary else "w") as f:
+                    serializer.write_to(f, batches)
+
+            def read() -> None:
+                with open(file_name, "rb") if serializer.binary else open(file_name, "r", newline="") as f:
+                    count = sum(1 for _ in serializer.deserialize_iter(f))
+                assert count == args.rows, f"{fmt} read {count} records instead of {args.rows}"
+
+            write_time = timed(write)
+            read_time = timed(read)
+            size = os.path.getsize(file_name)
+            print(f"{fmt:<8} {size / 2 ** 20:7.1f} MiB {write_time:8.2f}s {args.rows / write_time:9.0f}/s "
+                  f"{read_time:8.2f}s {args.rows / read_time:9.0f}/s")
+
+        binary_file = os.path.join(tempdir, "address_book.binary")
+        with BinaryReader(binary_file) as reader:
+            scan_time = timed(lambda: sum(len(batch) for batch in reader.iter_batches()))
+            print(f"{'binary, memory-mapped block scan':<40} {scan_time:8.2f}s {args.rows / scan_time:9.0f}/s")
+
+            indexes = [random.randrange(args.rows) for _ in range(10_000)]
+            lookup_time = timed(lambda: [reader[index] for index in indexes])
+            print(f"{'binary, random record lookups':<40} {lookup_time / len(indexes) * 1e6:8.1f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark compressed exports, compressing in the serializing thread against compressing in the background.
+
+The inline baseline writes through gzip.open(), bz2.open() and lzma.open(), which compress each write before
+returning to the serializer. open_compressed() hands the written bytes to a background thread instead, so
+serializing the next chunk overlaps with compressing the previous one.
+
+Usage:
+    python benchmarks/bench_compression.py [--rows 200000] [--format csv]
+"""
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from personal_data_manager.models.record_batch import RecordBatch  # noqa: E402
+from personal_data_manager.serializers import SerializerFactory  # noqa: E402
+from personal_data_manager.streams.compression import COMPRESSION_LEVELS, open_compressed  # noqa: E402
+
+# The function opening a file compressed in the serializing thread, for each compression
+INLINE_OPENERS = {
+    "gzip": lambda file_name, mode, level: gzip.open(file_name, mode, compresslevel=level),
+    "bz2": lambda file_name, mode, level: bz2.open(file_name, mode, compresslevel=level),
+    "xz": lambda file_name, mode, level: lzma.open(file_name, mode, preset=level),
+}
+
+
+def main() -> None:
+    """
+    Entry point of the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Compressed export benchmark")
+    parser.add_argument("--rows", type=int, default=200_000, help="Number of rows (default: 200000)")
+    parser.add_argument("--format", default="csv", help="Serialization format (default: csv)")
+    args = parser.parse_args()
+
+    records = RecordBatch.from_rows((f"Person {i}", f"{i} Main St, Springfield", f"555-{i % 1000:03d}-{i % 10000:04d}")
+                                    for i in range(args.rows))
+    batches = [records[start:start + 1000] for start in range(0, len(records), 1000)]
+    serializer = SerializerFactory.create_serializer(args.format)
+    mode = "wb" if serializer.binary else "w"
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_name = os.path.join(tempdir, f"address_book.{args.format}")
+        start = time.perf_counter()
+        with open(file_name, mode) as f:
+            serializer.write_to(f, batches)
+        elapsed = time.perf_counter() - start
+        raw_size = os.path.getsize(file_name)
+        print(f"{'uncompressed':<22} {raw_size / 2 ** 20:8.1f} MiB {elapsed:7.2f}s "
+              f"{raw_size / 2 ** 20 / elapsed:8.1f} MiB/s")
+
+        for compression, opener in INLINE_OPENERS.items():
+            level = COMPRESSION_LEVELS[compression][0]
+            inline_mode = mode if serializer.binary else "wt"
+            for label, open_file in (("inline", lambda: opener(file_name, inline_mode, level)),
+                                     ("background", lambda: open_compressed(file_name, mode, compression, level))):
+                start = time.perf_counter()
+                with open_file() as f:
+                    serializer.write_to(f, batches)
+                elapsed = time.perf_counter() - start
+                size = os.path.getsize(file_name)
+                print(f"{compression + ' ' + label:<22} {size / 2 ** 20:8.1f} MiB {elapsed:7.2f}s "
+                      f"{raw_size / 2 ** 20 / elapsed:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
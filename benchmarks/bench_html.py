@@ -0,0 +1,87 @@
+"""
+Benchmark deserializing HTML exports with the streaming table parser against BeautifulSoup.
+
+The BeautifulSoup baseline is the previous implementation of HTMLSerializer.deserialize, which built a full
+soup tree of the document before reading its cells. It is skipped when beautifulsoup4 is not installed, as it
+is no longer a dependency of the package.
+
+Usage:
+    python benchmarks/bench_html.py [--rows 100000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from io import StringIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from personal_data_manager.models.personal_data import PersonalData  # noqa: E402
+from personal_data_manager.models.record_batch import RecordBatch  # noqa: E402
+from personal_data_manager.serializers.html_ser import HTMLSerializer  # noqa: E402
+
+
+def legacy_deserialize(serialized_records: str) -> list:
+    """The BeautifulSoup-based HTMLSerializer.deserialize, kept as the baseline of the benchmark."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(serialized_records, 'html.parser')
+    records = []
+    for row in soup.find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) == 3:
+            name, address, phone_number = [cell.text.strip() for cell in cells]
+            records.append(PersonalData(name, address, phone_number))
+    return records
+
+
+def measure(label: str, rows: int, func) -> None:
+    """
+    Run a function twice, printing its wall time per row and then its peak memory.
+
+    The memory is traced in a separate run, as tracing slows down the allocations being timed.
+
+    Args:
+        label (str): The name of the benchmark.
+        rows (int): The number of rows processed by the function.
+        func (Callable): The function to run.
+    """
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    assert count == rows, f"{label} read {count} records instead of {rows}"
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<36} {elapsed:8.3f}s  {elapsed / rows * 1e9:8.0f} ns/row  peak {peak / 2 ** 20:8.1f} MiB")
+
+
+def main() -> None:
+    """
+    Entry point of the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="HTML deserialization benchmark")
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of rows (default: 100000)")
+    args = parser.parse_args()
+
+    records = RecordBatch.from_rows((f"Person {i} & Co", f"{i} Main St", f"555-{i % 1000:03d}-{i % 10000:04d}")
+                                    for i in range(args.rows))
+    serializer = HTMLSerializer()
+    document = serializer.serialize(records)
+
+    print(f"Deserializing {args.rows} records from {len(document) / 2 ** 20:.1f} MiB of HTML:")
+    try:
+        import bs4  # noqa: F401
+    except ImportError:
+        print(f"{'before: BeautifulSoup':<36} skipped (beautifulsoup4 is not installed)")
+    else:
+        measure("before: BeautifulSoup", args.rows, lambda: len(legacy_deserialize(document)))
+    measure("HTMLSerializer.deserialize", args.rows, lambda: len(serializer.deserialize(document)))
+    measure("HTMLSerializer.deserialize_iter", args.rows,
+            lambda: sum(1 for _ in serializer.deserialize_iter(StringIO(document))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark the cost of creating PersonalData objects from database rows.
+
+Compares the previous implementation (a __dict__-based class validating every row with an uncompiled
+regex), the current validating constructor, and the trusted from_row() and row_factory paths used for rows
+read back from SQLite. The garbage collector is disabled while timing so that its pauses, which depend on
+the number of live objects rather than on the construction cost, do not skew the results.
+
+Usage:
+    python benchmarks/bench_models.py [--rows 1000000]
+"""
+import argparse
+import gc
+import os
+import re
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from personal_data_manager.models.personal_data import PersonalData  # noqa: E402
+
+
+class LegacyPersonalData:
+    """The PersonalData class before the fast path, kept as the baseline of the benchmark."""
+
+    def __init__(self, name: str, address: str, phone_number: str) -> None:
+        if not isinstance(name, str):
+            raise TypeError("Name must be a string")
+        if not isinstance(address, str):
+            raise TypeError("Address must be a string")
+        if not isinstance(phone_number, str):
+            raise TypeError("Phone number must be a string")
+        if not name:
+            raise ValueError("Name cannot be empty")
+        if not address:
+            raise ValueError("Address cannot be empty")
+        if not phone_number:
+            raise ValueError("Phone number cannot be empty")
+        if not re.match(r"^\d{3}-\d{3}-\d{4}$", phone_number):
+            raise ValueError("Phone number must be in the format ###-###-####")
+        self.name = name
+        self.address = address
+        self.phone_number = phone_number
+
+
+def time_per_row(label: str, rows: int, func) -> None:
+    """
+    Run a function once and print its wall time per row.
+
+    Args:
+        label (str): The name of the benchmark.
+        rows (int): The number of rows processed by the function.
+        func (Callable): The function to run.
+    """
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    print(f"{label:<42} {elapsed:8.3f}s  {elapsed / rows * 1e9:8.0f} ns/row")
+
+
+def main() -> None:
+    """
+    Entry point of the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="PersonalData construction benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows (default: 1000000)")
+    args = parser.parse_args()
+
+    rows = [(f"Person {i}", f"{i} Main St", f"555-{i % 1000:03d}-{i % 10000:04d}") for i in range(args.rows)]
+
+    print(f"Creating {args.rows} PersonalData objects from tuples:")
+    time_per_row("before: LegacyPersonalData(*row)", args.rows, lambda: [LegacyPersonalData(*row) for row in rows])
+    time_per_row("PersonalData(*row) (validating)", args.rows, lambda: [PersonalData(*row) for row in rows])
+    time_per_row("PersonalData.from_row(row) (trusted)", args.rows, lambda: [PersonalData.from_row(row) for row in rows])
+
+    # Read the same rows back from an in-memory database
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE personal_data (name TEXT, address TEXT, phone_number TEXT)")
+    conn.executemany("INSERT INTO personal_data VALUES (?, ?, ?)", rows)
+    query = "SELECT name, address, phone_number FROM personal_data"
+
+    def validating_cursor() -> list:
+        return [PersonalData(*row) for row in conn.execute(query)]
+
+    def trusted_cursor() -> list:
+        cursor = conn.cursor()
+        cursor.row_factory = PersonalData.row_factory
+        return cursor.execute(query).fetchall()
+
+    def legacy_cursor() -> list:
+        return [LegacyPersonalData(*row) for row in conn.execute(query)]
+
+    print(f"\nReading {args.rows} records from SQLite:")
+    time_per_row("before: cursor + LegacyPersonalData(*row)", args.rows, legacy_cursor)
+    time_per_row("cursor + PersonalData(*row)", args.rows, validating_cursor)
+    time_per_row("cursor + PersonalData.row_factory", args.rows, trusted_cursor)
+
+    # Measure the memory held per record, excluding the strings shared with the source rows
+    print()
+    for label, factory in [("before (__dict__)", lambda row: LegacyPersonalData(*row)),
+                           ("after (__slots__)", PersonalData.from_row)]:
+        tracemalloc.start()
+        records = [factory(row) for row in rows]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Memory per record {label}: {current / len(records):.0f} bytes")
+        del records
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark the text and HTML writers on growing datasets, checking that they take linear time.
+
+Each writer formats the same records to a stream that discards its input, so only the formatting is timed.
+The time per record of the largest dataset is compared with the time per record of the smallest one, and the
+benchmark exits with an error if it grew by more than the allowed slowdown.
+
+Usage:
+    python benchmarks/bench_scaling.py [--sizes 10000 100000 1000000] [--max_slowdown 3.0]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from personal_data_manager.display_formatters.display_fmt_factory import DisplayFormatterFactory  # noqa: E402
+from personal_data_manager.models.record_batch import RecordBatch  # noqa: E402
+from personal_data_manager.serializers.ser_factory import SerializerFactory  # noqa: E402
+
+
+class NullStream:
+    """A writable text stream that discards its input, so that only the formatting is timed."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def make_batch(size: int) -> RecordBatch:
+    """
+    Create a batch of distinct records.
+
+    Args:
+        size (int): The number of records.
+
+    Returns:
+        RecordBatch: The records.
+    """
+    return RecordBatch([f"Person {i}" for i in range(size)], [f"{i} Main St" for i in range(size)],
+                       [f"555-{i // 10000 % 1000:03d}-{i % 10000:04d}" for i in range(size)])
+
+
+def time_per_record(write, records: RecordBatch) -> float:
+    """
+    Measure the best time per record of three runs of a write function.
+
+    Args:
+        write: A function writing the records to a stream.
+        records (RecordBatch): The records.
+
+    Returns:
+        float: The time per record in seconds.
+    """
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        write(NullStream(), records)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / len(records)
+
+
+def main() -> None:
+    """
+    Entry point of the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Linear scaling benchmark of the text and HTML writers")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Dataset sizes, from smallest to largest (default: 10000 100000 1000000)")
+    parser.add_argument("--max_slowdown", type=float, default=3.0,
+                        help="Largest allowed ratio between the time per record of the largest and the smallest "
+                             "dataset (default: 3.0)")
+    args = parser.parse_args()
+
+    writers = {
+        "text serializer": SerializerFactory.create_serializer("text").write_to,
+        "html serializer": SerializerFactory.create_serializer("html").write_to,
+        "text display formatter": DisplayFormatterFactory.create_formatter("text", []).write_to,
+        "html display formatter": DisplayFormatterFactory.create_formatter("html", []).write_to,
+    }
+    batches = {size: make_batch(size) for size in args.sizes}
+
+    print(f"{'writer':<24}" + "".join(f"{size:>14,}" for size in args.sizes) + "    slowdown")
+    failed = []
+    for label, write in writers.items():
+        per_record = [time_per_record(write, batches[size]) for size in args.sizes]
+        slowdown = per_record[-1] / per_record[0]
+        print(f"{label:<24}" + "".join(f"{seconds * 1e9:>11.0f} ns" for seconds in per_record)
+              + f"    {slowdown:7.2f}x")
+        if slowdown > args.max_slowdown:
+            failed.append(label)
+
+    if failed:
+        sys.exit(f"Slower than linear (more than {args.max_slowdown}x per record): {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
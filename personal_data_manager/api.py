@@ -1,65 +1,365 @@
+import json
 import os
 import sqlite3
 import re
-from typing import List
+import sys
+import time
+from itertools import chain, islice
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from .serializers import SerializerFactory
-from .models.personal_data import PersonalData
+from .database import (ChangeLog, ConnectionPool, DatasetVersion, FullTextIndex, IndexRegistry, KeysetPaginator,
+                       Migration, Migrator, Page, QueryCache)
+from .database.migrations import ProgressCallback
+from .export_cache import ExportCache
+from .serializers import BaseSerializer, SerializerFactory
+from .models.personal_data import InvalidRecord, PersonalData
+from .models.record_batch import RecordBatch
 from .display_formatters.display_fmt_factory import DisplayFormatterFactory
+from .streams.compression import (COMPRESSIONS, CompressionStats, check_compression, compression_from_extension,
+                                  open_compressed)
+
+
+def _phone_digits(phone_number: str) -> str:
+    """
+    Private helper function to normalize a phone number the way the "phone_digits" column does.
+
+    Args:
+        phone_number (str): A phone number.
+
+    Returns:
+        str: The digits of the phone number.
+    """
+    return phone_number.translate(_PHONE_PUNCTUATION)
+
+
+# Translation table removing the punctuation stripped by the "phone_digits" column
+_PHONE_PUNCTUATION = str.maketrans("", "", "- ().+")
+
+# Ten consecutive digits of a phone number stored without punctuation
+_UNFORMATTED_PHONE_NUMBER = re.compile(r'(\d{3})(\d{3})(\d{4})')
+
+
+# The database opened by the API unless another path or a connection pool is given
+DEFAULT_DB_PATH = "data/address_book.db"
+
+# The columns of a record, in the order of the PersonalData constructor
+_RECORD_COLUMNS = ("name", "address", "phone_number")
+
+# The query returning every record of the dataset
+_SELECT_RECORDS = "SELECT name, address, phone_number FROM personal_data"
+
+
+def _reserve_file_name(directory_path: str, output_format: str, compression: Optional[str] = None,
+                       base_name: str = "address_book") -> str:
+    """
+    Private helper function to choose the name of an exported file.
+
+    Args:
+        directory_path (str): The directory to save the file to.
+        output_format (str): The output format.
+        compression (str): The compression of the file, whose extension is added to the name (optional).
+        base_name (str): The name of the file without its extension (default: "address_book").
+
+    Returns:
+        str: "{base_name}.{output_format}" in the directory, with a digit added if that file already exists.
+    """
+    extension = output_format + (COMPRESSIONS[compression] if compression is not None else "")
+
+    # Use the default file name, "{base_name}.{extension}"
+    # unless a file with that name already exists
+    file_name = f"{directory_path}/{base_name}.{extension}"
+    index = 1
+
+    # If the file already exists, add a digit to differentiate it
+    while os.path.exists(file_name):
+        file_name = f"{directory_path}/{base_name}_{index}.{extension}"
+        index += 1
+
+    return file_name
+
+
+def _open_export_file(serializer: BaseSerializer, file_name: str, compression: Optional[str] = None,
+                      level: Optional[int] = None) -> Tuple[IO, Optional[CompressionStats]]:
+    """
+    Private helper function to create an exported file, in binary mode for binary formats.
+
+    Args:
+        serializer (BaseSerializer): The serializer of the output format.
+        file_name (str): The file to write.
+        compression (str): The compression of the file, applied in a background thread (optional).
+        level (int): The compression level (default: the default level of the compression).
+
+    Returns:
+        Tuple[IO, Optional[CompressionStats]]: The writable file, and its compression statistics, which are
+                                               complete once it is closed, or None if it is not compressed.
+    """
+    mode = "wb" if serializer.binary else "w"
+    if compression is None:
+        return open(file_name, mode), None
+
+    f = open_compressed(file_name, mode, compression, level)
+    return f, (f if serializer.binary else f.buffer).stats
+
+
+def _write_serialized_file(serializer: BaseSerializer, records: Iterable, file_name: str,
+                           compression: Optional[str] = None, level: Optional[int] = None
+                           ) -> Optional[CompressionStats]:
+    """
+    Private helper function to serialize records to a file chunk by chunk, removing the file if it fails.
+
+    Args:
+        serializer (BaseSerializer): The serializer.
+        records (Iterable): The records to serialize, in any form accepted by the serializer.
+        file_name (str): The file to write.
+        compression (str): The compression of the file (optional).
+        level (int): The compression level (default: the default level of the compression).
+
+    Returns:
+        Optional[CompressionStats]: The compression statistics, or None if the file is not compressed.
+    """
+    f, stats = _open_export_file(serializer, file_name, compression, level)
+
+    # Closing a compressed file finishes the compression, which may fail as well
+    try:
+        with f:
+            serializer.write_to(f, records)
+    except BaseException:
+        os.remove(file_name)
+        raise
+    return stats
+
+
+def _export_worker(serializer: BaseSerializer, records: RecordBatch, file_name: str,
+                   compression: Optional[str] = None, level: Optional[int] = None
+                   ) -> Tuple[float, Optional[CompressionStats]]:
+    """
+    Private helper function run in a worker process to save records in one format.
+
+    Args:
+        serializer (BaseSerializer): The serializer of the output format.
+        records (RecordBatch): The records to serialize.
+        file_name (str): The file to write.
+        compression (str): The compression of the file (optional).
+        level (int): The compression level (default: the default level of the compression).
+
+    Returns:
+        Tuple[float, Optional[CompressionStats]]: The wall time of the serialization in seconds, and the
+                                                  compression statistics or None if the file is not compressed.
+    """
+    start = time.perf_counter()
+    stats = _write_serialized_file(serializer, records, file_name, compression, level)
+    return time.perf_counter() - start, stats
+
+
+def _export_partition_worker(db_path: str, serializer: BaseSerializer, lower_rowid: int, upper_rowid: int,
+                             part_file: str) -> bool:
+    """
+    Private helper function run in a worker process to serialize a rowid range of the dataset to a fragment.
+
+    Args:
+        db_path (str): The path of the database.
+        serializer (BaseSerializer): The serializer of the output format.
+        lower_rowid (int): The exclusive lower bound of the range.
+        upper_rowid (int): The inclusive upper bound of the range.
+        part_file (str): The fragment file to write.
+
+    Returns:
+        bool: True if the range holds at least one record.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.execute(f"{_SELECT_RECORDS} WHERE rowid > ? AND rowid <= ? ORDER BY rowid",
+                              (lower_rowid, upper_rowid))
+        batches = map(RecordBatch.from_rows, iter(lambda: cursor.fetchmany(1000), []))
+        # Keep the line endings of the serializer, such as the \r\n of CSV, so the fragments are stitched as written
+        with open(part_file, "wb") if serializer.binary else open(part_file, "w", newline="") as f:
+            return serializer.write_fragment(f, batches)
+    finally:
+        conn.close()
+
+
+class BulkInsertReport:
+    """
+    A class to represent the outcome of a bulk insert.
+
+    Attributes:
+        inserted (int): The number of records committed to the dataset.
+        failed_batches (List[Tuple[int, int, str]]): The batch number, batch size and error message of every
+                                                      batch that was rolled back.
+        invalid_batches (List[Tuple[int, int, str]]): The batch number, number of invalid records and first
+                                                       validation error of every batch with records that failed
+                                                       validation and were skipped.
+        error (str): The error that stopped reading the records before the end, such as a malformed document,
+                     or None if every record was read.
+        elapsed (float): The wall time of the insert in seconds.
+    """
+
+    def __init__(self) -> None:
+        self.inserted = 0
+        self.failed_batches: List[Tuple[int, int, str]] = []
+        self.invalid_batches: List[Tuple[int, int, str]] = []
+        self.error: Optional[str] = None
+        self.elapsed = 0.0
+
+    @property
+    def invalid(self) -> int:
+        """int: The number of records that failed validation."""
+        return sum(count for _, count, _ in self.invalid_batches)
+
+    @property
+    def failed(self) -> int:
+        """int: The number of records in batches that were rolled back, or that failed validation."""
+        return sum(size for _, size, _ in self.failed_batches) + self.invalid
+
+    @property
+    def rows_per_second(self) -> float:
+        """float: The insert throughput of the committed records."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.inserted / self.elapsed
 
 
 class PersonalDataAPI:
     """The API class for managing personal data records."""
 
-    def __init__(self) -> None:
+    def __init__(self, auto_migrate: bool = True, db_path: str = DEFAULT_DB_PATH,
+                 pool: Optional[ConnectionPool] = None, query_cache_size: int = 128,
+                 query_cache_ttl: Optional[float] = 300.0, export_cache_dir: Optional[str] = None,
+                 export_cache_size: int = 256 * 2 ** 20, **pool_options) -> None:
+        """
+        Initializes the API, checking out a database connection and upgrading its schema.
+
+        API objects created across threads should share one ConnectionPool. Close the API, or use it as a
+        context manager, to return its connection to the pool.
+
+        Args:
+            auto_migrate (bool): If True (default), apply the pending schema migrations. Set it to False to
+                                 run the migrations explicitly, e.g. with a custom batch size.
+            db_path (str): The path of the database file (default: "data/address_book.db"). Ignored if a
+                           pool is given.
+            pool (ConnectionPool): A connection pool shared with other API objects (optional). If not
+                                   provided, the API creates its own pool and closes it with the API.
+            query_cache_size (int): The maximum number of filter_records() results cached (default: 128).
+                                    Set it to 0 to disable the cache.
+            query_cache_ttl (float): The number of seconds a cached result stays valid, or None for no limit
+                                     (default: 300).
+            export_cache_dir (str): The directory caching the files exported by convert_dataset() (optional).
+                                    Exports are only cached if it is given.
+            export_cache_size (int): The maximum total size of the cached exports, in bytes (default: 256 MiB).
+                                     Set it to 0 to disable the export cache.
+            **pool_options: The settings of the created pool, such as synchronous, cache_size, mmap_size
+                            and busy_timeout. See ConnectionPool.
+
+        Raises:
+            sqlite3.OperationalError: If the database cannot be opened.
+        """
         self.serializer_factory = None
         self.connection = None
 
         # instantiate the SerializerFactory class
         self.serializer_factory = SerializerFactory()
 
-        # Initialize a connection to the SQLite database
-        self.conn = sqlite3.connect("data/address_book.db")
+        # Check out a connection to the SQLite database
+        self._owns_pool = pool is None
+        self.pool = ConnectionPool(db_path, **pool_options) if pool is None else pool
+        self.db_path = self.pool.db_path
+        try:
+            self.conn = self.pool.acquire()
+        except sqlite3.OperationalError:
+            print(
+                f"Error: Database not found at '{os.path.abspath(self.db_path)}'. "
+                "Make sure that your current working directory contains a data/address_book.db folder/file "
+                "structure, or give the path of an existing database directory."
+            )
+            raise
         self.cursor = self.conn.cursor()
 
-        # Check if the "personal_data" table already exists
-        self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='personal_data'")
-        result = self.cursor.fetchone()
+        # Skip the schema checks on a warm database, whose schema is unchanged since they last completed
+        self.migrator = Migrator(self.conn)
+        self.indexes = IndexRegistry(self.conn, install=False)
+        if not self._schema_is_checked():
+            # Create the "personal_data" table or upgrade its schema to the latest version
+            if auto_migrate:
+                applied = self.migrate()
+                if any(migration.version == 2 for migration in applied) and self.migrator.rejected_rows():
+                    print(f"Warning: {self.migrator.rejected_rows()} records with an empty field or a duplicate phone "
+                          "number were moved to the personal_data_rejected table by the schema upgrade.")
 
-        if result is None:
-            # Create the "personal_data" table if it does not already exist
-            self.cursor.execute(
-                """
-                CREATE TABLE personal_data (
-                    name TEXT,
-                    address TEXT,
-                    phone_number TEXT
-                )
-                """
-            )
+            # The indexes are created on the latest schema, so they wait for the pending migrations
+            elif not self.migrator.pending():
+                self._ensure_indexes()
 
-    def __del__(self) -> None:
-        try:
-            # Close the database connection when the object is destroyed
-            self.conn.close()
-        except AttributeError:
-            print(
-                "Error: Database not found."
-                "Please check that the current working directory is the 'personal_data_manager' package, "
-                "as the database is located in 'personal_data_manager/data/address_book.db'."
-                "Or make sure that your current working directory contains a data/address_book.db folder/file structure"
-            )
+        # The optional full-text index, created by enable_full_text_search()
+        self.full_text_index = FullTextIndex(self.conn)
+
+        # The keyset paginator of get_records() and filter_page()
+        self.paginator = KeysetPaginator(self.conn)
+
+        # The cache of filter_records() results, invalidated whenever the data changes
+        self.query_cache = QueryCache(query_cache_size, query_cache_ttl)
+
+        # The optional cache of exported files, addressed by the version of the dataset they were serialized from
+        self.dataset_version = DatasetVersion(self.conn)
+        self.export_cache = None
+        if export_cache_dir is not None and export_cache_size > 0:
+            self.export_cache = ExportCache(export_cache_dir, export_cache_size)
+
+        # The log of the updated and deleted records, read by delta exports
+        self.change_log = ChangeLog(self.conn)
+
+    def migrate(self, batch_size: int = 10000, progress: ProgressCallback = None) -> List[Migration]:
+        """
+        Apply the pending schema migrations, then create the registered indexes that do not exist yet.
 
-    def add_record(self, record: PersonalData) -> None:
+        Args:
+            batch_size (int): The number of rows copied per transaction by migrations that rebuild a table
+                              (default: 10000).
+            progress (Callable[[int, int], None]): A callback receiving the number of rows copied so far and the
+                                                   number of rows rejected by the new constraints (optional).
+
+        Returns:
+            List[Migration]: The migrations that were applied.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        applied = self.migrator.upgrade(batch_size=batch_size, progress=progress)
+        self._ensure_indexes()
+        return applied
+
+    def close(self) -> None:
+        """
+        Return the database connection to the pool, closing the pool if it was created by the API.
+        """
+        if self.conn is None:
+            return
+
+        self.cursor.close()
+        self.pool.release(self.conn)
+        self.conn = None
+        self.cursor = None
+        if self._owns_pool:
+            self.pool.close()
+
+    def __enter__(self) -> "PersonalDataAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def add_record(self, record: PersonalData) -> bool:
         """
-        Add a new record to the dataset.
+        Add a new record to the dataset. If the record cannot be inserted, e.g. because another record has the
+        same phone number, the error is printed and the dataset is left unchanged.
 
         Args:
             record (PersonalData): The record to add to the dataset.
 
+        Returns:
+            bool: True if the record was added, False otherwise.
+
         Raises:
             ValueError: If the record is not an instance of PersonalData.
-            Exception: If there is an error executing the SQL query.
         """
         if not isinstance(record, PersonalData):
             raise ValueError("Record must be an instance of PersonalData.")
@@ -72,7 +372,142 @@ class PersonalDataAPI:
             )
             self.conn.commit()
         except Exception as e:
+            self.conn.rollback()
             print(f"Error adding record: {str(e)}")
+            return False
+        finally:
+            self.query_cache.invalidate()
+        return True
+
+    def add_records(self, records: Iterable[PersonalData], batch_size: int = 1000) -> BulkInsertReport:
+        """
+        Add many records to the dataset using batched transactions.
+
+        Each batch is inserted with a single executemany inside its own transaction, so a failing batch is
+        rolled back and reported without affecting the batches committed before or after it. Items that are
+        not PersonalData objects, such as the InvalidRecord objects yielded by a serializer with keep_invalid
+        set, are skipped and counted in the report of their batch. If the iterable raises a ValueError or a
+        TypeError, e.g. for a malformed document, the records read before it are still inserted and the error
+        is recorded in the report.
+
+        Args:
+            records (Iterable[PersonalData]): The records to add. Any iterable is consumed lazily.
+            batch_size (int): The number of records inserted per transaction (default: 1000).
+
+        Returns:
+            BulkInsertReport: The number of inserted records, the failed batches, the invalid records, the
+                              error that stopped the reading if any, and the insert throughput.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+
+        report = BulkInsertReport()
+        start = time.perf_counter()
+        iterator = iter(records)
+        batch_number = 0
+
+        while report.error is None:
+            # Pull the next batch from the iterable, keeping the records read before an error
+            batch = []
+            try:
+                for record in islice(iterator, batch_size):
+                    batch.append(record)
+            except (ValueError, TypeError) as e:
+                report.error = str(e)
+            if not batch:
+                break
+            batch_number += 1
+
+            # Skip the records that failed validation, counting them in the report of the batch
+            rows = []
+            errors = []
+            for record in batch:
+                if isinstance(record, PersonalData):
+                    rows.append((record.name, record.address, record.phone_number))
+                elif isinstance(record, InvalidRecord):
+                    errors.append(record.error)
+                else:
+                    errors.append("Record must be an instance of PersonalData.")
+            if errors:
+                report.invalid_batches.append((batch_number, len(errors), errors[0]))
+            if not rows:
+                continue
+
+            # Insert the whole batch in one transaction, rolling it back if any row fails
+            try:
+                with self.conn:
+                    self.cursor.executemany(
+                        "INSERT INTO personal_data (name, address, phone_number) VALUES (?, ?, ?)",
+                        rows,
+                    )
+                report.inserted += len(rows)
+            except sqlite3.Error as e:
+                report.failed_batches.append((batch_number, len(rows), str(e)))
+
+        report.elapsed = time.perf_counter() - start
+        self.query_cache.invalidate()
+        return report
+
+    def find_by_phone_number(self, phone_number: str) -> Optional[PersonalData]:
+        """
+        Find the record with the given phone number using the unique index on normalized phone numbers.
+
+        Args:
+            phone_number (str): The phone number, in any punctuation (e.g., "555-908-1234" or "5559081234").
+
+        Returns:
+            Optional[PersonalData]: The record, or None if no record has this phone number.
+        """
+        self.cursor.execute(
+            "SELECT name, address, phone_number FROM personal_data WHERE phone_digits = ?",
+            (_phone_digits(phone_number),),
+        )
+        row = self.cursor.fetchone()
+        return None if row is None else PersonalData.from_row(row)
+
+    def update_record(self, phone_number: str, record: PersonalData) -> bool:
+        """
+        Replace the record with the given phone number.
+
+        Args:
+            phone_number (str): The current phone number of the record.
+            record (PersonalData): The new values of the record.
+
+        Returns:
+            bool: True if a record was updated, False if no record has this phone number.
+
+        Raises:
+            ValueError: If the record is not an instance of PersonalData.
+            sqlite3.IntegrityError: If the new phone number belongs to another record.
+        """
+        if not isinstance(record, PersonalData):
+            raise ValueError("Record must be an instance of PersonalData.")
+
+        with self.conn:
+            self.cursor.execute(
+                "UPDATE personal_data SET name = ?, address = ?, phone_number = ? WHERE phone_digits = ?",
+                (record.name, record.address, record.phone_number, _phone_digits(phone_number)),
+            )
+        self.query_cache.invalidate()
+        return self.cursor.rowcount > 0
+
+    def delete_record(self, phone_number: str) -> bool:
+        """
+        Delete the record with the given phone number.
+
+        Args:
+            phone_number (str): The phone number of the record.
+
+        Returns:
+            bool: True if a record was deleted, False if no record has this phone number.
+        """
+        with self.conn:
+            self.cursor.execute("DELETE FROM personal_data WHERE phone_digits = ?", (_phone_digits(phone_number),))
+        self.query_cache.invalidate()
+        return self.cursor.rowcount > 0
 
     def get_all_records(self) -> List[PersonalData]:
         """
@@ -81,22 +516,69 @@ class PersonalDataAPI:
         Returns:
             List[PersonalData]: A list of all records in the dataset.
         """
-        # Retrieve all records from the "personal_data" table
-        query = "SELECT * FROM personal_data"
-        self.cursor.execute(query)
-        records = []
-        for row in self.cursor.fetchall():
-            record = PersonalData(*row)
-            records.append(record)
+        return list(self.iter_records())
+
+    def iter_records(self, field: Optional[str] = None, pattern: str = "", use_glob: bool = False,
+                     arraysize: int = 1000) -> Iterator[PersonalData]:
+        """
+        Lazily iterate over the records of the dataset, or over the records matching a filter.
+
+        Rows are fetched from a dedicated cursor arraysize rows at a time as the iterator is consumed, so the
+        first record is available as soon as SQLite returns it and memory usage does not grow with the size
+        of the table. Close the iterator, or consume it entirely, to release the cursor.
+
+        Args:
+            field (str): The field to filter records by, or None to iterate over all records (optional).
+            pattern (str): The pattern to match in the field, see filter_records() (default "").
+            use_glob (bool): If True, use glob pattern matching. If False (default), use SQL LIKE.
+            arraysize (int): The number of rows fetched from the database at once (default: 1000).
+
+        Returns:
+            Iterator[PersonalData]: The records, standardized as by filter_records() if a field is given.
+
+        Raises:
+            ValueError: If the field is not valid or the array size is not positive.
+        """
+        if arraysize < 1:
+            raise ValueError("Array size must be a positive integer.")
+
+        # Build the query before the first record is requested so that invalid filters fail immediately
+        if field is None:
+            return (PersonalData.from_row(row)
+                    for row in chain.from_iterable(self._iter_row_chunks(_SELECT_RECORDS, (), arraysize)))
+
+        query, parameters = self._build_filter_query(field, pattern, use_glob)
+        return (PersonalData.from_row(self._standardize_row(row))
+                for row in chain.from_iterable(self._iter_row_chunks(query, parameters, arraysize)))
+
+    def get_records(self, after: Optional[str] = None, limit: int = 100, order_by: str = "id",
+                    offset: int = 0) -> Page:
+        """
+        Get a page of records from the dataset, using keyset pagination.
+
+        Args:
+            after (str): The continuation token of the previous page, or None for the first page (optional).
+            limit (int): The maximum number of records of the page (default: 100).
+            order_by (str): The sort key: id (insertion order), name, address or phone_number (default: "id").
+            offset (int): The number of records to skip before the page (default: 0). Prefer continuation
+                          tokens for deep pages, as skipped records are still read.
 
-        return records
+        Returns:
+            Page: The records of the page and the continuation token of the next page, None on the last page.
+
+        Raises:
+            ValueError: If the sort key, the limit, the offset or the token is invalid.
+        """
+        rows, next_token = self.paginator.fetch_page(_RECORD_COLUMNS, order_by, after, limit, offset)
+        return Page([PersonalData.from_row(row) for row in rows], next_token)
 
     def display_records(self, output_format: str = "text", records=None) -> None:
         """
         Display records in the specified output format.
 
         Args:
-            records: An optional list of records to display. If not provided, all records in the database will be displayed.
+            records: An optional list or iterable of records, or RecordBatch, to display. If not provided, all
+                     records in the database are streamed to the output.
             output_format (str): The output format (default: "text").
 
         Raises:
@@ -105,134 +587,709 @@ class PersonalDataAPI:
         Raises:
             ValueError: If no records are found in the database.
         """
-        # Retrieve all records from the "personal_data" table if records is not provided
+        # Stream all records from the "personal_data" table in columnar batches if records is not provided
         if records is None:
-            records = self.get_all_records()
-            if not records:
+            batches = self._stream_batches(_SELECT_RECORDS)
+            first_batch = next(batches, None)
+            if first_batch is None:
                 raise ValueError("No records found in the database.")
+            records = chain([first_batch], batches)
 
         # Create a formatter instance based on the specified output format
         try:
             formatter = DisplayFormatterFactory.create_formatter(output_format, records)
-        except ValueError:
-            print(f"Error: {output_format} is not a supported output format.")
+        except ValueError as e:
+            print(f"Error: {e}")
             return
 
-        # Use the formatter to format the records and print the output
-        formatted_output = formatter.display_format(records)
-        print(formatted_output)
+        # Use the formatter to write the formatted records straight to the standard output
+        formatter.write_to(sys.stdout, records)
+        print()
 
-    def convert_dataset(self, output_format: str, file_path: str, preview: bool = False) -> None:
+    def convert_dataset(self, output_format: Union[str, Sequence[str]], file_path: Optional[str] = None,
+                        preview: bool = False, workers: int = 1,
+                        format_options: Optional[Dict[str, dict]] = None, use_cache: bool = True,
+                        compression: Optional[str] = None, compression_level: Optional[int] = None,
+                        since: Optional[str] = None) -> None:
         """
-        Convert the dataset to the specified format and optionally save to a file.
+        Convert the dataset to the specified format(s) and optionally save to a file.
+
+        For a single format, records are streamed from the database in chunks and serialized straight to the
+        output, so memory usage does not grow with the size of the dataset. With several workers, the table
+        is partitioned by rowid ranges that are serialized concurrently and stitched into a single document.
+        For several formats, the table is read once and each format is serialized concurrently in its own
+        worker process. If the API has an export cache, saved files are cached by format and dataset version,
+        and exporting the unchanged dataset again in the same format copies the cached file instead.
+
+        Saved files can be compressed with gzip, bz2, xz or, if the zstandard package is installed, zstd. The
+        compression runs in a background thread while the next records are serialized, and its ratio and
+        throughput are reported.
+
+        With a checkpoint, only the records inserted or updated since the checkpoint was taken are exported,
+        to "address_book_delta.{format}" files, and the new checkpoint is printed and saved next to each file
+        with the phone numbers of the deleted records. See _export_changes().
 
         Args:
-            output_format (str): The output format.
-            file_path (str): The file to save the serialized data to (optional).
+            output_format (Union[str, Sequence[str]]): The output format, or a list of output formats.
+            file_path (str): The file whose directory the serialized data is saved to (optional).
             preview (bool): Whether to preview the output without saving to a file (optional).
+            workers (int): The number of worker processes serializing a single format (default: 1).
+            format_options (Dict[str, dict]): Serializer constructor options by format, such as
+                                              {"xml": {"pretty": False}} for compact XML (optional).
+            use_cache (bool): Whether to serve and store the saved files in the export cache of the API, if it
+                              has one (default: True).
+            compression (str): The compression of the saved files: gzip, bz2, xz or zstd (default: inferred
+                               from the extension of file_path, such as .gz, or no compression).
+            compression_level (int): The compression level (default: the default level of the compression).
+            since (str): The checkpoint of a previous delta export, or "0" to export every record along with
+                         the first checkpoint (optional).
 
         Raises:
-            ValueError: If the output format is not supported.
+            ValueError: If no records are found to serialize, the plugin of a format cannot be loaded, or the
+                        checkpoint is not valid for this dataset.
         """
-        # Retrieve records from the "personal_data" table
-        self.cursor.execute("SELECT * FROM personal_data")
-        rows = self.cursor.fetchall()
+        output_formats = [output_format] if isinstance(output_format, str) else list(output_format)
 
-        # Create a list of PersonalData objects from the retrieved rows
-        records = []
-        for row in rows:
-            personal_data = PersonalData(*row)
-            records.append(personal_data)
+        # Check the compression before anything is written
+        if compression is None and file_path is not None and not preview:
+            compression = compression_from_extension(file_path)
+        if compression is not None:
+            try:
+                compression_level = check_compression(compression, compression_level)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return
 
-        # Create a serializer instance based on the specified output format
-        serializer = self.serializer_factory.get_serializer_instance(output_format)
-        if serializer is None:
-            print(f"Error: {output_format} is not a supported serialization format.")
-            return
+        # Create a serializer instance for each of the specified output formats
+        format_options = format_options or {}
+        serializers = {}
+        for fmt in output_formats:
+            serializer = self.serializer_factory.get_serializer_instance(fmt, **format_options.get(fmt, {}))
+            if serializer is None:
+                print(f"Error: {fmt} is not a supported serialization format.")
+                return
+            serializers[fmt] = serializer
+
+        # Select the records changed since the checkpoint, if any
+        query, parameters = _SELECT_RECORDS, ()
+        if since is not None:
+            query, parameters = self._changed_rows_query(since)
 
-        # Use the serializer to serialize the records and print or save the output
-        serialized_data = serializer.serialize(records)
+        # Use the serializers to write the records to the standard output
         if preview:
-            print(serialized_data)
-        else:
-            abs_file_path = os.path.abspath(file_path)
-            directory_path = os.path.dirname(abs_file_path)
-            if not os.path.isdir(directory_path):
-                print(f"Error: the directory '{directory_path}' does not exist.")
+            for fmt, serializer in serializers.items():
+                if serializer.binary:
+                    print(f"Error: {fmt} is a binary format and cannot be previewed.")
+                    continue
+                if len(serializers) > 1:
+                    print(f"{fmt}:")
+                serializer.write_to(sys.stdout, self._stream_batches(query, parameters))
+                print()
+            return
+
+        if file_path is None:
+            print("Error: a file path is required unless the output is previewed.")
+            return
+
+        abs_file_path = os.path.abspath(file_path)
+        directory_path = os.path.dirname(abs_file_path)
+        if not os.path.isdir(directory_path):
+            print(f"Error: the directory '{directory_path}' does not exist.")
+            return
+
+        if since is not None:
+            self._export_changes(serializers, directory_path, since, compression, compression_level)
+            return
+
+        # Copy the formats already exported from the current version of the dataset from the cache
+        dataset_version = self._current_dataset_version() if use_cache and self.export_cache is not None else None
+        cache_keys = {}
+        if dataset_version is not None:
+            for fmt, serializer in list(serializers.items()):
+                # Compressed files are cached apart from uncompressed ones and those of other levels
+                cache_format = fmt if compression is None else f"{fmt}{COMPRESSIONS[compression]}:{compression_level}"
+                cache_keys[fmt] = self.export_cache.key(cache_format, serializer, dataset_version)
+                file_name = _reserve_file_name(directory_path, fmt, compression)
+                try:
+                    if not self.export_cache.fetch(cache_keys[fmt], file_name):
+                        continue
+                    print(f"Serialized data saved to {file_name} (cached).")
+                except OSError as e:
+                    print(f"Error saving serialized data to {file_name}: {e}")
+                del serializers[fmt]
+            if not serializers:
                 return
 
+        if len(serializers) > 1:
+            file_names = self._export_parallel(serializers, directory_path, compression, compression_level)
+        else:
+            fmt, serializer = next(iter(serializers.items()))
+
             # Attempt to save the file to the specified directory
             try:
-                # Use the default file name, "address_book.{output_format}"
-                # unless a file with that name already exists
-                file_name = f"{directory_path}/address_book.{output_format}"
-                index = 1
-
-                # If the file already exists, add a digit to differentiate it
-                while os.path.exists(file_name):
-                    file_name = f"{directory_path}/address_book_{index}.{output_format}"
-                    index += 1
-
-                # Write the serialized data to the file
-                with open(file_name, "w") as f:
-                    f.write(serialized_data)
+                file_name = _reserve_file_name(directory_path, fmt, compression)
+
+                if workers > 1:
+                    # Serialize partitions of the "personal_data" table in parallel and stitch them in the file
+                    stats = self._export_partitioned(serializer, file_name, workers, compression, compression_level)
+                else:
+                    # Stream record batches from the "personal_data" table to the file
+                    stats = _write_serialized_file(serializer, self._stream_batches(_SELECT_RECORDS), file_name,
+                                                   compression, compression_level)
                 print(f"Serialized data saved to {os.path.abspath(file_name)}.")
+                if stats is not None:
+                    print(f"Compressed with {stats}.")
+                file_names = {fmt: file_name}
 
             # Handle exceptions that may occur when saving the file
             except PermissionError as e:
                 print(f"Error saving serialized data to {abs_file_path}: {e}")
                 print("Make sure you have administrator privileges or the folder has write permissions.")
+                return
             except OSError as e:
                 print(f"Error saving serialized data to {abs_file_path}: {e}")
+                return
+
+        # Cache the new files, unless the dataset changed while they were serialized
+        if dataset_version is not None and self._current_dataset_version() == dataset_version:
+            for fmt, file_name in file_names.items():
+                try:
+                    self.export_cache.store(cache_keys[fmt], file_name)
+                except OSError as e:
+                    print(f"Warning: the export of {file_name} could not be cached: {e}")
 
-    def filter_records(self, field: str, pattern: str = "", use_glob: bool = False) -> List[PersonalData]:
+    def _changed_rows_query(self, since: str) -> Tuple[str, tuple]:
+        """
+        Private helper method to build the query returning the records changed since a checkpoint.
+
+        Args:
+            since (str): The checkpoint of the previous delta export.
+
+        Returns:
+            Tuple[str, tuple]: The query and its parameters.
+
+        Raises:
+            ValueError: If the checkpoint is not valid for this dataset, or the database does not log its changes.
+        """
+        try:
+            return self.change_log.changed_rows_query(since)
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"The database does not log its changes, apply its migrations first: {e}") from e
+
+    def _export_changes(self, serializers: Dict[str, BaseSerializer], directory_path: str, since: str,
+                        compression: Optional[str] = None, level: Optional[int] = None) -> None:
+        """
+        Private helper method to save the records changed since a checkpoint, in one or more formats.
+
+        The changed records, the deleted phone numbers and the new checkpoint are read from a single snapshot
+        of the database, so the next delta starts exactly where this one ends. Each format is saved to an
+        "address_book_delta.{format}" file, next to a "{file}.checkpoint.json" file holding the previous and
+        new checkpoints, the number of records saved and the deleted phone numbers. Updated records are
+        exported whole, so consumers replace the records with the same phone number and remove the deleted
+        ones.
+
+        Args:
+            serializers (Dict[str, BaseSerializer]): The serializers by output format.
+            directory_path (str): The existing directory to save the files to.
+            since (str): The checkpoint of the previous delta export.
+            compression (str): The compression of the files (optional).
+            level (int): The compression level (default: the default level of the compression).
+
+        Raises:
+            ValueError: If the checkpoint is not valid for this dataset.
+        """
+        # Read everything within a savepoint, which keeps the snapshot until every file is written, and which
+        # nests in the transaction left open by the caller, if any
+        self.conn.execute("SAVEPOINT export_changes")
+        try:
+            query, parameters = self._changed_rows_query(since)
+            deleted = self.change_log.deleted_phone_numbers(since)
+            checkpoint = self.change_log.checkpoint()
+            count = self.conn.execute(f"SELECT count(*) FROM ({query})", parameters).fetchone()[0]
+
+            saved = False
+            for fmt, serializer in serializers.items():
+                file_name = _reserve_file_name(directory_path, fmt, compression, base_name="address_book_delta")
+                try:
+                    if count:
+                        stats = _write_serialized_file(serializer, self._stream_batches(query, parameters),
+                                                       file_name, compression, level)
+                    else:
+                        # Serializers refuse to write no records, so write an empty document
+                        f, stats = _open_export_file(serializer, file_name, compression, level)
+                        with f:
+                            f.write(serializer.serialize_header())
+                            f.write(serializer.serialize_footer())
+                    with open(f"{file_name}.checkpoint.json", "w") as f:
+                        json.dump({"since": since, "checkpoint": checkpoint, "records": count, "deleted": deleted},
+                                  f, indent=2)
+                except OSError as e:
+                    print(f"Error saving serialized data to {file_name}: {e}")
+                    continue
+                print(f"Serialized {count} changed records to {file_name}, and {len(deleted)} deleted phone "
+                      f"numbers to {file_name}.checkpoint.json.")
+                if stats is not None:
+                    print(f"Compressed with {stats}.")
+                saved = True
+        finally:
+            self.conn.execute("ROLLBACK TO export_changes")
+            self.conn.execute("RELEASE export_changes")
+
+        # The next delta export starts from the new checkpoint
+        if saved:
+            print(f"Checkpoint: {checkpoint}")
+
+    def _export_partitioned(self, serializer: BaseSerializer, file_name: str, workers: int,
+                            compression: Optional[str] = None, level: Optional[int] = None
+                            ) -> Optional[CompressionStats]:
+        """
+        Private helper method to save the dataset in one format using several worker processes.
+
+        The table is split into as many rowid ranges as workers, holding the same number of rows. Each worker
+        reads its range through its own database connection and serializes it to a fragment file next to
+        the output file. The fragments are then stitched in rowid order between the document header and footer.
+
+        Args:
+            serializer (BaseSerializer): The serializer of the output format.
+            file_name (str): The file to write.
+            workers (int): The number of worker processes.
+            compression (str): The compression of the file, applied while the fragments are stitched (optional).
+            level (int): The compression level (default: the default level of the compression).
+
+        Returns:
+            Optional[CompressionStats]: The compression statistics, or None if the file is not compressed.
+
+        Raises:
+            ValueError: If no records are found to serialize.
+        """
+        count = self.conn.execute("SELECT count(*) FROM personal_data").fetchone()[0]
+        if count == 0:
+            raise ValueError("No records found to serialize")
+
+        # Split the rowids into ranges of equal row counts, each bounded by (lower, upper]
+        workers = min(workers, count)
+        bounds = [self.conn.execute("SELECT min(rowid) - 1 FROM personal_data").fetchone()[0]]
+        for index in range(1, workers):
+            bounds.append(self.conn.execute(
+                "SELECT rowid FROM personal_data ORDER BY rowid LIMIT 1 OFFSET ?", (index * count // workers - 1,)
+            ).fetchone()[0])
+        bounds.append(self.conn.execute("SELECT max(rowid) FROM personal_data").fetchone()[0])
+
+        db_path = os.path.abspath(self.db_path)
+        part_files = [f"{file_name}.part{index}" for index in range(workers)]
+        try:
+            # Serialize each range to its own fragment file
+            # Import the process pool on first use, as multiprocessing is slow to import
+            from concurrent.futures import ProcessPoolExecutor
+            from shutil import copyfileobj
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                written = list(executor.map(
+                    _export_partition_worker,
+                    [db_path] * workers, [serializer] * workers, bounds[:-1], bounds[1:], part_files,
+                ))
+
+            # Stitch the non-empty fragments into a single document
+            f, stats = _open_export_file(serializer, file_name, compression, level)
+            try:
+                with f:
+                    f.write(serializer.serialize_header())
+                    first = True
+                    for part_file, has_records in zip(part_files, written):
+                        if not has_records:
+                            continue
+                        if not first:
+                            f.write(serializer.record_separator)
+                        with open(part_file, "rb") if serializer.binary else open(part_file, "r", newline="") as part:
+                            copyfileobj(part, f)
+                        first = False
+                    f.write(serializer.serialize_footer())
+            except BaseException:
+                os.remove(file_name)
+                raise
+        finally:
+            for part_file in part_files:
+                if os.path.exists(part_file):
+                    os.remove(part_file)
+
+        return stats
+
+    def _export_parallel(self, serializers: Dict[str, BaseSerializer], directory_path: str,
+                         compression: Optional[str] = None, level: Optional[int] = None) -> Dict[str, str]:
+        """
+        Private helper method to save the dataset in several formats at once.
+
+        The table is read once into a RecordBatch, then a process pool with one worker per format serializes
+        and writes every file concurrently. The wall time of each format is reported as it completes.
+
+        Args:
+            serializers (Dict[str, BaseSerializer]): The serializers by output format.
+            directory_path (str): The existing directory to save the files to.
+            compression (str): The compression of the files (optional).
+            level (int): The compression level (default: the default level of the compression).
+
+        Returns:
+            Dict[str, str]: The saved files by output format.
+
+        Raises:
+            ValueError: If no records are found to serialize.
+        """
+        # Read the table once
+        records = RecordBatch.concat(self._stream_batches(_SELECT_RECORDS))
+        if not records:
+            raise ValueError("No records found to serialize")
+
+        # Reserve a distinct file name per format before the workers start writing
+        file_names = {fmt: _reserve_file_name(directory_path, fmt, compression) for fmt in serializers}
+
+        # Import the process pool on first use, as multiprocessing is slow to import
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        saved_files = {}
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=len(file_names)) as executor:
+            futures = {
+                executor.submit(_export_worker, serializers[fmt], records, file_name, compression, level): fmt
+                for fmt, file_name in file_names.items()
+            }
+            for future in as_completed(futures):
+                fmt = futures[future]
+                try:
+                    elapsed, stats = future.result()
+                except OSError as e:
+                    print(f"Error saving serialized data to {file_names[fmt]}: {e}")
+                    continue
+                print(f"Serialized data saved to {file_names[fmt]} ({fmt}: {elapsed:.2f}s).")
+                if stats is not None:
+                    print(f"Compressed {file_names[fmt]} with {stats}.")
+                saved_files[fmt] = file_names[fmt]
+
+        print(f"Exported {len(records)} records to {len(file_names)} formats in {time.perf_counter() - start:.2f}s.")
+        return saved_files
+
+    def _stream_batches(self, query: str, parameters: tuple = (), chunk_size: int = 1000) -> Iterator[RecordBatch]:
+        """
+        Private helper method to lazily read records from the database as columnar batches.
+
+        No object is created per row: each chunk of rows fetched from a dedicated cursor is transposed into
+        a RecordBatch, so at most one chunk of rows is held in memory and the shared cursor remains free.
+
+        Args:
+            query (str): A SELECT query returning the name, address and phone_number columns.
+            parameters (tuple): The query parameters (optional).
+            chunk_size (int): The number of rows fetched per batch (default: 1000).
+
+        Yields:
+            RecordBatch: The records returned by the query, in batches of at most chunk_size records.
+        """
+        for rows in self._iter_row_chunks(query, parameters, chunk_size):
+            yield RecordBatch.from_rows(rows)
+
+    def _iter_row_chunks(self, query: str, parameters: tuple = (), arraysize: int = 1000) -> Iterator[List[tuple]]:
+        """
+        Private helper method to lazily fetch the rows of a query in chunks, from a dedicated cursor.
+
+        Args:
+            query (str): A SELECT query.
+            parameters (tuple): The query parameters (optional).
+            arraysize (int): The number of rows fetched per chunk (default: 1000).
+
+        Yields:
+            List[tuple]: The rows returned by the query, in non-empty chunks of at most arraysize rows.
+        """
+        cursor = self.conn.cursor()
+        cursor.arraysize = arraysize
+        try:
+            cursor.execute(query, parameters)
+            yield from iter(cursor.fetchmany, [])
+        finally:
+            cursor.close()
+
+    def filter_records(self, field: str, pattern: str = "", use_glob: bool = False,
+                       as_batch: bool = False) -> Union[List[PersonalData], RecordBatch]:
         """
         Filter records based on the provided field and pattern.
 
+        Patterns with a literal prefix are answered with a range scan on the registered indexes, see
+        explain_filter() to inspect the query plan. Results are cached in query_cache until the table is
+        modified, by this API, another connection or another process, or until they expire.
+
         Args:
             field (str): The field to filter records by (e.g., 'name', 'address', 'phone_number').
             pattern (str): The pattern to match in the specified field using SQL LIKE or glob pattern matching (default "").
             use_glob (bool): If True, use glob pattern matching. If False (default), use SQL LIKE.
+            as_batch (bool): If True, return the records as a columnar RecordBatch instead of a list of
+                             PersonalData objects (default: False).
 
         Returns:
-            List[PersonalData]: A list of filtered records that match the provided field and pattern.
+            Union[List[PersonalData], RecordBatch]: The filtered records that match the provided field and pattern.
 
         Raises:
             ValueError: If the field is not valid.
             Exception: If there is an error executing the SQL query.
         """
+        query, parameters = self._build_filter_query(field, pattern, use_glob)
+
+        # Serve the result of a previous identical filter if the table has not changed since
+        key = (field, pattern, use_glob)
+        batch = None
+        if self.query_cache.enabled:
+            self.query_cache.check_version(self._data_version())
+            batch = self.query_cache.get(key)
+
+        if batch is None:
+            # Execute the query and standardize the rows as the cursor steps through them, skipping the
+            # validation of values that were already validated on insert
+            try:
+                self.cursor.execute(query, parameters)
+                batch = self._standardize_rows(self.cursor)
+            except Exception as e:
+                print(f"Error executing query: {str(e)}")
+                return RecordBatch() if as_batch else []
+            self.query_cache.put(key, batch)
+
+        # Copy the cached batch so that callers cannot modify it
+        return batch[:] if as_batch else batch.to_records()
+
+    def filter_page(self, field: str, pattern: str = "", use_glob: bool = False, after: Optional[str] = None,
+                    limit: int = 100, offset: int = 0) -> Page:
+        """
+        Get a page of the records matching a filter, sorted by the filtered field, using keyset pagination.
+
+        The records are standardized as by filter_records().
+
+        Args:
+            field (str): The field to filter records by (e.g., 'name', 'address', 'phone_number').
+            pattern (str): The pattern to match in the specified field (default "").
+            use_glob (bool): If True, use glob pattern matching. If False (default), use SQL LIKE.
+            after (str): The continuation token of the previous page, or None for the first page (optional).
+            limit (int): The maximum number of records of the page (default: 100).
+            offset (int): The number of records to skip before the page (default: 0).
+
+        Returns:
+            Page: The records of the page and the continuation token of the next page, None on the last page.
+
+        Raises:
+            ValueError: If the field, the limit, the offset or the token is invalid.
+        """
+        condition, parameters = self._build_filter_condition(field, pattern, use_glob)
+        # Sort LIKE matches case-insensitively, in the order of the NOCASE index serving the condition
+        rows, next_token = self.paginator.fetch_page(_RECORD_COLUMNS, field, after, limit, offset, condition,
+                                                     parameters, "BINARY" if use_glob else "NOCASE")
+        return Page(self._standardize_rows(rows).to_records(), next_token)
+
+    def explain_filter(self, field: str, pattern: str = "", use_glob: bool = False) -> List[str]:
+        """
+        Get the SQLite query plan of a filter, to confirm whether it is answered using an index.
+
+        Args:
+            field (str): The field to filter records by (e.g., 'name', 'address', 'phone_number').
+            pattern (str): The pattern to match in the specified field (default "").
+            use_glob (bool): If True, use glob pattern matching. If False (default), use SQL LIKE.
+
+        Returns:
+            List[str]: The steps of the query plan, e.g. "SEARCH personal_data USING INDEX ...".
+
+        Raises:
+            ValueError: If the field is not valid.
+        """
+        query, parameters = self._build_filter_query(field, pattern, use_glob)
+        rows = self.conn.execute(f"EXPLAIN QUERY PLAN {query}", parameters).fetchall()
+        return [row[-1] for row in rows]
+
+    def enable_full_text_search(self) -> None:
+        """
+        Create the FTS5 full-text index used by search() and index the existing records.
+        Once enabled, the index is kept in sync with the dataset by triggers.
+
+        Raises:
+            RuntimeError: If the SQLite library does not support FTS5.
+        """
+        self.full_text_index.enable()
+
+    def disable_full_text_search(self) -> None:
+        """
+        Drop the FTS5 full-text index and the triggers that keep it in sync.
+        """
+        self.full_text_index.disable()
+
+    def search(self, query: str, mode: str = "token", limit: int = 20, field: Optional[str] = None) -> List[PersonalData]:
+        """
+        Search records by words using the full-text index, best matches first.
+
+        Args:
+            query (str): The words to search for (e.g., "maple springfield").
+            mode (str): "token" to match records containing every word, "prefix" to match words starting with
+                        each word, or "phrase" to match the words as a consecutive phrase (default: "token").
+            limit (int): The maximum number of records to return (default: 20).
+            field (str): The field to search in (e.g., 'name', 'address', 'phone_number'; default: all fields).
+
+        Returns:
+            List[PersonalData]: The matching records ranked by BM25 relevance.
+
+        Raises:
+            ValueError: If full-text search is not enabled, or if the query, mode, limit or field is not valid.
+        """
+        rows = self.full_text_index.search(query, mode=mode, limit=limit, field=field)
+        return [PersonalData.from_row(row) for row in rows]
+
+    def _schema_is_checked(self) -> bool:
+        """
+        Private helper method to check whether the schema checks completed since the schema last changed.
+
+        SQLite increments PRAGMA schema_version whenever the schema changes, e.g. when a table or an index is
+        created or dropped, so the migrations and indexes only need to be checked again when it differs from
+        the value recorded by the last check.
+
+        Returns:
+            bool: True if the schema is at the latest version and unchanged since it was last checked.
+        """
+        try:
+            checked, user_version, schema_version = self.conn.execute(
+                "SELECT (SELECT value FROM dataset_meta WHERE key = 'checked_schema'), "
+                "(SELECT user_version FROM pragma_user_version), (SELECT schema_version FROM pragma_schema_version)"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # The schema predates the "dataset_meta" table
+            return False
+        return user_version == self.migrator.latest_version and checked == f"{user_version}:{schema_version}"
+
+    def _ensure_indexes(self) -> None:
+        """
+        Private helper method to create the registered indexes that do not exist yet, and record that the schema
+        checks completed.
+        """
+        self.indexes.install()
+        self.indexes.ensure_indexes()
+        self._mark_schema_checked()
+
+    def _mark_schema_checked(self) -> None:
+        """
+        Private helper method to record that the schema checks completed, if the schema is at the latest version.
+        """
+        if self.migrator.current_version() != self.migrator.latest_version:
+            return
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO dataset_meta (key, value) VALUES ('checked_schema', "
+                "(SELECT user_version FROM pragma_user_version) || ':' || "
+                "(SELECT schema_version FROM pragma_schema_version))"
+            )
+
+    def _current_dataset_version(self) -> Optional[str]:
+        """
+        Private helper method to get the version of the dataset identifying cached exports.
+
+        Returns:
+            Optional[str]: The version, or None if the schema of the database does not track it yet.
+        """
+        try:
+            return self.dataset_version.current()
+        except sqlite3.OperationalError:
+            return None
+
+    def _data_version(self) -> Tuple[int, int]:
+        """
+        Private helper method to get a counter of the changes made to the database.
+
+        PRAGMA data_version changes when another connection, in this process or another one, commits a
+        change, and the total_changes counter of the connection changes when it modifies rows itself, so the
+        pair changes whenever the data does, including with SQL run directly on the connection.
+
+        Returns:
+            Tuple[int, int]: The data version of the database and the number of rows changed by the connection.
+        """
+        return self.conn.execute("PRAGMA data_version").fetchone()[0], self.conn.total_changes
+
+    @staticmethod
+    def _build_filter_query(field: str, pattern: str, use_glob: bool) -> Tuple[str, tuple]:
+        """
+        Private helper method to build the SQL query of a filter.
+
+        Args:
+            field (str): The field to filter records by.
+            pattern (str): The LIKE or GLOB pattern, or "" to match every non-null value.
+            use_glob (bool): If True, use glob pattern matching. If False, use SQL LIKE.
+
+        Returns:
+            Tuple[str, tuple]: The SQL query and its parameters.
+
+        Raises:
+            ValueError: If the field is not valid.
+        """
+        condition, parameters = PersonalDataAPI._build_filter_condition(field, pattern, use_glob)
+        return f"{_SELECT_RECORDS} WHERE {condition}", parameters
+
+    @staticmethod
+    def _build_filter_condition(field: str, pattern: str, use_glob: bool) -> Tuple[str, tuple]:
+        """
+        Private helper method to build the SQL condition of a filter.
+
+        Patterns with a literal prefix are rewritten into a range condition on the field that an index can
+        serve, followed by the original pattern to discard the rows of the range that do not match it.
+
+        Args:
+            field (str): The field to filter records by.
+            pattern (str): The LIKE or GLOB pattern, or "" to match every non-null value.
+            use_glob (bool): If True, use glob pattern matching. If False, use SQL LIKE.
+
+        Returns:
+            Tuple[str, tuple]: The SQL condition and its parameters.
+
+        Raises:
+            ValueError: If the field is not valid.
+        """
         # Define a list of valid fields and raise an error if an invalid field is provided
         valid_fields = ["name", "address", "phone_number"]
         if field not in valid_fields:
             raise ValueError(f"Invalid field '{field}'. Valid fields are: {valid_fields}")
 
-        # Define the SQL query based on the provided field and pattern
-        if pattern and use_glob:
-            query = f"SELECT name, address, phone_number FROM personal_data WHERE {field} GLOB ?"
-        elif pattern:
-            query = f"SELECT name, address, phone_number FROM personal_data WHERE {field} LIKE ?"
-        else:
-            query = f"SELECT name, address, phone_number FROM personal_data WHERE {field} IS NOT NULL"
+        if not pattern:
+            return f"{field} IS NOT NULL", ()
 
-        # Execute the query and fetch the results
-        try:
-            self.cursor.execute(query, (pattern,))
-            rows = self.cursor.fetchall()
-        except Exception as e:
-            print(f"Error executing query: {str(e)}")
-            return []
+        # Define the SQL condition based on the provided pattern
+        operator = "GLOB" if use_glob else "LIKE"
+        prefix_range = IndexRegistry.prefix_range(pattern, use_glob)
+        if prefix_range is None:
+            return f"{field} {operator} ?", (pattern,)
 
-        # Standardize the formatting of the returned records
-        personal_data_list = []
-        for row in rows:
-            # Use tuple unpacking to assign variables to the row elements
-            name, address, phone_number = row
+        # GLOB is case-sensitive and compares with BINARY, LIKE is not and compares with NOCASE
+        collate = "" if use_glob else " COLLATE NOCASE"
+        lower_bound, upper_bound = prefix_range
+        condition = f"{field} >= ?{collate} AND {field} < ?{collate} AND {field} {operator} ?"
+        return condition, (lower_bound, upper_bound, pattern)
 
-            # Clean up the formatting of the phone number
-            phone_number = re.sub(r'(\d{3})(\d{3})(\d{4})', r'\1-\2-\3', phone_number)
+    @staticmethod
+    def _standardize_rows(rows: Iterable[Sequence[str]]) -> RecordBatch:
+        """
+        Private helper method to standardize the formatting of filtered rows.
+
+        Args:
+            rows (Iterable[Sequence[str]]): The name, address and phone number of each record.
+
+        Returns:
+            RecordBatch: The records, with title-cased names and addresses and formatted phone numbers.
+        """
+        batch = RecordBatch()
+        batch.extend(map(PersonalDataAPI._standardize_row, rows))
+        return batch
+
+    @staticmethod
+    def _standardize_row(row: Sequence[str]) -> Tuple[str, str, str]:
+        """
+        Private helper method to standardize the formatting of a filtered row.
+
+        Args:
+            row (Sequence[str]): The name, address and phone number of a record.
+
+        Returns:
+            Tuple[str, str, str]: The title-cased name and address and the formatted phone number.
+        """
+        # Use tuple unpacking to assign variables to the row elements
+        name, address, phone_number = row
 
-            # Create a new PersonalData object with the standardized formatting
-            personal_data = PersonalData(name.strip().title(), address.strip().title(), phone_number.strip())
-            personal_data_list.append(personal_data)
+        # Clean up the formatting of the phone number
+        phone_number = _UNFORMATTED_PHONE_NUMBER.sub(r'\1-\2-\3', phone_number)
 
-        return personal_data_list
+        return name.strip().title(), address.strip().title(), phone_number.strip()
@@ -0,0 +1,362 @@
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Union
+
+from .api import (DEFAULT_DB_PATH, BulkInsertReport, PersonalDataAPI, _SELECT_RECORDS, _open_export_file,
+                  _reserve_file_name)
+from .database import ConnectionPool
+from .models.personal_data import PersonalData
+from .models.record_batch import RecordBatch
+from .serializers import BaseSerializer, SerializerFactory
+from .streams.compression import check_compression, compression_from_extension
+
+
+def _serialize_chunk(serializer: BaseSerializer, records: RecordBatch) -> Union[str, bytes]:
+    """
+    Private helper function run in the CPU executor to serialize a chunk of records.
+
+    Args:
+        serializer (BaseSerializer): The serializer of the output format.
+        records (RecordBatch): The records to serialize.
+
+    Returns:
+        Union[str, bytes]: The serialized chunk, as bytes for binary formats.
+    """
+    return serializer.serialize_chunk(records)
+
+
+class AsyncPersonalDataAPI:
+    """
+    An asyncio API for managing personal data records without blocking the event loop.
+
+    Database work runs on a dedicated single-thread executor, which owns the connection of a wrapped
+    PersonalDataAPI, and CPU-heavy serialization runs on a separate executor. Records are read from the
+    database one chunk at a time as the caller consumes them, so a slow consumer never causes the whole
+    table to be buffered.
+
+    Usage:
+        async with AsyncPersonalDataAPI() as api:
+            await api.add_record(record)
+            async for record in api.get_all_records():
+                ...
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, pool: Optional[ConnectionPool] = None,
+                 cpu_executor: Optional[Executor] = None, chunk_size: int = 1000, max_pending_chunks: int = 4,
+                 **pool_options) -> None:
+        """
+        Initializes the API. The database is opened by open(), or when entering an async with block.
+
+        Args:
+            db_path (str): The path of the database file (default: "data/address_book.db"). Ignored if a
+                           pool is given.
+            pool (ConnectionPool): A connection pool shared with other API objects (optional).
+            cpu_executor (Executor): The executor serializing records (optional). If not provided, the API
+                                     creates a process pool and shuts it down when it is closed.
+            chunk_size (int): The number of records read from the database at once (default: 1000).
+            max_pending_chunks (int): The maximum number of chunks read ahead of the file being written by
+                                      convert_dataset (default: 4).
+            **pool_options: The settings of the connection pool created by the API. See ConnectionPool.
+
+        Raises:
+            ValueError: If the chunk size or the number of pending chunks is not positive.
+        """
+        if chunk_size < 1 or max_pending_chunks < 1:
+            raise ValueError("The chunk size and the number of pending chunks must be positive integers.")
+
+        self.db_path = db_path
+        self.pool = pool
+        self.pool_options = pool_options
+        self.chunk_size = chunk_size
+        self.max_pending_chunks = max_pending_chunks
+
+        # All database calls run on the same thread, one at a time
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="personal-data-db")
+        self._owns_cpu_executor = cpu_executor is None
+        self._cpu_executor = ProcessPoolExecutor() if cpu_executor is None else cpu_executor
+        self._api: Optional[PersonalDataAPI] = None
+
+    async def open(self) -> None:
+        """
+        Open the database, upgrading its schema if needed. Calling it again has no effect.
+        """
+        if self._api is None:
+            self._api = await self._run_in_db(
+                lambda: PersonalDataAPI(db_path=self.db_path, pool=self.pool, **self.pool_options)
+            )
+
+    async def close(self) -> None:
+        """
+        Close the database connection and shut down the executors.
+        """
+        if self._api is not None:
+            await self._run_in_db(self._api.close)
+            self._api = None
+        self._db_executor.shutdown(wait=True)
+        if self._owns_cpu_executor:
+            self._cpu_executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncPersonalDataAPI":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def add_record(self, record: PersonalData) -> bool:
+        """
+        Add a new record to the dataset.
+
+        Args:
+            record (PersonalData): The record to add to the dataset.
+
+        Returns:
+            bool: True if the record was added, False if it could not be inserted.
+
+        Raises:
+            ValueError: If the record is not an instance of PersonalData.
+        """
+        return await self._run_in_db(self._sync_api().add_record, record)
+
+    async def add_records(self, records: Union[Iterable[PersonalData], AsyncIterable[PersonalData]],
+                          batch_size: int = 1000) -> BulkInsertReport:
+        """
+        Add many records to the dataset using batched transactions.
+
+        Records from an async iterable are collected one batch at a time, so a slow producer, such as a
+        request body being parsed, is never buffered beyond one batch. If the iterable raises a ValueError or a
+        TypeError, the records read before it are still inserted and the error is recorded in the report.
+
+        Args:
+            records (Union[Iterable[PersonalData], AsyncIterable[PersonalData]]): The records to add.
+            batch_size (int): The number of records inserted per transaction (default: 1000).
+
+        Returns:
+            BulkInsertReport: The number of inserted records, the failed batches and the insert throughput.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        api = self._sync_api()
+        if not hasattr(records, "__aiter__"):
+            return await self._run_in_db(api.add_records, records, batch_size)
+
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+
+        # Insert each batch as soon as it is complete, combining the reports of the batches
+        report = BulkInsertReport()
+        batch = []
+        batch_number = 0
+        try:
+            async for record in records:
+                batch.append(record)
+                if len(batch) == batch_size:
+                    batch_number += 1
+                    self._merge_report(report, await self._run_in_db(api.add_records, batch, batch_size),
+                                       batch_number)
+                    batch = []
+        except (ValueError, TypeError) as e:
+            # Keep the records read before the error, as the synchronous API does
+            report.error = str(e)
+        if batch:
+            batch_number += 1
+            self._merge_report(report, await self._run_in_db(api.add_records, batch, batch_size), batch_number)
+        return report
+
+    async def get_all_records(self) -> AsyncIterator[PersonalData]:
+        """
+        Iterate over all records in the dataset.
+
+        The next chunk of records is only read from the database once the previous one has been consumed.
+
+        Yields:
+            PersonalData: The records of the dataset.
+        """
+        async for batch in self._stream_batches(_SELECT_RECORDS):
+            for row in batch.rows():
+                yield PersonalData.from_row(row)
+
+    async def filter_records(self, field: str, pattern: str = "", use_glob: bool = False,
+                             as_batch: bool = False) -> Union[List[PersonalData], RecordBatch]:
+        """
+        Filter records based on the provided field and pattern. See PersonalDataAPI.filter_records().
+
+        Args:
+            field (str): The field to filter records by (e.g., 'name', 'address', 'phone_number').
+            pattern (str): The pattern to match in the specified field (default "").
+            use_glob (bool): If True, use glob pattern matching. If False (default), use SQL LIKE.
+            as_batch (bool): If True, return the records as a columnar RecordBatch (default: False).
+
+        Returns:
+            Union[List[PersonalData], RecordBatch]: The filtered records that match the provided field and pattern.
+
+        Raises:
+            ValueError: If the field is not valid.
+        """
+        return await self._run_in_db(self._sync_api().filter_records, field, pattern, use_glob, as_batch)
+
+    async def convert_dataset(self, output_format: Union[str, Sequence[str]], file_path: str,
+                              format_options: Optional[Dict[str, dict]] = None, compression: Optional[str] = None,
+                              compression_level: Optional[int] = None) -> List[str]:
+        """
+        Convert the dataset to the specified format(s) and save each format to a file.
+
+        Chunks are read from the database, serialized on the CPU executor and written in order. At most
+        max_pending_chunks chunks are read ahead of the file being written. Several formats are converted
+        concurrently.
+
+        Args:
+            output_format (Union[str, Sequence[str]]): The output format, or a list of output formats.
+            file_path (str): The file whose directory the serialized data is saved to.
+            format_options (Dict[str, dict]): Serializer constructor options by format (optional).
+            compression (str): The compression of the saved files: gzip, bz2, xz or zstd (default: inferred
+                               from the extension of file_path, such as .gz, or no compression).
+            compression_level (int): The compression level (default: the default level of the compression).
+
+        Returns:
+            List[str]: The paths of the saved files, in the order of the formats.
+
+        Raises:
+            ValueError: If a format is not supported or no records are found to serialize.
+            OSError: If the directory does not exist or a file cannot be written.
+        """
+        output_formats = [output_format] if isinstance(output_format, str) else list(output_format)
+        format_options = format_options or {}
+        serializers = [SerializerFactory.create_serializer(fmt, **format_options.get(fmt, {}))
+                       for fmt in output_formats]
+        if compression is None:
+            compression = compression_from_extension(file_path)
+        if compression is not None:
+            compression_level = check_compression(compression, compression_level)
+
+        directory_path = os.path.dirname(os.path.abspath(file_path))
+        if not os.path.isdir(directory_path):
+            raise OSError(f"The directory '{directory_path}' does not exist.")
+
+        # Reserve a distinct file name per format before any file is written
+        file_names = [_reserve_file_name(directory_path, fmt, compression) for fmt in output_formats]
+
+        await asyncio.gather(*(
+            self._export(serializer, file_name, compression, compression_level)
+            for serializer, file_name in zip(serializers, file_names)
+        ))
+        return file_names
+
+    async def _export(self, serializer: BaseSerializer, file_name: str, compression: Optional[str] = None,
+                      compression_level: Optional[int] = None) -> None:
+        """
+        Private helper method to save the dataset to a file in one format, removing the file if it fails.
+
+        Args:
+            serializer (BaseSerializer): The serializer of the output format.
+            file_name (str): The file to write.
+            compression (str): The compression of the file (optional).
+            compression_level (int): The compression level (default: the default level of the compression).
+
+        Raises:
+            ValueError: If no records are found to serialize.
+        """
+        loop = asyncio.get_running_loop()
+        pending = deque()
+        written = 0
+
+        f, _ = await asyncio.to_thread(_open_export_file, serializer, file_name, compression, compression_level)
+        try:
+            async def write_next() -> None:
+                # Write the oldest pending chunk, preceded by the header or a record separator
+                nonlocal written
+                text = await pending.popleft()
+                prefix = serializer.record_separator if written else serializer.serialize_header()
+                await asyncio.to_thread(f.write, prefix + text)
+                written += 1
+
+            async for batch in self._stream_batches(_SELECT_RECORDS):
+                pending.append(loop.run_in_executor(self._cpu_executor, _serialize_chunk, serializer, batch))
+
+                # Wait for the writer once enough chunks are in flight
+                if len(pending) >= self.max_pending_chunks:
+                    await write_next()
+            while pending:
+                await write_next()
+
+            if not written:
+                raise ValueError("No records found to serialize")
+            await asyncio.to_thread(f.write, serializer.serialize_footer())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            f.close()
+            os.remove(file_name)
+            raise
+        else:
+            # Closing a compressed file waits for the compression thread to finish
+            await asyncio.to_thread(f.close)
+
+    async def _stream_batches(self, query: str, parameters: tuple = ()) -> AsyncIterator[RecordBatch]:
+        """
+        Private helper method to read records from the database as columnar batches, one at a time.
+
+        Args:
+            query (str): A SELECT query returning the name, address and phone_number columns.
+            parameters (tuple): The query parameters (optional).
+
+        Yields:
+            RecordBatch: The records returned by the query, in batches of at most chunk_size records.
+        """
+        api = self._sync_api()
+        cursor = await self._run_in_db(api.conn.execute, query, parameters)
+        try:
+            while True:
+                rows = await self._run_in_db(cursor.fetchmany, self.chunk_size)
+                if not rows:
+                    break
+                yield RecordBatch.from_rows(rows)
+        finally:
+            await self._run_in_db(cursor.close)
+
+    def _sync_api(self) -> PersonalDataAPI:
+        """
+        Private helper method to get the wrapped PersonalDataAPI.
+
+        Returns:
+            PersonalDataAPI: The API used on the database thread.
+
+        Raises:
+            RuntimeError: If the API is not open.
+        """
+        if self._api is None:
+            raise RuntimeError("The API is not open. Use 'async with' or call open() first.")
+        return self._api
+
+    async def _run_in_db(self, func, *args):
+        """
+        Private helper method to run a function on the database thread.
+
+        Args:
+            func (Callable): The function to run.
+            *args: The arguments of the function.
+
+        Returns:
+            The return value of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, func, *args)
+
+    @staticmethod
+    def _merge_report(report: BulkInsertReport, batch_report: BulkInsertReport, batch_number: int) -> None:
+        """
+        Private helper method to add the report of one batch to the combined report.
+
+        Args:
+            report (BulkInsertReport): The combined report.
+            batch_report (BulkInsertReport): The report of the batch.
+            batch_number (int): The number of the batch, starting at 1.
+        """
+        report.inserted += batch_report.inserted
+        report.elapsed += batch_report.elapsed
+        report.failed_batches.extend((batch_number, size, error) for _, size, error in batch_report.failed_batches)
+        report.invalid_batches.extend((batch_number, count, error) for _, count, error in batch_report.invalid_batches)
+        if report.error is None:
+            report.error = batch_report.error
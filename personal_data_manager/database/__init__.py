@@ -0,0 +1,8 @@
+from .change_log import ChangeLog
+from .connection import ConnectionPool
+from .dataset_version import DatasetVersion
+from .full_text_search import FullTextIndex
+from .index_registry import IndexRegistry
+from .migrations import MIGRATIONS, Migration, Migrator
+from .pagination import KeysetPaginator, Page
+from .query_cache import CacheStats, QueryCache
@@ -0,0 +1,210 @@
+import sqlite3
+from typing import List, Tuple
+
+
+class ChangeLog:
+    """
+    A log of the records updated or deleted in the "personal_data" table, to export only what changed.
+
+    Triggers append the id and the previous phone number of every updated or deleted row to the
+    "personal_data_changes" table, with the largest id left in the table. Inserted rows are not logged, which
+    keeps bulk inserts as fast as without the log: their ids are larger than the largest id at the time of the
+    checkpoint, unless SQLite reused the ids of deleted rows, which it only does after the rows with the
+    largest ids were deleted. The smallest largest id logged since the checkpoint bounds the reused ids, so
+    every row inserted since then has a larger id.
+
+    A checkpoint is a token "dataset id:sequence:largest id" identifying the state of the table when it was
+    taken. The token "0" is the checkpoint of an empty table, before any record was added.
+    """
+
+    # The triggers appending the updated and deleted rows to the log
+    TRIGGERS = {
+        "personal_data_log_update": (
+            "AFTER UPDATE",
+            "SELECT OLD.id, OLD.phone_number, OLD.phone_digits "
+            "UNION ALL SELECT NEW.id, NULL, NULL WHERE NEW.id <> OLD.id",
+        ),
+        "personal_data_log_delete": ("AFTER DELETE", "SELECT OLD.id, OLD.phone_number, OLD.phone_digits"),
+    }
+
+    # The checkpoint of an empty table
+    INITIAL_CHECKPOINT = "0"
+
+    def __init__(self, conn: sqlite3.Connection, table: str = "personal_data") -> None:
+        """
+        Initializes the change log.
+
+        Args:
+            conn (sqlite3.Connection): The database connection.
+            table (str): The name of the tracked table (default: "personal_data").
+        """
+        self.conn = conn
+        self.table = table
+
+    def install(self) -> None:
+        """
+        Create the "personal_data_changes" table and its triggers, if they do not already exist. The
+        "dataset_meta" table must exist. The caller is responsible for committing.
+        """
+        # AUTOINCREMENT keeps sequence numbers increasing after the log is pruned
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS personal_data_changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                record_id INTEGER NOT NULL,
+                phone_number TEXT,
+                phone_digits TEXT,
+                max_id INTEGER NOT NULL
+            )
+            """
+        )
+        self.conn.execute("INSERT OR IGNORE INTO dataset_meta (key, value) VALUES ('changes_pruned', 0)")
+        for trigger, (event, rows) in self.TRIGGERS.items():
+            self.conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {trigger} {event} ON {self.table} BEGIN
+                    INSERT INTO personal_data_changes (record_id, phone_number, phone_digits, max_id)
+                    SELECT *, (SELECT coalesce(max(rowid), 0) FROM {self.table}) FROM ({rows});
+                END
+                """
+            )
+
+    def checkpoint(self) -> str:
+        """
+        Get a checkpoint of the current state of the table.
+
+        Returns:
+            str: The checkpoint token.
+
+        Raises:
+            sqlite3.OperationalError: If the database does not log its changes.
+        """
+        dataset_id, seq, max_id = self.conn.execute(
+            f"""
+            SELECT (SELECT value FROM dataset_meta WHERE key = 'dataset_id'),
+                   (SELECT max(coalesce((SELECT max(seq) FROM personal_data_changes), 0),
+                               (SELECT value FROM dataset_meta WHERE key = 'changes_pruned'))),
+                   (SELECT coalesce(max(rowid), 0) FROM {self.table})
+            """
+        ).fetchone()
+        return f"{dataset_id}:{seq}:{max_id}"
+
+    def _parse(self, checkpoint: str) -> Tuple[int, int]:
+        """
+        Private helper method to validate a checkpoint of this dataset.
+
+        Args:
+            checkpoint (str): The checkpoint token.
+
+        Returns:
+            Tuple[int, int]: The sequence number of the last logged change and the largest id of the checkpoint.
+
+        Raises:
+            ValueError: If the token is malformed, belongs to another dataset or is older than the log.
+        """
+        if checkpoint == self.INITIAL_CHECKPOINT:
+            return 0, 0
+
+        try:
+            dataset_id, seq, max_id = checkpoint.split(":")
+            seq, max_id = int(seq), int(max_id)
+        except ValueError:
+            raise ValueError(f"Invalid checkpoint '{checkpoint}'.")
+
+        current_id, pruned = self.conn.execute(
+            "SELECT (SELECT value FROM dataset_meta WHERE key = 'dataset_id'), "
+            "(SELECT value FROM dataset_meta WHERE key = 'changes_pruned')"
+        ).fetchone()
+        if dataset_id != current_id:
+            raise ValueError(f"The checkpoint '{checkpoint}' belongs to another dataset.")
+        if seq < pruned:
+            raise ValueError(f"The checkpoint '{checkpoint}' is older than the change log. Export the whole "
+                             f"dataset since checkpoint {self.INITIAL_CHECKPOINT} instead.")
+        return seq, max_id
+
+    def changed_rows_query(self, checkpoint: str, columns: str = "name, address, phone_number") -> Tuple[str, tuple]:
+        """
+        Build the query returning the rows inserted or updated since a checkpoint, in id order.
+
+        The query only reads the log entries and the rows past the checkpoint, through the primary keys, so
+        its cost is proportional to the number of changes rather than to the size of the table.
+
+        Args:
+            checkpoint (str): The checkpoint token.
+            columns (str): The selected columns (default: "name, address, phone_number").
+
+        Returns:
+            Tuple[str, tuple]: The query and its parameters.
+
+        Raises:
+            ValueError: If the checkpoint is not valid for this dataset.
+        """
+        seq, max_id = self._parse(checkpoint)
+        query = f"""
+            SELECT {columns} FROM {self.table} WHERE rowid IN (
+                SELECT record_id FROM personal_data_changes WHERE seq > ?
+                UNION
+                SELECT rowid FROM {self.table} WHERE rowid > min(?, (
+                    SELECT coalesce(min(max_id), ?) FROM personal_data_changes WHERE seq > ?
+                ))
+            )
+            ORDER BY rowid
+        """
+        return query, (seq, max_id, max_id, seq)
+
+    def deleted_phone_numbers(self, checkpoint: str) -> List[str]:
+        """
+        Get the phone numbers of the records deleted since a checkpoint, or changed to another phone number.
+
+        Args:
+            checkpoint (str): The checkpoint token.
+
+        Returns:
+            List[str]: The phone numbers, as they were stored, that no record of the table has anymore.
+
+        Raises:
+            ValueError: If the checkpoint is not valid for this dataset.
+        """
+        if checkpoint == self.INITIAL_CHECKPOINT:
+            return []
+
+        seq, _ = self._parse(checkpoint)
+        rows = self.conn.execute(
+            f"""
+            SELECT c.phone_number FROM personal_data_changes AS c
+            WHERE c.seq > ? AND c.phone_digits IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM {self.table} AS t WHERE t.phone_digits = c.phone_digits
+            )
+            GROUP BY c.phone_digits
+            ORDER BY min(seq)
+            """,
+            (seq,),
+        )
+        return [phone_number for phone_number, in rows]
+
+    def prune(self, checkpoint: str) -> int:
+        """
+        Remove the log entries older than a checkpoint, which no export needs anymore once every consumer
+        has read a later delta. Checkpoints older than the given one become invalid. The caller is
+        responsible for committing.
+
+        Args:
+            checkpoint (str): The oldest checkpoint still in use.
+
+        Returns:
+            int: The number of entries removed.
+
+        Raises:
+            ValueError: If the checkpoint is not valid for this dataset.
+        """
+        seq, _ = self._parse(checkpoint)
+        cursor = self.conn.execute("DELETE FROM personal_data_changes WHERE seq <= ?", (seq,))
+        self.conn.execute(
+            "UPDATE dataset_meta SET value = max(value, ?) WHERE key = 'changes_pruned'", (seq,)
+        )
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        """Returns the number of entries in the log."""
+        return self.conn.execute("SELECT count(*) FROM personal_data_changes").fetchone()[0]
+
@@ -0,0 +1,215 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of SQLite connections to one database file.
+
+    Every connection is opened in WAL journal mode, so readers do not block the writer and the writer does
+    not block readers, and with a busy timeout, so concurrent writers wait for the write lock instead of
+    failing with "database is locked". Connections can be checked out and returned from any thread; each
+    one is validated before it is handed out and replaced if it is no longer usable.
+    """
+
+    # The synchronous settings accepted by SQLite
+    SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+    def __init__(self, db_path: str, max_connections: int = 8, journal_mode: str = "WAL",
+                 synchronous: str = "NORMAL", cache_size: int = -16000, mmap_size: int = 64 * 2 ** 20,
+                 busy_timeout: int = 5000) -> None:
+        """
+        Initializes the pool. Connections are opened on demand.
+
+        Args:
+            db_path (str): The path of the database file.
+            max_connections (int): The maximum number of connections open at once (default: 8).
+            journal_mode (str): The journal mode of the database (default: "WAL").
+            synchronous (str): How often SQLite waits for writes to reach the disk: OFF, NORMAL, FULL or
+                               EXTRA (default: "NORMAL", which is durable in WAL mode except on power loss).
+            cache_size (int): The page cache size per connection, in pages if positive or in KiB if negative
+                              (default: -16000, about 16 MB).
+            mmap_size (int): The number of bytes of the database file accessed through memory mapping
+                             (default: 64 MiB). Set it to 0 to disable memory mapping.
+            busy_timeout (int): The number of milliseconds a connection waits for a lock held by another
+                                connection before failing (default: 5000).
+
+        Raises:
+            ValueError: If the synchronous setting or the maximum number of connections is invalid.
+        """
+        if synchronous.upper() not in self.SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid synchronous setting: {synchronous}. "
+                             f"Valid settings are: {', '.join(self.SYNCHRONOUS_MODES)}")
+        if max_connections < 1:
+            raise ValueError("The pool must allow at least one connection")
+
+        self.db_path = db_path
+        self.max_connections = max_connections
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous.upper()
+        self.cache_size = int(cache_size)
+        self.mmap_size = int(mmap_size)
+        self.busy_timeout = int(busy_timeout)
+
+        # The idle connections, reused most recently returned first so that their caches stay warm
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._open_connections = 0
+        self._closed = False
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open a new connection to the database, configured with the settings of the pool.
+
+        The connection is not tracked by the pool. Use acquire() to check out a pooled connection.
+
+        Returns:
+            sqlite3.Connection: The new connection.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout / 1000, check_same_thread=False)
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+            conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+            conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+            conn.execute(f"PRAGMA cache_size = {self.cache_size}")
+            conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """
+        Check out a connection, reusing an idle one or opening a new one below the maximum.
+
+        Args:
+            timeout (float): The number of seconds to wait for a connection to be returned when the maximum
+                             number of connections is checked out (default: wait indefinitely).
+
+        Returns:
+            sqlite3.Connection: A connection for the exclusive use of the caller until it is released.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+            TimeoutError: If no connection was returned within the timeout.
+        """
+        while True:
+            if self._closed:
+                raise RuntimeError("The connection pool is closed")
+
+            # Prefer an idle connection, then a new one if the maximum is not reached
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_open = self._open_connections < self.max_connections
+                    if can_open:
+                        self._open_connections += 1
+                if can_open:
+                    try:
+                        return self.connect()
+                    except BaseException:
+                        with self._lock:
+                            self._open_connections -= 1
+                        raise
+
+                # Wait for another thread to return a connection
+                try:
+                    conn = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"No database connection was available within {timeout} seconds")
+
+            # Hand out the connection only if it is still usable, otherwise replace it
+            if self._is_usable(conn):
+                return conn
+            self._discard(conn)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """
+        Return a checked out connection to the pool, rolling back any transaction left open.
+
+        Args:
+            conn (sqlite3.Connection): A connection returned by acquire().
+        """
+        if self._closed or not self._is_usable(conn):
+            self._discard(conn)
+            return
+
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[sqlite3.Connection]:
+        """
+        Check out a connection for the duration of a with block.
+
+        Args:
+            timeout (float): The number of seconds to wait for a connection (default: wait indefinitely).
+
+        Yields:
+            sqlite3.Connection: The checked out connection.
+        """
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """
+        Close the idle connections and refuse further checkouts. Connections still checked out are closed
+        when they are released.
+        """
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    @property
+    def closed(self) -> bool:
+        """bool: Whether the pool is closed."""
+        return self._closed
+
+    @staticmethod
+    def _is_usable(conn: sqlite3.Connection) -> bool:
+        """
+        Private helper method to check that a connection is open and responsive.
+
+        Args:
+            conn (sqlite3.Connection): The connection to check.
+
+        Returns:
+            bool: True if a trivial query succeeds on the connection.
+        """
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """
+        Private helper method to close a connection and free its slot in the pool.
+
+        Args:
+            conn (sqlite3.Connection): The connection to discard.
+        """
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._open_connections -= 1
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
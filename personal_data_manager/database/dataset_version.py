@@ -0,0 +1,69 @@
+import sqlite3
+
+
+class DatasetVersion:
+    """
+    A version identifying the contents of the "personal_data" table.
+
+    The version combines a random identifier of the database, the largest id and a counter of the rows
+    updated or deleted, which triggers maintain in the "dataset_meta" table. An inserted row gets an id larger
+    than the largest one, so every insert changes the largest id, and every update or delete changes the
+    counter: the version changes whenever the contents of the table do. Unlike a trigger on inserts, this keeps
+    bulk inserts as fast as without versioning, and reading the version only looks up primary keys.
+    """
+
+    # The triggers counting the rows updated or deleted
+    TRIGGERS = {
+        "personal_data_changes_update": "AFTER UPDATE",
+        "personal_data_changes_delete": "AFTER DELETE",
+    }
+
+    def __init__(self, conn: sqlite3.Connection, table: str = "personal_data") -> None:
+        """
+        Initializes the version tracker.
+
+        Args:
+            conn (sqlite3.Connection): The database connection.
+            table (str): The name of the versioned table (default: "personal_data").
+        """
+        self.conn = conn
+        self.table = table
+
+    def install(self) -> None:
+        """
+        Create the "dataset_meta" table, with a new random dataset identifier, and the triggers counting the
+        changed rows, if they do not already exist. The caller is responsible for committing.
+        """
+        self.conn.execute("CREATE TABLE IF NOT EXISTS dataset_meta (key TEXT PRIMARY KEY, value NOT NULL)")
+        self.conn.execute(
+            "INSERT OR IGNORE INTO dataset_meta (key, value) "
+            "VALUES ('dataset_id', lower(hex(randomblob(16)))), ('changes', 0)"
+        )
+        for trigger, event in self.TRIGGERS.items():
+            self.conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {trigger} {event} ON {self.table} BEGIN
+                    UPDATE dataset_meta SET value = value + 1 WHERE key = 'changes';
+                END
+                """
+            )
+
+    def current(self) -> str:
+        """
+        Get the current version of the table.
+
+        Returns:
+            str: The version, as "dataset id:changes:largest id".
+
+        Raises:
+            sqlite3.OperationalError: If the version is not tracked by the database.
+        """
+        # Read every part in a single statement so that they are consistent with each other
+        dataset_id, changes, max_id = self.conn.execute(
+            f"""
+            SELECT (SELECT value FROM dataset_meta WHERE key = 'dataset_id'),
+                   (SELECT value FROM dataset_meta WHERE key = 'changes'),
+                   (SELECT coalesce(max(rowid), 0) FROM {self.table})
+            """
+        ).fetchone()
+        return f"{dataset_id}:{changes}:{max_id}"
@@ -0,0 +1,191 @@
+import sqlite3
+from typing import List, Optional, Tuple
+
+
+class FullTextIndex:
+    """
+    An optional FTS5 full-text index mirroring the "personal_data" table.
+
+    The index is an external-content FTS5 table: it stores only the tokens of the records and reads the
+    records themselves from "personal_data". Triggers keep it in sync with every insert, update and delete.
+    """
+
+    # The columns of the "personal_data" table mirrored by the index
+    COLUMNS = ("name", "address", "phone_number")
+
+    # The supported query modes
+    MODES = ("token", "prefix", "phrase")
+
+    def __init__(self, conn: sqlite3.Connection, table: str = "personal_data") -> None:
+        """
+        Initializes the full-text index of a table.
+
+        Args:
+            conn (sqlite3.Connection): The database connection.
+            table (str): The name of the indexed table (default: "personal_data").
+        """
+        self.conn = conn
+        self.table = table
+        self.fts_table = f"{table}_fts"
+
+    @staticmethod
+    def is_available(conn: sqlite3.Connection) -> bool:
+        """
+        Check whether the SQLite library was compiled with the FTS5 extension.
+
+        Args:
+            conn (sqlite3.Connection): The database connection.
+
+        Returns:
+            bool: True if FTS5 tables can be created.
+        """
+        try:
+            conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.fts5_probe USING fts5(content)")
+            conn.execute("DROP TABLE temp.fts5_probe")
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    def exists(self) -> bool:
+        """
+        Check whether the full-text index has been created.
+
+        Returns:
+            bool: True if the FTS5 table exists.
+        """
+        row = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (self.fts_table,)
+        ).fetchone()
+        return row is not None
+
+    def enable(self) -> None:
+        """
+        Create the full-text index and its triggers, and index the existing records.
+
+        Raises:
+            RuntimeError: If the SQLite library does not support FTS5.
+        """
+        if not self.is_available(self.conn):
+            raise RuntimeError("Full-text search requires an SQLite library compiled with FTS5.")
+
+        columns = ", ".join(self.COLUMNS)
+        with self.conn:
+            self.conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} "
+                f"USING fts5({columns}, content='{self.table}', content_rowid='rowid')"
+            )
+            self.install_triggers()
+            self.rebuild()
+
+    def disable(self) -> None:
+        """
+        Drop the full-text index and its triggers.
+        """
+        with self.conn:
+            for suffix in ("ai", "ad", "au"):
+                self.conn.execute(f"DROP TRIGGER IF EXISTS {self.fts_table}_{suffix}")
+            self.conn.execute(f"DROP TABLE IF EXISTS {self.fts_table}")
+
+    def install_triggers(self) -> None:
+        """
+        Create the triggers that mirror inserts, updates and deletes on the table into the index.
+        Triggers are dropped together with their table, so they must be reinstalled if the table is rebuilt.
+        """
+        columns = ", ".join(self.COLUMNS)
+        new_values = ", ".join(f"new.{column}" for column in self.COLUMNS)
+        old_values = ", ".join(f"old.{column}" for column in self.COLUMNS)
+
+        insert_new = f"INSERT INTO {self.fts_table} (rowid, {columns}) VALUES (new.rowid, {new_values});"
+        delete_old = (
+            f"INSERT INTO {self.fts_table} ({self.fts_table}, rowid, {columns}) "
+            f"VALUES ('delete', old.rowid, {old_values});"
+        )
+
+        self.conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_ai AFTER INSERT ON {self.table} BEGIN {insert_new} END"
+        )
+        self.conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_ad AFTER DELETE ON {self.table} BEGIN {delete_old} END"
+        )
+        self.conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_au AFTER UPDATE ON {self.table} "
+            f"BEGIN {delete_old} {insert_new} END"
+        )
+
+    def rebuild(self) -> None:
+        """
+        Re-index every record of the table.
+        """
+        self.conn.execute(f"INSERT INTO {self.fts_table} ({self.fts_table}) VALUES ('rebuild')")
+
+    def search(self, text: str, mode: str = "token", limit: int = 20,
+               field: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        """
+        Search the index, ranking the matches with BM25.
+
+        Args:
+            text (str): The words to search for.
+            mode (str): "token" to match records containing every word, "prefix" to match words starting
+                        with each word, or "phrase" to match the words as a consecutive phrase (default: "token").
+            limit (int): The maximum number of matches to return (default: 20).
+            field (str): The field to search in (default: all fields).
+
+        Returns:
+            List[Tuple[str, str, str]]: The name, address and phone number of the best matches.
+
+        Raises:
+            ValueError: If the index does not exist, or if the query, mode, limit or field is not valid.
+        """
+        if not self.exists():
+            raise ValueError("Full-text search is not enabled.")
+        if limit < 1:
+            raise ValueError("Limit must be a positive integer.")
+
+        match = self.build_query(text, mode, field)
+        columns = ", ".join(f"p.{column}" for column in self.COLUMNS)
+        return self.conn.execute(
+            f"SELECT {columns} FROM {self.fts_table} f JOIN {self.table} p ON p.rowid = f.rowid "
+            f"WHERE {self.fts_table} MATCH ? ORDER BY f.rank LIMIT ?",
+            (match, limit),
+        ).fetchall()
+
+    @classmethod
+    def build_query(cls, text: str, mode: str = "token", field: Optional[str] = None) -> str:
+        """
+        Build an FTS5 query from user input, quoting every word so that FTS5 operators are matched literally.
+
+        Args:
+            text (str): The words to search for.
+            mode (str): "token", "prefix" or "phrase" (default: "token").
+            field (str): The field to search in (default: all fields).
+
+        Returns:
+            str: The FTS5 MATCH expression.
+
+        Raises:
+            ValueError: If the query, mode or field is not valid.
+        """
+        if mode not in cls.MODES:
+            raise ValueError(f"Invalid mode '{mode}'. Valid modes are: {list(cls.MODES)}")
+        if field is not None and field not in cls.COLUMNS:
+            raise ValueError(f"Invalid field '{field}'. Valid fields are: {list(cls.COLUMNS)}")
+
+        words = text.split()
+        if not words:
+            raise ValueError("Search query cannot be empty")
+
+        def quote(value: str) -> str:
+            return '"' + value.replace('"', '""') + '"'
+
+        # Implicit AND between quoted tokens, optionally as prefixes, or a single quoted phrase
+        if mode == "phrase":
+            expression = quote(" ".join(words))
+        elif mode == "prefix":
+            expression = " ".join(quote(word) + "*" for word in words)
+        else:
+            expression = " ".join(quote(word) for word in words)
+
+        if field is not None:
+            expression = f"{{{field}}} : ({expression})"
+
+        return expression
@@ -0,0 +1,217 @@
+import sqlite3
+from typing import List, Optional, Tuple
+
+
+class IndexRegistry:
+    """
+    A registry of the indexes maintained on the "personal_data" table.
+
+    The registered index definitions are stored in the "index_registry" table of the database itself, so
+    indexes added at runtime persist across sessions and can be recreated after the table is rebuilt.
+    """
+
+    # The columns of the "personal_data" table that can be indexed
+    INDEXABLE_COLUMNS = ("name", "address", "phone_number")
+
+    # The collations supported by the registry
+    COLLATIONS = ("BINARY", "NOCASE")
+
+    # The indexes registered on a new database. BINARY indexes serve GLOB and exact matches, NOCASE indexes
+    # serve the case-insensitive LIKE operator.
+    DEFAULT_INDEXES = (
+        ("idx_personal_data_name", "name", "BINARY"),
+        ("idx_personal_data_name_nocase", "name", "NOCASE"),
+        ("idx_personal_data_address", "address", "BINARY"),
+        ("idx_personal_data_address_nocase", "address", "NOCASE"),
+        ("idx_personal_data_phone_number", "phone_number", "BINARY"),
+        ("idx_personal_data_phone_number_nocase", "phone_number", "NOCASE"),
+    )
+
+    def __init__(self, conn: sqlite3.Connection, table: str = "personal_data", install: bool = True) -> None:
+        """
+        Initializes the registry, creating its bookkeeping table on first use.
+
+        Args:
+            conn (sqlite3.Connection): The database connection.
+            table (str): The name of the indexed table (default: "personal_data").
+            install (bool): If True (default), create the bookkeeping table now. Pass False when it is known
+                            to exist, to avoid a write transaction, and call install() otherwise.
+        """
+        self.conn = conn
+        self.table = table
+
+        if install:
+            self.install()
+
+    def install(self) -> None:
+        """
+        Create the "index_registry" table and register the default indexes if it does not already exist.
+        """
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS index_registry (
+                    name TEXT PRIMARY KEY,
+                    column_name TEXT NOT NULL,
+                    collation TEXT NOT NULL
+                )
+                """
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO index_registry (name, column_name, collation) VALUES (?, ?, ?)",
+                self.DEFAULT_INDEXES,
+            )
+
+    def definitions(self) -> List[Tuple[str, str, str]]:
+        """
+        Get the registered index definitions.
+
+        Returns:
+            List[Tuple[str, str, str]]: The name, column and collation of each registered index.
+        """
+        return self.conn.execute(
+            "SELECT name, column_name, collation FROM index_registry ORDER BY name"
+        ).fetchall()
+
+    def existing_indexes(self) -> List[str]:
+        """
+        Get the names of the indexes that currently exist on the table.
+
+        Returns:
+            List[str]: The index names.
+        """
+        rows = self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=? AND sql IS NOT NULL ORDER BY name",
+            (self.table,),
+        ).fetchall()
+        return [name for name, in rows]
+
+    def register(self, column: str, collation: str = "BINARY", name: Optional[str] = None) -> str:
+        """
+        Register an index and create it if it does not already exist.
+
+        Args:
+            column (str): The column to index.
+            collation (str): The collation of the index, "BINARY" or "NOCASE" (default: "BINARY").
+            name (str): The name of the index (default: derived from the column and collation).
+
+        Returns:
+            str: The name of the registered index.
+
+        Raises:
+            ValueError: If the column or the collation is not valid.
+        """
+        collation = collation.upper()
+        if column not in self.INDEXABLE_COLUMNS:
+            raise ValueError(f"Invalid column '{column}'. Valid columns are: {list(self.INDEXABLE_COLUMNS)}")
+        if collation not in self.COLLATIONS:
+            raise ValueError(f"Invalid collation '{collation}'. Valid collations are: {list(self.COLLATIONS)}")
+
+        if name is None:
+            name = f"idx_{self.table}_{column}" + ("_nocase" if collation == "NOCASE" else "")
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO index_registry (name, column_name, collation) VALUES (?, ?, ?)",
+                (name, column, collation),
+            )
+            self._create_index(name, column, collation)
+
+        return name
+
+    def unregister(self, name: str) -> None:
+        """
+        Remove an index from the registry and drop it from the database.
+
+        Args:
+            name (str): The name of the index.
+
+        Raises:
+            ValueError: If the index is not registered.
+        """
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM index_registry WHERE name=?", (name,))
+            if cursor.rowcount == 0:
+                raise ValueError(f"Index '{name}' is not registered.")
+            self.conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+    def ensure_indexes(self) -> List[str]:
+        """
+        Create every registered index that does not exist yet.
+
+        Returns:
+            List[str]: The names of the indexes that were created.
+        """
+        existing = set(self.existing_indexes())
+        created = []
+        with self.conn:
+            for name, column, collation in self.definitions():
+                if name not in existing:
+                    self._create_index(name, column, collation)
+                    created.append(name)
+
+        return created
+
+    def drop_indexes(self) -> None:
+        """
+        Drop every registered index from the database while keeping it registered, e.g. before a bulk load.
+        The indexes are recreated by ensure_indexes().
+        """
+        with self.conn:
+            for name, _, _ in self.definitions():
+                self.conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+    def _create_index(self, name: str, column: str, collation: str) -> None:
+        """
+        Private helper method to create a single index.
+
+        Args:
+            name (str): The name of the index.
+            column (str): The column to index.
+            collation (str): The collation of the index.
+        """
+        self.conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON {self.table} ({column} COLLATE {collation})')
+
+    @staticmethod
+    def prefix_range(pattern: str, use_glob: bool = False) -> Optional[Tuple[str, str]]:
+        """
+        Get the index range covering every value that can match a LIKE or GLOB pattern.
+
+        The range is derived from the literal prefix of the pattern. For LIKE, which is case-insensitive for
+        ASCII characters, the bounds are meant to be compared with the NOCASE collation; for GLOB they are
+        compared with the BINARY collation. The range may be wider than the pattern, so the pattern itself
+        must still be applied to the rows in the range.
+
+        Args:
+            pattern (str): The LIKE or GLOB pattern.
+            use_glob (bool): If True, the pattern uses glob syntax. If False (default), SQL LIKE syntax.
+
+        Returns:
+            Optional[Tuple[str, str]]: The inclusive lower bound and exclusive upper bound, or None if the
+                                       pattern starts with a wildcard.
+        """
+        wildcards = "*?[" if use_glob else "%_"
+
+        # Extract the literal prefix that precedes the first wildcard
+        end = len(pattern)
+        for i, char in enumerate(pattern):
+            if char in wildcards:
+                end = i
+                break
+        prefix = pattern[:end]
+
+        # NOCASE only folds ASCII letters, so the LIKE prefix is lower-cased the same way
+        if not use_glob:
+            prefix = prefix.translate(_ASCII_LOWERCASE)
+
+        # The upper bound is the prefix with its last character incremented
+        while prefix and ord(prefix[-1]) >= 0x10FFFF:
+            prefix = prefix[:-1]
+        if not prefix:
+            return None
+
+        return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+# Translation table folding ASCII upper-case letters the way SQLite's NOCASE collation does
+_ASCII_LOWERCASE = {code: code + 32 for code in range(ord("A"), ord("Z") + 1)}
@@ -0,0 +1,269 @@
+import sqlite3
+from typing import Callable, List, Optional
+
+from .change_log import ChangeLog
+from .dataset_version import DatasetVersion
+from .full_text_search import FullTextIndex
+
+# A callback receiving the number of rows copied so far by a batched migration, and the number of rows rejected
+ProgressCallback = Optional[Callable[[int, int], None]]
+
+
+class Migration:
+    """
+    A class to represent a single schema migration.
+
+    Attributes:
+        version (int): The schema version the migration upgrades the database to.
+        description (str): A short description of the migration.
+        upgrade (Callable): A function applying the migration, called with the connection, the batch size
+                            and an optional progress callback. It must set PRAGMA user_version on success.
+    """
+
+    def __init__(self, version: int, description: str,
+                 upgrade: Callable[[sqlite3.Connection, int, ProgressCallback], None]) -> None:
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the Migration object."""
+        return f"{self.version}: {self.description}"
+
+
+def _create_personal_data(conn: sqlite3.Connection, batch_size: int, progress: ProgressCallback) -> None:
+    """
+    Version 1: create the original, unconstrained "personal_data" table if it does not already exist.
+    """
+    with conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS personal_data (
+                name TEXT,
+                address TEXT,
+                phone_number TEXT
+            )
+            """
+        )
+        conn.execute("PRAGMA user_version = 1")
+
+
+# The SQL expression stripping the punctuation of a formatted phone number down to its digits
+_PHONE_DIGITS = "replace(replace(replace(replace(replace(replace(phone_number, '-', ''), ' ', ''), " \
+                "'(', ''), ')', ''), '.', ''), '+', '')"
+
+# The columns copied from the original table, with the rows violating the new constraints filtered out
+_COPY_ROWS = """
+    INSERT OR IGNORE INTO personal_data_v2 (id, name, address, phone_number)
+    SELECT rowid, name, address, phone_number FROM personal_data
+    WHERE rowid > ? AND name <> '' AND address <> '' AND phone_number <> ''
+    ORDER BY rowid
+"""
+
+# The digits of the phone number of a row "p" of the original table
+_ORIGINAL_PHONE_DIGITS = _PHONE_DIGITS.replace("phone_number", "p.phone_number")
+
+# The rows of the original table that were not copied, with the reason and the id of the record they duplicate
+_REJECT_ROWS = f"""
+    INSERT OR IGNORE INTO personal_data_rejected (id, name, address, phone_number, reason, duplicate_of)
+    SELECT rowid, name, address, phone_number,
+           CASE WHEN name <> '' AND address <> '' AND phone_number <> '' THEN 'duplicate phone number'
+                ELSE 'empty field' END,
+           (SELECT id FROM personal_data_v2 WHERE phone_digits = {_ORIGINAL_PHONE_DIGITS})
+    FROM personal_data AS p
+    WHERE rowid > ? AND NOT EXISTS (SELECT 1 FROM personal_data_v2 WHERE id = p.rowid)
+    ORDER BY rowid
+"""
+
+
+def _rebuild_personal_data(conn: sqlite3.Connection, batch_size: int, progress: ProgressCallback) -> None:
+    """
+    Version 2: rebuild "personal_data" with an INTEGER PRIMARY KEY, NOT NULL constraints and a normalized,
+    uniquely indexed "phone_digits" column.
+
+    Rows are copied in rowid order in batches, each in its own short transaction, so readers and writers
+    are only blocked for one batch at a time. The final batch, the table swap and the version bump run in
+    a single transaction, which also picks up rows inserted while the copy was running. The rowid of each
+    record is kept as its id. Rows with an empty or NULL field, or with the phone number of an earlier row,
+    violate the new constraints: they are moved to the "personal_data_rejected" table with the reason, and
+    the id of the record they duplicate, so that they can be fixed and added again.
+    """
+    with conn:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS personal_data_v2 (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL CHECK (name <> ''),
+                address TEXT NOT NULL CHECK (address <> ''),
+                phone_number TEXT NOT NULL CHECK (phone_number <> ''),
+                phone_digits TEXT GENERATED ALWAYS AS ({_PHONE_DIGITS}) STORED NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_personal_data_phone_digits ON personal_data_v2 (phone_digits)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS personal_data_rejected (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                address TEXT,
+                phone_number TEXT,
+                reason TEXT NOT NULL,
+                duplicate_of INTEGER
+            )
+            """
+        )
+
+    # Resume after the rows already copied or rejected by an interrupted run
+    last_rowid, copied, rejected = conn.execute(
+        "SELECT max(coalesce((SELECT max(id) FROM personal_data_v2), 0), "
+        "coalesce((SELECT max(id) FROM personal_data_rejected), 0)), "
+        "(SELECT count(*) FROM personal_data_v2), (SELECT count(*) FROM personal_data_rejected)"
+    ).fetchone()
+
+    while True:
+        with conn:
+            batch_end = conn.execute(
+                "SELECT max(rowid) FROM (SELECT rowid FROM personal_data WHERE rowid > ? ORDER BY rowid LIMIT ?)",
+                (last_rowid, batch_size),
+            ).fetchone()[0]
+            if batch_end is None:
+                break
+            copied += conn.execute(_COPY_ROWS.replace("WHERE rowid > ?", "WHERE rowid > ? AND rowid <= ?"),
+                                   (last_rowid, batch_end)).rowcount
+            rejected += conn.execute(_REJECT_ROWS.replace("WHERE rowid > ?", "WHERE rowid > ? AND rowid <= ?"),
+                                     (last_rowid, batch_end)).rowcount
+
+        last_rowid = batch_end
+        if progress is not None:
+            progress(copied, rejected)
+
+    # Copy the rows inserted since the last batch and swap the tables atomically
+    with conn:
+        late_copied = conn.execute(_COPY_ROWS, (last_rowid,)).rowcount
+        late_rejected = conn.execute(_REJECT_ROWS, (last_rowid,)).rowcount
+        conn.execute("DROP TABLE personal_data")
+        conn.execute("ALTER TABLE personal_data_v2 RENAME TO personal_data")
+
+        # Triggers are dropped with their table, so those of the full-text index are reinstalled
+        full_text_index = FullTextIndex(conn)
+        if full_text_index.exists():
+            full_text_index.install_triggers()
+            full_text_index.rebuild()
+
+        conn.execute("PRAGMA user_version = 2")
+
+    if (late_copied or late_rejected) and progress is not None:
+        progress(copied + late_copied, rejected + late_rejected)
+
+
+def _track_dataset_version(conn: sqlite3.Connection, batch_size: int, progress: ProgressCallback) -> None:
+    """
+    Version 3: add the "dataset_meta" table and the triggers maintaining the version of the dataset.
+    """
+    with conn:
+        DatasetVersion(conn).install()
+        conn.execute("PRAGMA user_version = 3")
+
+
+def _log_changes(conn: sqlite3.Connection, batch_size: int, progress: ProgressCallback) -> None:
+    """
+    Version 4: add the "personal_data_changes" table and the triggers logging the updated and deleted rows.
+    """
+    with conn:
+        ChangeLog(conn).install()
+        conn.execute("PRAGMA user_version = 4")
+
+
+# The migrations of the database schema, in order
+MIGRATIONS = [
+    Migration(1, "Create the personal_data table", _create_personal_data),
+    Migration(2, "Add an integer primary key, NOT NULL constraints and unique normalized phone numbers",
+              _rebuild_personal_data),
+    Migration(3, "Track the version of the dataset", _track_dataset_version),
+    Migration(4, "Log the updated and deleted records", _log_changes),
+]
+
+
+class Migrator:
+    """
+    A class to upgrade the database schema, tracking the applied version with PRAGMA user_version.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, migrations: Optional[List[Migration]] = None) -> None:
+        """
+        Initializes the migrator.
+
+        Args:
+            conn (sqlite3.Connection): The database connection.
+            migrations (List[Migration]): The migrations to apply, in order (default: MIGRATIONS).
+        """
+        self.conn = conn
+        self.migrations = MIGRATIONS if migrations is None else migrations
+
+    @property
+    def latest_version(self) -> int:
+        """int: The schema version reached once every migration is applied."""
+        return self.migrations[-1].version if self.migrations else 0
+
+    def current_version(self) -> int:
+        """
+        Get the schema version of the database.
+
+        Returns:
+            int: The value of PRAGMA user_version.
+        """
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def pending(self) -> List[Migration]:
+        """
+        Get the migrations that have not been applied to the database yet.
+
+        Returns:
+            List[Migration]: The pending migrations, in order.
+        """
+        current_version = self.current_version()
+        return [migration for migration in self.migrations if migration.version > current_version]
+
+    def upgrade(self, batch_size: int = 10000, progress: ProgressCallback = None) -> List[Migration]:
+        """
+        Apply the pending migrations in order.
+
+        Args:
+            batch_size (int): The number of rows copied per transaction by migrations that rebuild a table
+                              (default: 10000).
+            progress (Callable[[int, int], None]): A callback receiving the number of rows copied so far and the
+                                                   number of rows rejected by the new constraints (optional).
+
+        Returns:
+            List[Migration]: The migrations that were applied.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+            RuntimeError: If a migration does not update the schema version.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+
+        applied = []
+        for migration in self.pending():
+            migration.upgrade(self.conn, batch_size, progress)
+            if self.current_version() != migration.version:
+                raise RuntimeError(f"Migration {migration} did not update the schema version.")
+            applied.append(migration)
+
+        return applied
+
+    def rejected_rows(self) -> int:
+        """
+        Get the number of rows that violated the constraints of version 2 and were not copied.
+
+        Returns:
+            int: The number of rows in the "personal_data_rejected" table, or 0 if it does not exist.
+        """
+        try:
+            return self.conn.execute("SELECT count(*) FROM personal_data_rejected").fetchone()[0]
+        except sqlite3.OperationalError:
+            return 0
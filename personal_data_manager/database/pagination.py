@@ -0,0 +1,165 @@
+import base64
+import binascii
+import json
+import sqlite3
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch
+
+
+class Page:
+    """
+    A page of records, with the continuation token of the next page.
+    """
+
+    def __init__(self, records: Union[List[PersonalData], RecordBatch], next_token: Optional[str]) -> None:
+        """
+        Initializes the page.
+
+        Args:
+            records (Union[List[PersonalData], RecordBatch]): The records of the page.
+            next_token (str): The token to pass as after to get the next page, or None on the last page.
+        """
+        self.records = records
+        self.next_token = next_token
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.records)
+
+    def __repr__(self) -> str:
+        return f"Page({len(self.records)} records, next_token={self.next_token!r})"
+
+
+class KeysetPaginator:
+    """
+    Keyset (seek) pagination over the "personal_data" table.
+
+    Rows are ordered by a sort key with the rowid as a tie-breaker. Instead of skipping the rows of the
+    previous pages with OFFSET, each page starts right after the (key, rowid) pair of the last row of the
+    previous page, which the sort key index finds directly. Fetching any page therefore costs the same as
+    fetching the first one, and rows inserted or deleted meanwhile never shift the pages.
+
+    The position is returned to the caller as an opaque continuation token.
+    """
+
+    # The sort keys, each served by an index: the rowid itself and the BINARY column indexes
+    SORT_KEYS = ("id", "name", "address", "phone_number")
+
+    def __init__(self, conn: sqlite3.Connection, table: str = "personal_data") -> None:
+        """
+        Initializes the paginator.
+
+        Args:
+            conn (sqlite3.Connection): The database connection.
+            table (str): The name of the paginated table (default: "personal_data").
+        """
+        self.conn = conn
+        self.table = table
+
+    def fetch_page(self, columns: Sequence[str], order_by: str = "id", after: Optional[str] = None,
+                   limit: int = 100, offset: int = 0, condition: str = "", parameters: tuple = (),
+                   collation: str = "BINARY") -> Tuple[List[tuple], Optional[str]]:
+        """
+        Fetch a page of rows.
+
+        Args:
+            columns (Sequence[str]): The columns to select.
+            order_by (str): The sort key: id, name, address or phone_number (default: "id").
+            after (str): The continuation token returned with the previous page (optional).
+            limit (int): The maximum number of rows of the page (default: 100).
+            offset (int): The number of rows to skip after the position of the token (default: 0).
+            condition (str): An SQL condition the rows must match (optional).
+            parameters (tuple): The parameters of the condition (optional).
+            collation (str): The collation of the sort key, BINARY or NOCASE (default: "BINARY"). Use the
+                             collation of the index serving the condition to avoid sorting its rows.
+
+        Returns:
+            Tuple[List[tuple], Optional[str]]: The rows of the page, and the token of the next page or None if
+                                               this is the last page.
+
+        Raises:
+            ValueError: If the sort key, the limit, the offset or the token is invalid.
+        """
+        if order_by not in self.SORT_KEYS:
+            raise ValueError(f"Invalid sort key '{order_by}'. Valid sort keys are: {list(self.SORT_KEYS)}")
+        if limit < 1:
+            raise ValueError("Limit must be a positive integer.")
+        if offset < 0:
+            raise ValueError("Offset must not be negative.")
+        if collation not in ("BINARY", "NOCASE"):
+            raise ValueError(f"Invalid collation '{collation}'. Valid collations are: ['BINARY', 'NOCASE']")
+
+        key = "rowid" if order_by == "id" else order_by
+        sort_key = key if collation == "BINARY" else f"{key} COLLATE {collation}"
+        conditions = [condition] if condition else []
+        parameters = list(parameters)
+
+        # Seek past the last row of the previous page
+        if after is not None:
+            last_key, last_rowid = self.decode_token(after, order_by)
+            if order_by == "id":
+                conditions.append("rowid > ?")
+                parameters.append(last_rowid)
+            else:
+                conditions.append(f"({sort_key}, rowid) > (?, ?)")
+                parameters.extend((last_key, last_rowid))
+
+        where = f" WHERE {' AND '.join(f'({c})' for c in conditions)}" if conditions else ""
+        order = "rowid" if order_by == "id" else f"{sort_key}, rowid"
+        query = (f"SELECT rowid, {key}, {', '.join(columns)} FROM {self.table}{where} "
+                 f"ORDER BY {order} LIMIT ? OFFSET ?")
+
+        # Fetch one extra row to know whether there is a next page
+        rows = self.conn.execute(query, (*parameters, limit + 1, offset)).fetchall()
+        next_token = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_token = self.encode_token(order_by, rows[-1][1], rows[-1][0])
+        return [row[2:] for row in rows], next_token
+
+    @staticmethod
+    def encode_token(order_by: str, key, rowid: int) -> str:
+        """
+        Encode a position in the sort order into an opaque continuation token.
+
+        Args:
+            order_by (str): The sort key.
+            key: The sort key value of the last row of the page.
+            rowid (int): The rowid of the last row of the page.
+
+        Returns:
+            str: The URL-safe continuation token.
+        """
+        payload = json.dumps([order_by, key, rowid], separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_token(token: str, order_by: str) -> Tuple[object, int]:
+        """
+        Decode a continuation token.
+
+        Args:
+            token (str): The continuation token.
+            order_by (str): The sort key of the requested page, which must match the token.
+
+        Returns:
+            Tuple[object, int]: The sort key value and the rowid of the last row of the previous page.
+
+        Raises:
+            ValueError: If the token is malformed or was issued for another sort key.
+        """
+        try:
+            payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            token_order_by, key, rowid = json.loads(payload.decode("utf-8"))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise ValueError("Invalid continuation token.")
+        if not isinstance(rowid, int):
+            raise ValueError("Invalid continuation token.")
+        if token_order_by != order_by:
+            raise ValueError(f"The continuation token was issued for pages sorted by '{token_order_by}', "
+                             f"not '{order_by}'.")
+        return key, rowid
@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+
+class CacheStats:
+    """
+    The hit and miss statistics of a query cache.
+
+    Attributes:
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that had to run the query.
+        evictions (int): The number of entries removed because the cache was full or they expired.
+        invalidations (int): The number of times the cache was cleared because the data changed.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def lookups(self) -> int:
+        """int: The total number of lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """float: The fraction of lookups answered from the cache."""
+        if not self.lookups:
+            return 0.0
+        return self.hits / self.lookups
+
+    def __repr__(self) -> str:
+        return (f"CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+                f"invalidations={self.invalidations})")
+
+
+class QueryCache:
+    """
+    A least recently used cache of query results, bounded in size and age.
+
+    Entries are tied to a version of the data, such as a change counter of the database. Whenever the
+    version passed to check_version() differs from the previous one, every entry is dropped, so a result is
+    never served after the data it was computed from has changed.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl: Optional[float] = 300.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int): The maximum number of cached results (default: 128). Set it to 0 to disable
+                               the cache.
+            ttl (float): The number of seconds a result stays valid, or None to keep results until they are
+                         evicted or invalidated (default: 300).
+            clock (Callable[[], float]): The monotonic clock measuring the age of the entries (optional).
+
+        Raises:
+            ValueError: If the maximum number of entries is negative or the TTL is not positive.
+        """
+        if max_entries < 0:
+            raise ValueError("The maximum number of cache entries must not be negative.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("The cache TTL must be a positive number of seconds.")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+
+        # The cached results and their expiry times, least recently used first
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """bool: Whether results are cached."""
+        return self.max_entries > 0
+
+    def check_version(self, version: Hashable) -> None:
+        """
+        Drop every entry if the data changed since the previous check.
+
+        Args:
+            version (Hashable): The current version of the data.
+        """
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._clear()
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """
+        Look up a result, counting a hit or a miss.
+
+        Args:
+            key (Hashable): The key of the query.
+
+        Returns:
+            Optional[object]: The cached result, or None if it is not cached or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or self.clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+
+                # Drop the expired result
+                del self._entries[key]
+                self.stats.evictions += 1
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: object) -> None:
+        """
+        Cache a result, evicting the least recently used results beyond the maximum number of entries.
+
+        Args:
+            key (Hashable): The key of the query.
+            value (object): The result of the query.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            expires_at = None if self.ttl is None else self.clock() + self.ttl
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self) -> None:
+        """
+        Drop every entry, e.g. after the data was modified.
+        """
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        """
+        Private helper method to drop every entry, counting an invalidation if the cache was not empty.
+        The lock must be held by the caller.
+        """
+        if self._entries:
+            self._entries.clear()
+            self.stats.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,11 +1,15 @@
-from typing import List
+from typing import List, TextIO
 
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.streams import ChunkWriter
 
 
 class BaseDisplayFormatter:
     """
     A base class to represent a display formatter.
+
+    Formatters consume the records as an iterable, which may be a list, a RecordBatch or a lazy stream of
+    RecordBatch objects read from the database, and write their output as they go.
     """
 
     def display_format(self, records: List[PersonalData]) -> str:
@@ -18,4 +22,27 @@ class BaseDisplayFormatter:
         Returns:
             str: The formatted output.
         """
-        raise NotImplementedError("display_format method not implemented.")
+        writer = ChunkWriter()
+        self.write_records(writer, records)
+        return writer.getvalue()
+
+    def write_to(self, stream: TextIO, records: List[PersonalData]) -> None:
+        """
+        Format the records into the desired output format straight to a writable text stream.
+
+        Args:
+            stream (TextIO): A writable text stream, such as a file or sys.stdout.
+            records (List[PersonalData]): A list of PersonalData objects to format.
+        """
+        with ChunkWriter(stream) as writer:
+            self.write_records(writer, records)
+
+    def write_records(self, writer: ChunkWriter, records: List[PersonalData]) -> None:
+        """
+        Write the formatted records to a chunk writer. Subclasses must implement this method.
+
+        Args:
+            writer (ChunkWriter): The chunk writer to write the formatted output to.
+            records (List[PersonalData]): A list of PersonalData objects to format.
+        """
+        raise NotImplementedError("write_records method not implemented.")
@@ -1,6 +1,7 @@
 import csv
-from io import StringIO
 
+from personal_data_manager.models.record_batch import iter_rows
+from personal_data_manager.streams import ChunkWriter
 from .base_display_fmt import BaseDisplayFormatter
 
 
@@ -9,28 +10,18 @@ class CSVDisplayFormatter(BaseDisplayFormatter):
     A class to represent a CSV output formatter.
     """
 
-    def display_format(self, records: list) -> str:
+    def write_records(self, writer: ChunkWriter, records: list) -> None:
         """
-        Format the records into a CSV output.
+        Write the records in a CSV output.
 
         Args:
-            records (list): A list of records to be formatted.
-
-        Returns:
-            str: The formatted CSV output.
+            writer (ChunkWriter): The chunk writer to write the formatted output to.
+            records (list): A list of records or a RecordBatch to be formatted.
         """
-        # Create a StringIO object to write the CSV data to
-        output = StringIO()
-        writer = csv.writer(output)
+        csv_writer = csv.writer(writer)
 
         # Write the header row in lowercase
-        writer.writerow(["name", "address", "phone number"])
-
-        # Loop through each record and write a row for each record
-        for record in records:
-            writer.writerow([record.name, record.address, record.phone_number])
-
-        # Get the CSV data as a string and return it
-        csv_data = output.getvalue()
+        csv_writer.writerow(["name", "address", "phone number"])
 
-        return csv_data
+        # Write a row for each record
+        csv_writer.writerows(iter_rows(records))
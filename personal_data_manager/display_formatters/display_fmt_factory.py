@@ -1,19 +1,30 @@
-from typing import List
+from typing import Dict, List, Tuple
 
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.plugins import DISPLAY_FORMATTER_GROUP, PluginRegistry
 
 from .base_display_fmt import BaseDisplayFormatter
-from .text_display_fmt import TextDisplayFormatter
-from .html_display_fmt import HTMLDisplayFormatter
-from .csv_display_fmt import CSVDisplayFormatter
-from .yaml_display_fmt import YAMLDisplayFormatter
 
 
 class DisplayFormatterFactory:
     """
     A factory class to create and return the appropriate output formatter based on the format string provided.
+
+    Formatter modules are only imported when their format is first requested. Installed distributions can
+    add formats under the "personal_data_manager.display_formatters" entry point group.
     """
 
+    # The module and class name of the formatter of each output format
+    FORMATTERS: Dict[str, Tuple[str, str]] = {
+        "text": ("text_display_fmt", "TextDisplayFormatter"),
+        "html": ("html_display_fmt", "HTMLDisplayFormatter"),
+        "csv": ("csv_display_fmt", "CSVDisplayFormatter"),
+        "yaml": ("yaml_display_fmt", "YAMLDisplayFormatter"),
+    }
+
+    # The built-in and plugin formatters
+    registry = PluginRegistry(DISPLAY_FORMATTER_GROUP, __package__, FORMATTERS, BaseDisplayFormatter)
+
     @staticmethod
     def create_formatter(output_format: str, records: List[PersonalData]) -> BaseDisplayFormatter:
         """
@@ -27,16 +38,22 @@ class DisplayFormatterFactory:
             BaseDisplayFormatter: The appropriate output formatter based on the output_format string provided.
 
         Raises:
-            ValueError: If the output_format is unsupported.
+            ValueError: If the output_format is unsupported or its plugin cannot be loaded.
         """
-        # Check the output_format and return the appropriate output formatter
-        if output_format == "text":
-            return TextDisplayFormatter()
-        elif output_format == "html":
-            return HTMLDisplayFormatter()
-        elif output_format == "csv":
-            return CSVDisplayFormatter()
-        elif output_format == "yaml":
-            return YAMLDisplayFormatter()
-        else:
+        # Check the output_format and import the module of the appropriate output formatter
+        try:
+            formatter_class = DisplayFormatterFactory.registry.get_class(output_format)
+        except KeyError:
             raise ValueError(f"Unsupported output format: {output_format}")
+
+        return formatter_class()
+
+    @staticmethod
+    def get_supported_formats() -> List[str]:
+        """
+        Get a list of supported output formats, including those of plugins, without importing their formatters.
+
+        Returns:
+            List[str]: A list of supported output formats.
+        """
+        return DisplayFormatterFactory.registry.names()
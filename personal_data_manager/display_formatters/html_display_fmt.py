@@ -1,3 +1,5 @@
+from personal_data_manager.models.record_batch import iter_rows
+from personal_data_manager.streams import ChunkWriter
 from .base_display_fmt import BaseDisplayFormatter
 
 
@@ -6,24 +8,21 @@ class HTMLDisplayFormatter(BaseDisplayFormatter):
     A class to represent an HTML output formatter.
     """
 
-    def display_format(self, records: list) -> str:
+    def write_records(self, writer: ChunkWriter, records: list) -> None:
         """
-        Format the records into an HTML output.
+        Write the records in an HTML output.
 
         Args:
-            records (list): A list of records to be formatted.
-
-        Returns:
-            str: The formatted HTML output.
+            writer (ChunkWriter): The chunk writer to write the formatted output to.
+            records (list): A list of records or a RecordBatch to be formatted.
         """
-        output = "<html>\n<head>\n<title>Personal Data</title>\n</head>\n<body>\n<table>\n"
-        output += "<tr><th>Name</th><th>Address</th><th>Phone Number</th></tr>\n"
-
-        # Loop through each record and append the record information to the output string
-        for record in records:
-            output += f"<tr><td>{record.name}</td><td>{record.address}</td><td>{record.phone_number}</td></tr>\n"
-
-        output += "</table>\n</body>\n</html>"
+        writer.write("<html>\n<head>\n<title>Personal Data</title>\n</head>\n<body>\n<table>\n")
+        writer.write("<tr><th>Name</th><th>Address</th><th>Phone Number</th></tr>\n")
 
-        return output
+        # Write a table row of record information per record
+        writer.writelines(
+            f"<tr><td>{name}</td><td>{address}</td><td>{phone_number}</td></tr>\n"
+            for name, address, phone_number in iter_rows(records)
+        )
 
+        writer.write("</table>\n</body>\n</html>")
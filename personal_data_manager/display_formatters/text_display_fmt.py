@@ -1,3 +1,5 @@
+from personal_data_manager.models.record_batch import iter_rows
+from personal_data_manager.streams import ChunkWriter
 from .base_display_fmt import BaseDisplayFormatter
 
 
@@ -6,20 +8,15 @@ class TextDisplayFormatter(BaseDisplayFormatter):
     A class to represent a text output formatter.
     """
 
-    def display_format(self, records: list) -> str:
+    def write_records(self, writer: ChunkWriter, records: list) -> None:
         """
-        Format the records into a text output.
+        Write the records in a text output.
 
         Args:
-            records (list): A list of records to be formatted.
-
-        Returns:
-            str: The formatted text output.
+            writer (ChunkWriter): The chunk writer to write the formatted output to.
+            records (list): A list of records or a RecordBatch to be formatted.
         """
-        output = ""
-
-        # Loop through each record and append the record information to the output string
-        for record in records:
-            output += f"{record.name}\n{record.address}\n{record.phone_number}\n\n"
-
-        return output
+        # Write a block of record information per record
+        writer.writelines(
+            f"{name}\n{address}\n{phone_number}\n\n" for name, address, phone_number in iter_rows(records)
+        )
@@ -1,7 +1,11 @@
-from typing import List
+from itertools import chain
+from typing import List, Union
 import yaml
 
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_chunks, iter_rows
+from personal_data_manager.serializers.yaml_ser import YAML_DUMPER
+from personal_data_manager.streams import ChunkWriter
 from .base_display_fmt import BaseDisplayFormatter
 
 
@@ -10,18 +14,28 @@ class YAMLDisplayFormatter(BaseDisplayFormatter):
     A class for formatting PersonalData objects in YAML format.
     """
 
-    def display_format(self, records: List[PersonalData]) -> str:
+    # The number of records dumped at once
+    chunk_size = 1000
+
+    def write_records(self, writer: ChunkWriter, records: Union[List[PersonalData], RecordBatch]) -> None:
         """
-        Format a list of PersonalData objects in YAML format.
+        Write a list of PersonalData objects in YAML format.
 
         Args:
-            records (List[PersonalData]): A list of PersonalData objects to format.
-
-        Returns:
-            str: A string representation of the PersonalData objects in YAML format.
+            writer (ChunkWriter): The chunk writer to write the formatted output to.
+            records (Union[List[PersonalData], RecordBatch]): A list of PersonalData objects or a RecordBatch to format.
         """
-        # Convert the records to a dictionary
-        data = {"personal_data": [record.to_dict() for record in records]}
+        # Write the "personal_data" key, then dump the records one chunk at a time as the items of its
+        # sequence, which produces the same document as dumping {"personal_data": [...]} at once
+        chunks = iter_chunks(iter_rows(records), self.chunk_size)
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            writer.write("personal_data: []\n")
+            return
 
-        # Serialize the dictionary to YAML format
-        return yaml.dump(data, sort_keys=False)
+        writer.write("personal_data:\n")
+        for chunk in chain([first_chunk], chunks):
+            yaml.dump([
+                {"name": name, "address": address, "phone_number": phone_number}
+                for name, address, phone_number in chunk
+            ], writer, Dumper=YAML_DUMPER, sort_keys=False)
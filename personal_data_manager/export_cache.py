@@ -0,0 +1,195 @@
+import os
+from typing import List, Tuple
+
+from .database import CacheStats
+from .serializers import BaseSerializer
+
+
+class ExportCache:
+    """
+    A directory of serialized exports, addressed by the output format, the serializer options and the
+    version of the dataset they were serialized from.
+
+    Exporting an unchanged dataset again in the same format is served by copying the cached file instead of
+    serializing every record. The cache is bounded in total size and number of files; the least recently
+    used files are evicted first.
+
+    The modules copying and hashing files are imported by the methods using them, which keeps them out of
+    the startup of commands that do not export anything.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 2 ** 20, max_entries: int = 32) -> None:
+        """
+        Initializes the cache. The directory is created when the first export is stored.
+
+        Args:
+            directory (str): The directory holding the cached files.
+            max_bytes (int): The maximum total size of the cached files, in bytes (default: 256 MiB). Exports
+                             larger than this are not cached.
+            max_entries (int): The maximum number of cached files (default: 32).
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_bytes < 1 or max_entries < 1:
+            raise ValueError("The limits of the export cache must be positive.")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+
+    @staticmethod
+    def key(output_format: str, serializer: BaseSerializer, dataset_version: str) -> str:
+        """
+        Compute the cache key of an export.
+
+        Args:
+            output_format (str): The output format.
+            serializer (BaseSerializer): The serializer, whose class and options are part of the key.
+            dataset_version (str): The version of the exported dataset.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest identifying the export.
+        """
+        import hashlib
+
+        serializer_class = type(serializer)
+        options = sorted(vars(serializer).items())
+        class_name = f"{serializer_class.__module__}.{serializer_class.__qualname__}"
+        identity = f"{output_format}\0{class_name}\0{options!r}\0{dataset_version}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def fetch(self, key: str, file_name: str) -> bool:
+        """
+        Copy a cached export to a file, counting a hit or a miss.
+
+        Args:
+            key (str): The cache key of the export.
+            file_name (str): The file to write.
+
+        Returns:
+            bool: True if the export was cached and copied, False otherwise.
+
+        Raises:
+            OSError: If the cached export cannot be copied to the file.
+        """
+        from shutil import copyfile
+
+        path = self._path(key)
+        if not os.path.exists(path):
+            self.stats.misses += 1
+            return False
+
+        try:
+            copyfile(path, file_name)
+        except FileNotFoundError:
+            # The file was evicted in the meantime
+            self.stats.misses += 1
+            return False
+
+        # Mark the file as recently used
+        os.utime(path)
+        self.stats.hits += 1
+        return True
+
+    def store(self, key: str, file_name: str) -> None:
+        """
+        Cache an exported file, then evict the least recently used files beyond the limits.
+
+        Args:
+            key (str): The cache key of the export.
+            file_name (str): The exported file.
+
+        Raises:
+            OSError: If the file cannot be copied to the cache directory.
+        """
+        from shutil import copyfile
+        from tempfile import mkstemp
+
+        if os.path.getsize(file_name) > self.max_bytes:
+            return
+
+        # Copy to a temporary file first so that a partially copied export is never served
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            copyfile(file_name, temp_path)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used files until the cache is within its limits.
+        """
+        entries = self._entries()
+        total_bytes = sum(size for _, _, size in entries)
+        remaining = len(entries)
+
+        # The entries are sorted least recently used first
+        for path, _, size in entries:
+            if total_bytes <= self.max_bytes and remaining <= self.max_entries:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+            remaining -= 1
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove every cached file.
+        """
+        for path, _, _ in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _path(self, key: str) -> str:
+        """
+        Private helper method to get the path of a cached file.
+
+        Args:
+            key (str): The cache key of the export.
+
+        Returns:
+            str: The path of the file in the cache directory.
+        """
+        return os.path.join(self.directory, f"{key}.export")
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        """
+        Private helper method to list the cached files.
+
+        Returns:
+            List[Tuple[str, float, int]]: The path, last use time and size of each file, least recently used first.
+        """
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+
+        for name in names:
+            if not name.endswith(".export"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+
+        entries.sort(key=lambda entry: entry[1])
+        return entries
@@ -1,7 +1,16 @@
 import argparse
+import os
 
-from .api import PersonalDataAPI
+from .api import DEFAULT_DB_PATH, PersonalDataAPI
+from .database import Page
+from .display_formatters.display_fmt_factory import DisplayFormatterFactory
 from .models.personal_data import PersonalData
+from .plugins import discover_entry_points
+from .serializers import SerializerFactory
+from .streams.compression import COMPRESSIONS, compression_from_extension, open_decompressed, sniff_compression
+
+# File extensions that do not match the name of the serialization format they contain
+FORMAT_EXTENSIONS = {"yml": "yaml", "txt": "text", "htm": "html", "ndjson": "jsonl", "bin": "binary"}
 
 
 def main() -> None:
@@ -11,6 +20,8 @@ def main() -> None:
 
     # Initialize the command-line argument parser
     parser = argparse.ArgumentParser(description="Personal Data Manager")
+    parser.add_argument("--database", default=DEFAULT_DB_PATH,
+                        help=f"Path of the SQLite database file (default: {DEFAULT_DB_PATH})")
 
     # Create subparsers for different commands
     subparsers = parser.add_subparsers(dest="command", required=True, help="Subcommands")
@@ -24,15 +35,39 @@ def main() -> None:
     # Display subcommand
     display_parser = subparsers.add_parser("display", help="Display records in the dataset")
     display_parser.add_argument("-fmt", "--format", default="text",
-                                help="Output format (default: text). Supported formats: text, csv, html, yaml")
+                                help="Output format (default: text). Supported formats: text, csv, html, yaml and the "
+                                     "formats of plugins listed by the formats command")
+    add_pagination_arguments(display_parser)
+    display_parser.add_argument("--order_by", default="id", choices=["id", "name", "address", "phone_number"],
+                                help="Sort key of the displayed page (default: id, the insertion order)")
 
     # Convert subcommand
     convert_parser = subparsers.add_parser("convert", help="Convert dataset to another format and save to a file")
-    convert_parser.add_argument("-f", "--format", required=True,
-                                help="Output format. Supported formats: csv, json, xml, yaml, text, html")
+    convert_parser.add_argument("-f", "--format", required=True, nargs="+",
+                                help="Output format(s), separated by spaces or commas. Several formats are "
+                                     "exported in parallel. Supported formats: csv, json, jsonl, xml, yaml, text, html, "
+                                     "binary and the formats of plugins listed by the formats command")
     convert_parser.add_argument("-o", "--output", help="File path to save the serialized data to")
     convert_parser.add_argument("-p", "--preview", action="store_true",
                                 help="Display output without saving to a file if set, even if --output is also specified")
+    convert_parser.add_argument("--compact", action="store_true",
+                                help="Write XML without indentation, for exports read by other programs")
+    convert_parser.add_argument("--yaml_documents", action="store_true",
+                                help="Write YAML as one document per chunk of records, so it can be read incrementally")
+    convert_parser.add_argument("-w", "--workers", type=int, default=1,
+                                help="Number of worker processes serializing a single format (default: 1). "
+                                     "Not allowed with several formats, which get one process each")
+    convert_parser.add_argument("--cache_dir",
+                                help="Directory caching the exports, to copy the cached file when the unchanged "
+                                     "dataset is exported again in the same format")
+    convert_parser.add_argument("--compress", choices=list(COMPRESSIONS),
+                                help="Compress the saved files (default: inferred from the extension of the "
+                                     "output path, such as .gz, or no compression). zstd requires zstandard")
+    convert_parser.add_argument("--level", type=int,
+                                help="Compression level (default: 6 for gzip and xz, 9 for bz2, 3 for zstd)")
+    convert_parser.add_argument("--since", metavar="CHECKPOINT",
+                                help="Export only the records changed since the checkpoint printed by a previous "
+                                     "delta export, or since 0 to export every record with a first checkpoint")
 
     # Filter subcommand
     filter_parser = subparsers.add_parser("filter",
@@ -41,54 +76,284 @@ def main() -> None:
                                help="Field to filter records by (e.g., 'name', 'address', 'phone_number')")
     filter_parser.add_argument("-p", "--pattern",
                                help="Pattern to filter records by field (accepts SQL LIKE or glob syntax)")
+    filter_parser.add_argument("--explain", action="store_true",
+                               help="Display the SQLite query plan of the filter before its results")
+    add_pagination_arguments(filter_parser)
+
+    # Search subcommand
+    search_parser = subparsers.add_parser("search", help="Search records by words using the full-text index")
+    search_parser.add_argument("-q", "--query", required=True, help="Words to search for")
+    search_parser.add_argument("-f", "--field",
+                               help="Field to search in (e.g., 'name', 'address', 'phone_number'; default: all)")
+    search_mode = search_parser.add_mutually_exclusive_group()
+    search_mode.add_argument("--prefix", action="store_true", help="Match words starting with each query word")
+    search_mode.add_argument("--phrase", action="store_true", help="Match the query words as a consecutive phrase")
+    search_parser.add_argument("-l", "--limit", type=int, default=20,
+                               help="Maximum number of records to display (default: 20)")
+
+    # Import subcommand
+    import_parser = subparsers.add_parser("import", help="Import records from a file into the dataset")
+    import_parser.add_argument("-i", "--input", required=True, help="File path to read the serialized data from")
+    import_parser.add_argument("-f", "--format",
+                               help="Input format (default: inferred from the file extension). "
+                                    "Supported formats: csv, json, jsonl, xml, yaml, text, html, binary and the "
+                                    "formats of plugins listed by the formats command")
+    import_parser.add_argument("-b", "--batch_size", type=int, default=1000,
+                               help="Number of records inserted per transaction (default: 1000)")
+
+    # Migrate subcommand
+    migrate_parser = subparsers.add_parser("migrate", help="Upgrade the database schema to the latest version")
+    migrate_parser.add_argument("-b", "--batch_size", type=int, default=10000,
+                                help="Number of rows copied per transaction when a table is rebuilt (default: 10000)")
+    migrate_parser.add_argument("-s", "--status", action="store_true",
+                                help="Display the schema version and the pending migrations without applying them")
+
+    # Formats subcommand
+    formats_parser = subparsers.add_parser("formats", help="List the supported formats, including those of plugins")
+    formats_parser.add_argument("--refresh", action="store_true",
+                                help="Scan the installed distributions for plugins instead of using the cached scan")
 
     # Parse the command-line arguments
     args = parser.parse_args()
 
-    # Create an instance of the PersonalDataAPI class
-    api = PersonalDataAPI()
+    # Create an instance of the PersonalDataAPI class, closing its connection once the command is done
+    # The "migrate" command applies the schema migrations itself, with its own batch size
+    with PersonalDataAPI(auto_migrate=args.command != "migrate", db_path=args.database,
+                         export_cache_dir=getattr(args, "cache_dir", None)) as api:
+        run_command(api, parser, args)
+
 
+def add_pagination_arguments(subparser: argparse.ArgumentParser) -> None:
+    """
+    Add the options displaying one page of records to a subcommand.
+
+    Args:
+        subparser (argparse.ArgumentParser): The parser of the subcommand.
+    """
+    subparser.add_argument("--limit", type=int, help="Maximum number of records to display")
+    subparser.add_argument("--offset", type=int, default=0, help="Number of records to skip (default: 0)")
+    subparser.add_argument("--after", help="Continuation token printed after the previous page")
+
+
+def print_next_page(page: Page) -> None:
+    """
+    Print how to display the page following a page of records.
+
+    Args:
+        page (Page): The displayed page.
+    """
+    if page.next_token is not None:
+        print(f"More records are available. Use --after {page.next_token} to display the next page.")
+
+
+def run_command(api: PersonalDataAPI, parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Run the command parsed from the command line.
+
+    Args:
+        api (PersonalDataAPI): The API of the dataset.
+        parser (argparse.ArgumentParser): The command-line argument parser, used to report usage errors.
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
     # Handle the "add" command
     if args.command == "add":
         # Create a new PersonalData object and add it to the dataset
         personal_data = PersonalData(args.name, args.address, args.phone_number)
-        api.add_record(personal_data)
-        print(f"Record added: {personal_data}")
+        if api.add_record(personal_data):
+            print(f"Record added: {personal_data}")
 
     # Handle the "display" command
     elif args.command == "display":
         # Display records in the specified format
         print(f"Displaying records in {args.format} format:")
-        api.display_records(output_format=args.format)
+        if args.limit is None and args.after is None and not args.offset:
+            api.display_records(output_format=args.format)
+        else:
+            # Display a single page of records, sorted by the requested key
+            try:
+                page = api.get_records(after=args.after, limit=100 if args.limit is None else args.limit,
+                                       order_by=args.order_by, offset=args.offset)
+            except ValueError as e:
+                parser.error(str(e))
+            if page.records:
+                api.display_records(output_format=args.format, records=page.records)
+            else:
+                print("No records found.")
+            print_next_page(page)
 
     # Handle the "convert" command
     elif args.command == "convert":
-        # Convert the dataset to the specified format
-        print(f"Converting dataset to {args.format} format:")
-        if args.preview:
-            print(f"Previewing data in {args.format} format:")
-            api.convert_dataset(output_format=args.format)
-        elif args.output:
-            api.convert_dataset(output_format=args.format, file_path=args.output)
-        else:
+        # Convert the dataset to the specified format(s)
+        output_formats = [fmt for value in args.format for fmt in value.split(",") if fmt]
+        if args.workers > 1 and len(output_formats) > 1:
+            parser.error("--workers only applies to a single format. Several formats are already exported in "
+                         "parallel, one process per format.")
+        formats = ", ".join(output_formats)
+        print(f"Converting dataset to {formats} format:")
+        format_options = {}
+        if args.compact:
+            format_options["xml"] = {"pretty": False}
+        if args.yaml_documents:
+            format_options["yaml"] = {"multi_document": True}
+        if not args.preview and not args.output:
             parser.error("Either --preview or --output must be specified.")
+        try:
+            if args.preview:
+                print(f"Previewing data in {formats} format:")
+                api.convert_dataset(output_format=output_formats, preview=True, format_options=format_options,
+                                    since=args.since)
+            else:
+                api.convert_dataset(output_format=output_formats, file_path=args.output, workers=args.workers,
+                                    format_options=format_options,
+                                    compression=args.compress, compression_level=args.level, since=args.since)
+        except ValueError as e:
+            print(f"Error: {e}")
 
     # Handle the "filter" command
     elif args.command == "filter":
         # Filter the records based on the search criteria and display the results
-        if args.pattern:
-            if "*" in args.pattern or "?" in args.pattern:
-                records = api.filter_records(field=args.field, pattern=args.pattern, use_glob=True)
-            else:
-                records = api.filter_records(field=args.field, pattern=args.pattern)
+        pattern = args.pattern or ""
+        use_glob = "*" in pattern or "?" in pattern
+
+        # Display the query plan to confirm whether the filter is answered using an index
+        if args.explain:
+            query_plan = api.explain_filter(field=args.field, pattern=pattern, use_glob=use_glob)
+            indexed = any("USING" in step and "INDEX" in step for step in query_plan)
+            print(f"Query plan ({'indexed' if indexed else 'full table scan'}):")
+            for step in query_plan:
+                print(f"  {step}")
+
+        if args.limit is None and args.after is None and not args.offset:
+            records = api.filter_records(field=args.field, pattern=pattern, use_glob=use_glob)
+            page = None
         else:
-            records = api.filter_records(field=args.field)
+            # Filter a single page of records, sorted by the filtered field
+            try:
+                page = api.filter_page(field=args.field, pattern=pattern, use_glob=use_glob, after=args.after,
+                                       limit=100 if args.limit is None else args.limit, offset=args.offset)
+            except ValueError as e:
+                parser.error(str(e))
+            records = page.records
 
         if not records:
             print(f"No records found with field '{args.field}' matching pattern '{args.pattern}'")
         else:
             for record in records:
                 print(f"{record.name}, {record.address}, {record.phone_number}")
+        if page is not None:
+            print_next_page(page)
+
+    # Handle the "search" command
+    elif args.command == "search":
+        # Build the full-text index on first use
+        if not api.full_text_index.exists():
+            print("Building the full-text index...")
+            api.enable_full_text_search()
+
+        mode = "prefix" if args.prefix else "phrase" if args.phrase else "token"
+        try:
+            records = api.search(args.query, mode=mode, limit=args.limit, field=args.field)
+        except ValueError as e:
+            parser.error(str(e))
+
+        if not records:
+            print(f"No records found matching '{args.query}'")
+        else:
+            for record in records:
+                print(f"{record.name}, {record.address}, {record.phone_number}")
+
+    # Handle the "import" command
+    elif args.command == "import":
+        # Detect compressed files from their extension, or from their first bytes
+        compression = compression_from_extension(args.input)
+        base_name = os.path.splitext(args.input)[0] if compression is not None else args.input
+        if compression is None:
+            try:
+                compression = sniff_compression(args.input)
+            except OSError as e:
+                print(f"Error reading {args.input}: {e}")
+                return
+
+        # Infer the input format from the file extension unless it was given explicitly
+        input_format = args.format
+        if input_format is None:
+            extension = os.path.splitext(base_name)[1][1:].lower()
+            input_format = FORMAT_EXTENSIONS.get(extension, extension)
+
+        try:
+            serializer = SerializerFactory.get_serializer_instance(input_format)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        if serializer is None:
+            parser.error(f"{input_format} is not a supported serialization format.")
+
+        # Stream the deserialized records into the dataset in batches
+        compressed = f", {compression}-compressed" if compression is not None else ""
+        print(f"Importing records from {args.input} in {input_format} format{compressed}:")
+        mode = "rb" if serializer.binary else "r"
+        try:
+            if compression is not None:
+                f = open_decompressed(args.input, mode, compression)
+            else:
+                f = open(args.input, mode) if serializer.binary else open(args.input, mode, newline="")
+            with f:
+                # Report the invalid records of each batch and carry on with the next ones
+                serializer.keep_invalid = True
+                report = api.add_records(serializer.deserialize_iter(f), batch_size=args.batch_size)
+        except OSError as e:
+            print(f"Error reading {args.input}: {e}")
+            return
+
+        if report.error is not None:
+            print(f"Error parsing {args.input}, the records after the error were not imported: {report.error}")
+        for batch_number, count, error in report.invalid_batches:
+            print(f"Batch {batch_number}: {count} invalid records skipped, such as: {error}")
+        for batch_number, batch_size, error in report.failed_batches:
+            print(f"Batch {batch_number} ({batch_size} records) failed: {error}")
+        print(f"Imported {report.inserted} records in {report.elapsed:.2f}s "
+              f"({report.rows_per_second:.0f} rows/sec), {report.failed} records failed.")
+
+    # Handle the "migrate" command
+    elif args.command == "migrate":
+        migrator = api.migrator
+        print(f"Schema version: {migrator.current_version()} (latest: {migrator.latest_version})")
+        if args.status:
+            for migration in migrator.pending():
+                print(f"Pending migration {migration}")
+            return
+
+        # Report the rows copied by batched migrations on a single, updated line
+        copied_rows = []
+
+        def report_progress(copied: int, rejected: int) -> None:
+            copied_rows.append((copied, rejected))
+            print(f"  {copied} rows copied, {rejected} rows rejected", end="\r")
+
+        applied = api.migrate(batch_size=args.batch_size, progress=report_progress)
+        if copied_rows:
+            print()
+        for migration in applied:
+            print(f"Applied migration {migration}")
+        if copied_rows and copied_rows[-1][1]:
+            print(f"{copied_rows[-1][1]} records with an empty field or a duplicate phone number were moved to the "
+                  "personal_data_rejected table. Fix them and add them again.")
+        if not applied:
+            print("The database schema is up to date.")
+
+    # Handle the "formats" command
+    elif args.command == "formats":
+        if args.refresh:
+            discover_entry_points(refresh=True)
+            SerializerFactory.registry.clear()
+            DisplayFormatterFactory.registry.clear()
+
+        for title, registry in (("Serialization formats", SerializerFactory.registry),
+                                ("Display formats", DisplayFormatterFactory.registry)):
+            print(f"{title}:")
+            plugins = registry.plugins()
+            for name in registry.names():
+                print(f"  {name} (plugin {plugins[name]})" if name in plugins else f"  {name}")
 
     # Display the help message if an invalid command is entered
     else:
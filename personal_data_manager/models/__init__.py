@@ -0,0 +1,2 @@
+from .personal_data import InvalidRecord, PersonalData
+from .record_batch import RecordBatch, RecordView, iter_chunks, iter_rows
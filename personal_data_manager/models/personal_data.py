@@ -1,4 +1,9 @@
 import re
+import sqlite3
+from typing import Any, Sequence
+
+# The format phone numbers must be in, ###-###-####
+PHONE_NUMBER_PATTERN = re.compile(r"^\d{3}-\d{3}-\d{4}$")
 
 
 class PersonalData:
@@ -11,6 +16,9 @@ class PersonalData:
         phone_number (str): The phone number of the person.
     """
 
+    # Records are stored in slots rather than a per-instance __dict__ to reduce their memory footprint
+    __slots__ = ("name", "address", "phone_number")
+
     def __init__(self, name: str, address: str, phone_number: str) -> None:
         """Initializes a PersonalData object with the provided attributes.
 
@@ -41,7 +49,7 @@ class PersonalData:
             raise ValueError("Phone number cannot be empty")
 
         # Check if the phone number is in the correct format
-        if not re.match(r"^\d{3}-\d{3}-\d{4}$", phone_number):
+        if not PHONE_NUMBER_PATTERN.match(phone_number):
             raise ValueError("Phone number must be in the format ###-###-####")
 
         # Set the attributes
@@ -49,6 +57,39 @@ class PersonalData:
         self.address = address
         self.phone_number = phone_number
 
+    @classmethod
+    def from_row(cls, row: Sequence[str]) -> "PersonalData":
+        """Creates a PersonalData object from trusted values without validating them.
+
+        Only use it for values that were already validated, such as rows read back from the database,
+        which only contains records that passed validation on insert.
+
+        Args:
+            row (Sequence[str]): The name, address and phone number of the person.
+
+        Returns:
+            PersonalData: The PersonalData object.
+        """
+        record = _new_instance(cls)
+        record.name, record.address, record.phone_number = row
+        return record
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> "PersonalData":
+        """An SQLite row factory returning trusted rows as PersonalData objects, as from_row() does.
+
+        Assign it to the row_factory attribute of a cursor whose query selects the name, address and
+        phone_number columns, in that order.
+
+        Args:
+            cursor (sqlite3.Cursor): The cursor the row was fetched from.
+            row (tuple): The name, address and phone number of the person.
+
+        Returns:
+            PersonalData: The PersonalData object.
+        """
+        return cls.from_row(row)
+
     def __repr__(self) -> str:
         """Returns a string representation of the PersonalData object.
 
@@ -68,3 +109,37 @@ class PersonalData:
             "address": self.address,
             "phone_number": self.phone_number,
         }
+
+
+class InvalidRecord:
+    """
+    A deserialized record that failed validation, reported by bulk imports instead of being added.
+
+    Attributes:
+        data (Any): The deserialized data of the record, such as its fields or the line it was read from.
+        error (str): The validation error.
+    """
+
+    __slots__ = ("data", "error")
+
+    def __init__(self, data: Any, error: str) -> None:
+        """Initializes an InvalidRecord object.
+
+        Args:
+            data (Any): The deserialized data of the record.
+            error (str): The validation error.
+        """
+        self.data = data
+        self.error = error
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the InvalidRecord object.
+
+        Returns:
+            str: A string representation of the InvalidRecord object.
+        """
+        return f"InvalidRecord({self.data!r}, {self.error!r})"
+
+
+# Allocates an instance without calling __init__
+_new_instance = object.__new__
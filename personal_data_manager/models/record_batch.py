@@ -0,0 +1,292 @@
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .personal_data import PersonalData
+
+
+class RecordView:
+    """
+    A read-only view of one row of a RecordBatch.
+
+    It exposes the same attributes as PersonalData without copying the values out of the batch columns.
+
+    Attributes:
+        name (str): The name of the person.
+        address (str): The address of the person.
+        phone_number (str): The phone number of the person.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "RecordBatch", index: int) -> None:
+        """Initializes a view of a row of a batch.
+
+        Args:
+            batch (RecordBatch): The batch holding the row.
+            index (int): The index of the row in the batch.
+        """
+        self._batch = batch
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        """str: The name of the person."""
+        return self._batch.names[self._index]
+
+    @property
+    def address(self) -> str:
+        """str: The address of the person."""
+        return self._batch.addresses[self._index]
+
+    @property
+    def phone_number(self) -> str:
+        """str: The phone number of the person."""
+        return self._batch.phone_numbers[self._index]
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the row, in the same format as PersonalData.
+
+        Returns:
+            str: A string representation of the row.
+        """
+        return f"{self.name}, {self.address}, {self.phone_number}"
+
+    def to_dict(self) -> dict:
+        """Converts the row to a dictionary.
+
+        Returns:
+            dict: A dictionary representation of the row.
+        """
+        return {
+            "name": self.name,
+            "address": self.address,
+            "phone_number": self.phone_number,
+        }
+
+    def to_record(self) -> PersonalData:
+        """Copies the row to a standalone PersonalData object.
+
+        Returns:
+            PersonalData: The PersonalData object.
+        """
+        return PersonalData.from_row((self.name, self.address, self.phone_number))
+
+
+class RecordBatch:
+    """
+    A columnar batch of personal data records.
+
+    The three fields are stored in parallel column lists instead of one object per record, which keeps bulk
+    operations on many records cheap. Iterating or indexing a batch returns RecordView objects that behave
+    like PersonalData, and rows() returns plain tuples for code that does not need objects at all.
+    The values are trusted: like PersonalData.from_row(), a batch does not validate them.
+
+    Attributes:
+        names (List[str]): The names of the persons.
+        addresses (List[str]): The addresses of the persons.
+        phone_numbers (List[str]): The phone numbers of the persons.
+    """
+
+    __slots__ = ("names", "addresses", "phone_numbers")
+
+    def __init__(self, names: Optional[List[str]] = None, addresses: Optional[List[str]] = None,
+                 phone_numbers: Optional[List[str]] = None) -> None:
+        """Initializes a batch from its columns.
+
+        Args:
+            names (List[str]): The names of the persons (default: empty).
+            addresses (List[str]): The addresses of the persons (default: empty).
+            phone_numbers (List[str]): The phone numbers of the persons (default: empty).
+
+        Raises:
+            ValueError: If the columns do not have the same length.
+        """
+        self.names = [] if names is None else names
+        self.addresses = [] if addresses is None else addresses
+        self.phone_numbers = [] if phone_numbers is None else phone_numbers
+
+        if not len(self.names) == len(self.addresses) == len(self.phone_numbers):
+            raise ValueError("All columns of a record batch must have the same length")
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[str]]) -> "RecordBatch":
+        """Creates a batch from rows of (name, address, phone_number), such as database rows.
+
+        Args:
+            rows (Iterable[Sequence[str]]): The rows.
+
+        Returns:
+            RecordBatch: The batch.
+        """
+        columns = list(zip(*rows))
+        if not columns:
+            return cls()
+        names, addresses, phone_numbers = columns
+        return cls(list(names), list(addresses), list(phone_numbers))
+
+    @classmethod
+    def from_records(cls, records: Iterable[PersonalData]) -> "RecordBatch":
+        """Creates a batch from PersonalData-like objects.
+
+        Args:
+            records (Iterable[PersonalData]): The records.
+
+        Returns:
+            RecordBatch: The batch.
+        """
+        return cls.from_rows((record.name, record.address, record.phone_number) for record in records)
+
+    @classmethod
+    def concat(cls, batches: Iterable["RecordBatch"]) -> "RecordBatch":
+        """Creates a batch holding the rows of several batches, in order.
+
+        Args:
+            batches (Iterable[RecordBatch]): The batches.
+
+        Returns:
+            RecordBatch: The batch.
+        """
+        result = cls()
+        for batch in batches:
+            result.names.extend(batch.names)
+            result.addresses.extend(batch.addresses)
+            result.phone_numbers.extend(batch.phone_numbers)
+        return result
+
+    def append(self, name: str, address: str, phone_number: str) -> None:
+        """Appends a row to the batch.
+
+        Args:
+            name (str): The name of the person.
+            address (str): The address of the person.
+            phone_number (str): The phone number of the person.
+        """
+        self.names.append(name)
+        self.addresses.append(address)
+        self.phone_numbers.append(phone_number)
+
+    def extend(self, rows: Iterable[Sequence[str]]) -> None:
+        """Appends rows of (name, address, phone_number) to the batch.
+
+        Args:
+            rows (Iterable[Sequence[str]]): The rows.
+        """
+        for name, address, phone_number in rows:
+            self.append(name, address, phone_number)
+
+    def rows(self) -> Iterator[Tuple[str, str, str]]:
+        """Iterates over the rows of the batch as (name, address, phone_number) tuples.
+
+        Returns:
+            Iterator[Tuple[str, str, str]]: The rows.
+        """
+        return zip(self.names, self.addresses, self.phone_numbers)
+
+    def to_records(self) -> List[PersonalData]:
+        """Copies the batch to a list of PersonalData objects.
+
+        Returns:
+            List[PersonalData]: The records.
+        """
+        return [PersonalData.from_row(row) for row in self.rows()]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[RecordView]:
+        return (RecordView(self, index) for index in range(len(self.names)))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[RecordView, "RecordBatch"]:
+        """Gets a view of a row, or a new batch holding a slice of the rows.
+
+        Args:
+            index (Union[int, slice]): The index of the row, or a slice of rows.
+
+        Returns:
+            Union[RecordView, RecordBatch]: A view of the row, or a batch of the sliced rows.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return RecordBatch(self.names[index], self.addresses[index], self.phone_numbers[index])
+
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError("Record batch index out of range")
+        return RecordView(self, index)
+
+    def __repr__(self) -> str:
+        return f"RecordBatch({len(self)} records)"
+
+
+def iter_rows(records: Union[RecordBatch, Iterable[PersonalData], Iterable[RecordBatch]]
+              ) -> Iterator[Tuple[str, str, str]]:
+    """
+    Iterate over records as (name, address, phone_number) tuples.
+
+    Batches are read column-wise without creating a view per row, including the batches of a stream of
+    batches such as the chunks read from a database cursor. Other iterables are read attribute-wise.
+
+    Args:
+        records (Union[RecordBatch, Iterable[PersonalData], Iterable[RecordBatch]]): A batch, PersonalData-like
+                                                                                    objects or batches.
+
+    Returns:
+        Iterator[Tuple[str, str, str]]: The rows.
+    """
+    if isinstance(records, RecordBatch):
+        return records.rows()
+
+    iterator = iter(records)
+    first = next(iterator, None)
+    if first is None:
+        return iter(())
+
+    # Read the batches of a stream of batches column-wise, one batch at a time
+    if isinstance(first, RecordBatch):
+        return chain.from_iterable(batch.rows() for batch in chain([first], iterator))
+    return ((record.name, record.address, record.phone_number) for record in chain([first], iterator))
+
+
+def iter_chunks(records: Union[RecordBatch, Iterable[PersonalData], Iterable[RecordBatch]],
+                chunk_size: int) -> Iterator[Union[RecordBatch, List[PersonalData]]]:
+    """
+    Split records into non-empty chunks.
+
+    A batch is split into batches of at most chunk_size rows. An iterable whose first item is a batch is
+    treated as a stream of batches, such as the chunks read from a database cursor, and its non-empty
+    batches are returned as they are. Any other iterable is split into lists of at most chunk_size records.
+
+    Args:
+        records (Union[RecordBatch, Iterable[PersonalData], Iterable[RecordBatch]]): The records.
+        chunk_size (int): The maximum number of records per chunk of a batch or a list.
+
+    Yields:
+        Union[RecordBatch, List[PersonalData]]: The chunks.
+    """
+    if isinstance(records, RecordBatch):
+        for start in range(0, len(records), chunk_size):
+            yield records[start:start + chunk_size]
+        return
+
+    iterator = iter(records)
+    first = next(iterator, None)
+    if first is None:
+        return
+
+    # Pass the batches of a stream of batches through
+    if isinstance(first, RecordBatch):
+        for batch in chain([first], iterator):
+            if len(batch):
+                yield batch
+        return
+
+    chunk = [first]
+    for record in iterator:
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+        chunk.append(record)
+    yield chunk
@@ -0,0 +1,252 @@
+import importlib
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# The entry point groups under which distributions register additional formats
+SERIALIZER_GROUP = "personal_data_manager.serializers"
+DISPLAY_FORMATTER_GROUP = "personal_data_manager.display_formatters"
+ENTRY_POINT_GROUPS = (SERIALIZER_GROUP, DISPLAY_FORMATTER_GROUP)
+
+# The environment variable overriding the path of the entry point cache, or disabling it when empty
+CACHE_PATH_VARIABLE = "PDM_PLUGIN_CACHE"
+
+# The entry points found by the last discovery, and the lock serializing discoveries
+_discovered: Optional[Dict[str, Dict[str, str]]] = None
+_discovery_lock = threading.Lock()
+
+
+def default_cache_path() -> Optional[str]:
+    """
+    Get the path of the file caching the discovered entry points.
+
+    Returns:
+        Optional[str]: The value of PDM_PLUGIN_CACHE if it is set, None if it is set but empty, or
+                       entry_points.json in the personal_data_manager user cache directory otherwise.
+    """
+    if CACHE_PATH_VARIABLE in os.environ:
+        return os.environ[CACHE_PATH_VARIABLE] or None
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "personal_data_manager", "entry_points.json")
+
+
+def _environment_key() -> List[list]:
+    """
+    Private helper function to identify the installed distributions.
+
+    Installing or removing a distribution adds or removes its metadata directory in a sys.path entry, which
+    changes the modification time of that entry, so the key changes whenever the entry points may have.
+
+    Returns:
+        List[list]: The Python version, then each sys.path entry with its modification time.
+    """
+    key = [list(sys.version_info[:2])]
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        key.append([path, mtime])
+    return key
+
+
+def _scan_entry_points() -> Dict[str, Dict[str, str]]:
+    """
+    Private helper function to read the entry points of every installed distribution.
+
+    Returns:
+        Dict[str, Dict[str, str]]: The "module:attribute" value of each entry point name, for each group.
+    """
+    # importlib.metadata is slow to import and to scan, so it is only used when the cache is stale
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return {group: {} for group in ENTRY_POINT_GROUPS}
+
+    all_entry_points = entry_points()
+    discovered = {}
+    for group in ENTRY_POINT_GROUPS:
+        if hasattr(all_entry_points, "select"):
+            selected = all_entry_points.select(group=group)
+        else:
+            selected = all_entry_points.get(group, [])
+
+        # The first distribution on sys.path wins, as it does for imports
+        discovered[group] = {}
+        for entry_point in selected:
+            discovered[group].setdefault(entry_point.name, entry_point.value)
+    return discovered
+
+
+def discover_entry_points(cache_path: Optional[str] = None, refresh: bool = False) -> Dict[str, Dict[str, str]]:
+    """
+    Discover the formats registered by installed distributions.
+
+    Scanning the metadata of every distribution takes tens of milliseconds, so the result is cached in
+    memory and in a file, keyed by the sys.path entries and their modification times. The scan only runs
+    again when a distribution was installed or removed.
+
+    Args:
+        cache_path (str): The path of the cache file (default: the path returned by default_cache_path()).
+        refresh (bool): Whether to ignore the cached entry points (default: False).
+
+    Returns:
+        Dict[str, Dict[str, str]]: The "module:attribute" value of each entry point name, for each group.
+    """
+    global _discovered
+
+    with _discovery_lock:
+        if _discovered is not None and not refresh:
+            return _discovered
+
+        import json
+
+        if cache_path is None:
+            cache_path = default_cache_path()
+        key = _environment_key()
+
+        # Use the cached entry points if the installed distributions did not change
+        if cache_path is not None and not refresh:
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache["key"] == key:
+                    _discovered = {group: dict(cache["entry_points"].get(group, {}))
+                                   for group in ENTRY_POINT_GROUPS}
+                    return _discovered
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                pass
+
+        _discovered = _scan_entry_points()
+
+        # Cache the entry points, replacing the file atomically; an unwritable cache only costs a scan
+        if cache_path is not None:
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump({"key": key, "entry_points": _discovered}, f)
+                os.replace(temp_path, cache_path)
+            except OSError:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+        return _discovered
+
+
+class PluginRegistry:
+    """
+    The classes implementing each format of a kind, such as serializers.
+
+    The built-in formats are listed with the module of the package implementing them, and more formats are
+    registered by installed distributions under an entry point group, for example in setup.py:
+
+        entry_points={"personal_data_manager.serializers": ["parquet = inhouse_formats.parquet:ParquetSerializer"]}
+
+    Entry points are only discovered when a format is not built in or all the formats are listed, and a
+    module is only imported when its format is first used. Built-in formats take precedence over plugins
+    of the same name.
+    """
+
+    def __init__(self, group: str, package: str, builtins: Dict[str, Tuple[str, str]], base_class: type) -> None:
+        """
+        Initializes the registry.
+
+        Args:
+            group (str): The entry point group of the plugins.
+            package (str): The package holding the modules of the built-in formats.
+            builtins (Dict[str, Tuple[str, str]]): The module, relative to the package, and the class name
+                                                    of each built-in format.
+            base_class (type): The class every implementation must derive from.
+        """
+        self.group = group
+        self.package = package
+        self.builtins = builtins
+        self.base_class = base_class
+
+        # The classes of the formats used so far
+        self._classes: Dict[str, type] = {}
+
+    def get_class(self, name: str) -> type:
+        """
+        Get the class implementing a format, importing its module on first use.
+
+        Args:
+            name (str): The name of the format.
+
+        Returns:
+            type: The class implementing the format.
+
+        Raises:
+            KeyError: If no built-in format or plugin has this name.
+            ValueError: If the plugin cannot be loaded or does not derive from the base class.
+        """
+        cls = self._classes.get(name)
+        if cls is not None:
+            return cls
+
+        if name in self.builtins:
+            module_name, class_name = self.builtins[name]
+            cls = getattr(importlib.import_module(f".{module_name}", self.package), class_name)
+        else:
+            target = discover_entry_points()[self.group][name]
+            cls = self._load(name, target)
+
+        self._classes[name] = cls
+        return cls
+
+    def names(self) -> List[str]:
+        """
+        Get the names of every format, without importing their modules.
+
+        Returns:
+            List[str]: The built-in formats, followed by the formats of the plugins.
+        """
+        plugins = discover_entry_points()[self.group]
+        return [*self.builtins, *(name for name in plugins if name not in self.builtins)]
+
+    def plugins(self) -> Dict[str, str]:
+        """
+        Get the formats registered by plugins.
+
+        Returns:
+            Dict[str, str]: The "module:attribute" target of each plugin format not shadowed by a built-in one.
+        """
+        plugins = discover_entry_points()[self.group]
+        return {name: target for name, target in plugins.items() if name not in self.builtins}
+
+    def clear(self) -> None:
+        """
+        Forget the classes loaded so far, e.g. after the plugins were rediscovered.
+        """
+        self._classes.clear()
+
+    def _load(self, name: str, target: str) -> type:
+        """
+        Private helper method to import the class of a plugin.
+
+        Args:
+            name (str): The name of the format.
+            target (str): The "module:attribute" value of the entry point.
+
+        Returns:
+            type: The class of the plugin.
+
+        Raises:
+            ValueError: If the class cannot be imported or does not derive from the base class.
+        """
+        module_name, _, attribute = target.partition(":")
+        try:
+            cls = importlib.import_module(module_name.strip())
+            for part in attribute.strip().split(".") if attribute else []:
+                cls = getattr(cls, part)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Cannot load the {name} format plugin from {target}: {type(e).__name__}: {e}") from e
+
+        if not isinstance(cls, type) or not issubclass(cls, self.base_class):
+            raise ValueError(f"The {name} format of {target} is not a subclass of {self.base_class.__name__}.")
+        return cls
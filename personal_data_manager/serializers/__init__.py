@@ -1,8 +1,35 @@
+import importlib
+
 from .base_ser import BaseSerializer
-from .csv_ser import CSVSerializer
-from .json_ser import JSONSerializer
-from .xml_ser import XMLSerializer
-from .yaml_ser import YAMLSerializer
-from .text_ser import TextSerializer
-from .html_ser import HTMLSerializer
 from .ser_factory import SerializerFactory
+
+# The serializer classes exported by the package, imported from their modules on first access
+_LAZY_CLASSES = {class_name: module_name for module_name, class_name in SerializerFactory.SERIALIZERS.values()}
+
+__all__ = ["BaseSerializer", "SerializerFactory", *_LAZY_CLASSES]
+
+
+def __getattr__(name: str):
+    """
+    Import a serializer class when it is first accessed.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        type: The serializer class.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+    """
+    module_name = _LAZY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_CLASSES))
@@ -1,19 +1,43 @@
-from typing import List, NoReturn
+from typing import Any, Iterable, Iterator, List, NoReturn, TextIO, Union
 
-from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.personal_data import InvalidRecord, PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_chunks
+from personal_data_manager.streams import ChunkWriter
+
+# The records accepted by the serializers: PersonalData-like objects, a batch, or a stream of batches
+Records = Union[RecordBatch, Iterable[PersonalData], Iterable[RecordBatch]]
 
 
 class BaseSerializer:
     """
     The base class for all serializers. It defines the interface for serialization and deserialization.
+
+    Serialization is streamed: a document is made of a header, the records serialized in chunks joined by
+    the record separator, and a footer. Subclasses implement serialize_chunk() and override the header,
+    footer and separator as needed; serialize(), serialize_iter() and write_to() are built on top of them.
+    Chunks are either lists of PersonalData-like objects or RecordBatch objects; use iter_rows() to read
+    both as tuples.
     """
 
-    def serialize(self, records: List[PersonalData]) -> NoReturn:
+    # Whether the serialized document is made of bytes, written to and read from files opened in binary mode
+    binary = False
+
+    # The string written between two serialized chunks of records
+    record_separator = ""
+
+    # The number of records serialized per chunk
+    chunk_size = 1000
+
+    # Whether deserialize_iter() yields an InvalidRecord for each record failing validation, instead of raising
+    # a ValueError that ends the iteration, so that the following records are still read
+    keep_invalid = False
+
+    def serialize(self, records: Records) -> str:
         """
         Serialize a list of records.
 
         Args:
-            records (List[PersonalData]): A list of PersonalData objects.
+            records (Records): A list of PersonalData objects, a RecordBatch or a stream of RecordBatch objects.
 
         Returns:
             str: Serialized records.
@@ -21,10 +45,106 @@ class BaseSerializer:
         Raises:
             ValueError: If no records are found to serialize.
         """
-        if not records:
+        return "".join(self.serialize_iter(records))
+
+    def serialize_iter(self, records: Records) -> Iterator[str]:
+        """
+        Serialize records lazily, yielding the serialized document in chunks.
+
+        Only one chunk of records is held in memory at a time, so any iterable of records, such as a database
+        cursor, can be serialized in constant memory.
+
+        Args:
+            records (Records): The records to serialize, as PersonalData objects, a RecordBatch or a stream of
+                               RecordBatch objects.
+
+        Yields:
+            str: Consecutive pieces of the serialized document.
+
+        Raises:
+            ValueError: If no records are found to serialize.
+        """
+        chunks = iter_chunks(records, self.chunk_size)
+        chunk = next(chunks, None)
+        if chunk is None:
             # Raise an error if no records are found to serialize
             raise ValueError("No records found to serialize")
 
+        yield self.serialize_header()
+        yield self.serialize_chunk(chunk)
+        for chunk in chunks:
+            yield self.record_separator
+            yield self.serialize_chunk(chunk)
+        yield self.serialize_footer()
+
+    def write_to(self, stream: TextIO, records: Records) -> None:
+        """
+        Serialize records directly to a writable text stream.
+
+        Args:
+            stream (TextIO): A writable text stream, such as an open file or sys.stdout.
+            records (Records): The records to serialize.
+
+        Raises:
+            ValueError: If no records are found to serialize.
+        """
+        # Coalesce the header, the chunks and the footer into large writes
+        with ChunkWriter(stream) as writer:
+            writer.writelines(self.serialize_iter(records))
+
+    def write_fragment(self, stream: TextIO, records: Records) -> bool:
+        """
+        Serialize records to a writable text stream as a document fragment, without header and footer.
+
+        Fragments of consecutive partitions of the records can be stitched into a complete document by
+        writing the header, the non-empty fragments joined by the record separator, and the footer.
+
+        Args:
+            stream (TextIO): A writable text stream.
+            records (Records): The records to serialize.
+
+        Returns:
+            bool: True if at least one record was written.
+        """
+        written = False
+        for chunk in iter_chunks(records, self.chunk_size):
+            if written:
+                stream.write(self.record_separator)
+            stream.write(self.serialize_chunk(chunk))
+            written = True
+
+        return written
+
+    def serialize_header(self) -> str:
+        """
+        Get the text written before the first record.
+
+        Returns:
+            str: The document header (empty by default).
+        """
+        return ""
+
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> NoReturn:
+        """
+        Serialize a chunk of records, joining them with the record separator.
+
+        Args:
+            records (Union[List[PersonalData], RecordBatch]): A non-empty list of PersonalData objects or batch.
+
+        Returns:
+            str: The serialized records.
+        """
+        raise NotImplementedError("serialize_chunk method not implemented.")
+
+    def serialize_footer(self) -> str:
+        """
+        Get the text written after the last record.
+
+        Returns:
+            str: The document footer (empty by default).
+        """
+        return ""
+
     def deserialize(self, serialized_records: str) -> NoReturn:
         """
         Deserialize records from a serialized format.
@@ -41,3 +161,86 @@ class BaseSerializer:
         if not serialized_records:
             # Raise an error if no records are found to deserialize
             raise ValueError("No records found to deserialize")
+
+    def deserialize_iter(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from a readable text stream, yielding them one at a time.
+
+        The default implementation reads the whole stream and delegates to deserialize(). Serializers whose
+        format can be parsed incrementally override it to keep memory usage independent of the input size.
+
+        Args:
+            stream (TextIO): A readable text stream containing serialized records.
+
+        Yields:
+            PersonalData: The deserialized records, or InvalidRecord objects for the invalid ones if keep_invalid
+                          is set.
+
+        Raises:
+            ValueError: If no records are found to deserialize.
+        """
+        yield from self.deserialize(stream.read())
+
+    def _new_record(self, name: Any, address: Any, phone_number: Any) -> Union[PersonalData, InvalidRecord]:
+        """
+        Private helper method to create a deserialized record, validating its fields.
+
+        Args:
+            name (Any): The deserialized name.
+            address (Any): The deserialized address.
+            phone_number (Any): The deserialized phone number.
+
+        Returns:
+            Union[PersonalData, InvalidRecord]: The record, or an InvalidRecord if the fields are not valid and
+                                                keep_invalid is set.
+
+        Raises:
+            ValueError: If the fields are not valid and keep_invalid is not set.
+            TypeError: If a field is not a string and keep_invalid is not set.
+        """
+        try:
+            return PersonalData(name, address, phone_number)
+        except (ValueError, TypeError) as e:
+            return self._invalid_record((name, address, phone_number), e)
+
+    def _record_from_mapping(self, record_data: Any) -> Union[PersonalData, InvalidRecord]:
+        """
+        Private helper method to create a deserialized record from a dictionary of its fields.
+
+        Args:
+            record_data (Any): The deserialized dictionary, with name, address and phone_number keys.
+
+        Returns:
+            Union[PersonalData, InvalidRecord]: The record, or an InvalidRecord if the dictionary is not a valid
+                                                record and keep_invalid is set.
+
+        Raises:
+            ValueError: If the dictionary is not a valid record and keep_invalid is not set.
+            TypeError: If a field is not a string and keep_invalid is not set.
+        """
+        try:
+            fields = (record_data["name"], record_data["address"], record_data["phone_number"])
+        except KeyError as e:
+            return self._invalid_record(record_data, ValueError(f"Missing required field: {e}"))
+        except (TypeError, IndexError):
+            return self._invalid_record(record_data, ValueError("Invalid record: expected name, address and "
+                                                                "phone_number fields"))
+        return self._new_record(*fields)
+
+    def _invalid_record(self, data: Any, error: Exception) -> InvalidRecord:
+        """
+        Private helper method to report a record that failed validation.
+
+        Args:
+            data (Any): The deserialized data of the record.
+            error (Exception): The validation error.
+
+        Returns:
+            InvalidRecord: The invalid record, if keep_invalid is set.
+
+        Raises:
+            Exception: The validation error, if keep_invalid is not set.
+        """
+        if not self.keep_invalid:
+            raise error
+        return InvalidRecord(data, str(error))
@@ -0,0 +1,433 @@
+import mmap
+import struct
+import zlib
+from bisect import bisect_right
+from itertools import accumulate
+from typing import BinaryIO, Iterator, List, Tuple, Union
+
+from .base_ser import BaseSerializer, Records
+from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_rows
+
+# The file header: the magic number, the version of the format and two reserved bytes
+FILE_HEADER = struct.Struct("<4sHH")
+MAGIC = b"PDMB"
+VERSION = 1
+
+# The block header: the number of records, the payload size, the CRC-32 of the payload and the size of the
+# field lengths in bytes, padded to 16 bytes. A block of zero records marks the end of the file.
+BLOCK_HEADER = struct.Struct("<IIIB3x")
+
+# The struct format code of the field lengths of each size
+_LENGTH_CODES = {1: "B", 2: "H", 4: "I"}
+
+
+def _length_size(largest: int) -> int:
+    """
+    Private helper function to choose the size of the field lengths of a block.
+
+    Args:
+        largest (int): The largest field length of the block, in bytes.
+
+    Returns:
+        int: The smallest of 1, 2 or 4 bytes holding the largest length.
+
+    Raises:
+        ValueError: If a field is 4 GiB or larger.
+    """
+    if largest < 1 << 8:
+        return 1
+    if largest < 1 << 16:
+        return 2
+    if largest < 1 << 32:
+        return 4
+    raise ValueError("Fields of 4 GiB or more cannot be serialized in binary format.")
+
+
+def _decode_payload(payload: Union[bytes, memoryview], count: int, length_size: int) -> RecordBatch:
+    """
+    Private helper function to decode the payload of a block into a batch of records.
+
+    Args:
+        payload (Union[bytes, memoryview]): The payload: the length of each field, then the UTF-8 fields.
+        count (int): The number of records of the block.
+        length_size (int): The size of the field lengths, in bytes.
+
+    Returns:
+        RecordBatch: The records of the block, which are not validated.
+
+    Raises:
+        ValueError: If the payload does not match the block header.
+    """
+    code = _LENGTH_CODES.get(length_size)
+    if code is None:
+        raise ValueError(f"Invalid binary data: unknown field length size {length_size}")
+
+    field_count = 3 * count
+    lengths_size = field_count * length_size
+    try:
+        lengths = struct.unpack_from(f"<{field_count}{code}", payload)
+    except struct.error:
+        raise ValueError("Invalid binary data: truncated block")
+    data = bytes(payload[lengths_size:])
+    offsets = list(accumulate(lengths, initial=0))
+    if offsets[-1] != len(data):
+        raise ValueError("Invalid binary data: the field lengths do not match the block size")
+
+    # Decode ASCII blocks at once, as their byte offsets are also character offsets
+    if data.isascii():
+        text = data.decode("ascii")
+    else:
+        text = data
+    fields = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+    if text is data:
+        try:
+            fields = [field.decode("utf-8") for field in fields]
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Invalid binary data: {e}")
+
+    return RecordBatch(fields[0::3], fields[1::3], fields[2::3])
+
+
+def _check_file_header(header: bytes) -> None:
+    """
+    Private helper function to validate the header of a binary document.
+
+    Args:
+        header (bytes): The first bytes of the document.
+
+    Raises:
+        ValueError: If the header is missing or of another format or version.
+    """
+    if len(header) < FILE_HEADER.size:
+        raise ValueError("Invalid binary data: missing file header")
+    magic, version, _ = FILE_HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError("Invalid binary data: not a binary export of personal data")
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary format version {version}")
+
+
+class BinarySerializer(BaseSerializer):
+    """
+    A serializer for converting PersonalData objects to and from a compact binary format.
+
+    A document starts with a file header, followed by blocks of up to chunk_size records. Each block holds a
+    header with its record count, payload size and CRC-32 checksum, then a payload with the byte length of
+    every field followed by the UTF-8 fields themselves. Lengths are stored on 1, 2 or 4 bytes depending on
+    the longest field of the block. A block of zero records ends the document.
+
+    Blocks are self-contained, so they can be serialized independently and concatenated, and a reader can
+    skip from block to block using their headers alone. BinaryReader uses this for random access to the
+    blocks of a memory-mapped file.
+    """
+
+    # The serialized document is made of bytes
+    binary = True
+    record_separator = b""
+
+    def serialize(self, records: Records) -> bytes:
+        """
+        Serialize a list of records.
+
+        Args:
+            records (Records): A list of PersonalData objects, a RecordBatch or a stream of RecordBatch objects.
+
+        Returns:
+            bytes: Serialized records.
+
+        Raises:
+            ValueError: If no records are found to serialize.
+        """
+        return b"".join(self.serialize_iter(records))
+
+    def write_to(self, stream: BinaryIO, records: Records) -> None:
+        """
+        Serialize records directly to a writable binary stream.
+
+        Args:
+            stream (BinaryIO): A writable binary stream, such as a file opened in "wb" mode.
+            records (Records): The records to serialize.
+
+        Raises:
+            ValueError: If no records are found to serialize.
+        """
+        # Blocks are large enough to be written one at a time
+        stream.writelines(self.serialize_iter(records))
+
+    def serialize_header(self) -> bytes:
+        """
+        Get the file header.
+
+        Returns:
+            bytes: The magic number and the version of the format.
+        """
+        return FILE_HEADER.pack(MAGIC, VERSION, 0)
+
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> bytes:
+        """
+        Serialize a chunk of records to a block.
+
+        Args:
+            records (Union[List[PersonalData], RecordBatch]): A list of PersonalData objects or a RecordBatch.
+
+        Returns:
+            bytes: The block header and payload.
+
+        Raises:
+            ValueError: If a field is 4 GiB or larger.
+        """
+        fields = [field for row in iter_rows(records) for field in row]
+        lengths = list(map(len, fields))
+        text = "".join(fields)
+
+        # Encode ASCII chunks at once, as their character lengths are also byte lengths
+        if text.isascii():
+            data = text.encode("ascii")
+        else:
+            encoded = [field.encode("utf-8") for field in fields]
+            lengths = list(map(len, encoded))
+            data = b"".join(encoded)
+
+        length_size = _length_size(max(lengths, default=0))
+        payload = struct.pack(f"<{len(lengths)}{_LENGTH_CODES[length_size]}", *lengths) + data
+        header = BLOCK_HEADER.pack(len(fields) // 3, len(payload), zlib.crc32(payload), length_size)
+        return header + payload
+
+    def serialize_footer(self) -> bytes:
+        """
+        Get the end of the document.
+
+        Returns:
+            bytes: The header of an empty block.
+        """
+        return BLOCK_HEADER.pack(0, 0, 0, 1)
+
+    def deserialize(self, serialized_records: bytes) -> List[PersonalData]:
+        """
+        Deserialize records from the binary format.
+
+        Args:
+            serialized_records (bytes): Serialized records in binary format.
+
+        Returns:
+            List[PersonalData]: A list of deserialized PersonalData objects.
+
+        Raises:
+            ValueError: If no records are found to deserialize or if the data is corrupted.
+        """
+        # Call the base class implementation
+        super().deserialize(serialized_records)
+
+        from io import BytesIO
+        return list(self.deserialize_iter(BytesIO(serialized_records)))
+
+    def deserialize_iter(self, stream: BinaryIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from a binary stream one block at a time.
+
+        Args:
+            stream (BinaryIO): A readable binary stream containing records in binary format.
+
+        Yields:
+            PersonalData: The deserialized records.
+
+        Raises:
+            ValueError: If the data is truncated or corrupted, or a record is invalid.
+        """
+        _check_file_header(stream.read(FILE_HEADER.size))
+
+        block_number = 0
+        while True:
+            header = stream.read(BLOCK_HEADER.size)
+            if len(header) < BLOCK_HEADER.size:
+                raise ValueError("Invalid binary data: missing end of data")
+            count, size, checksum, length_size = BLOCK_HEADER.unpack(header)
+            if count == 0:
+                return
+
+            payload = stream.read(size)
+            if len(payload) < size:
+                raise ValueError(f"Invalid binary data: block {block_number} is truncated")
+            if zlib.crc32(payload) != checksum:
+                raise ValueError(f"Invalid binary data: checksum mismatch in block {block_number}")
+
+            for name, address, phone_number in iter_rows(_decode_payload(payload, count, length_size)):
+                yield self._new_record(name, address, phone_number)
+            block_number += 1
+
+
+class BinaryReader:
+    """
+    A memory-mapped reader of binary exports, giving random access to their blocks and records.
+
+    Opening a file only reads its block headers, skipping from one to the next, so any block or record can then
+    be decoded without reading the blocks before it. The records are returned as they are stored, without the
+    validation performed by BinarySerializer.deserialize(); use this class for files of a trusted origin.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """
+        Opens a binary export and reads the position of its blocks.
+
+        Args:
+            file_name (str): The path of the binary export.
+
+        Raises:
+            OSError: If the file cannot be opened.
+            ValueError: If the file is not a binary export or is truncated.
+        """
+        self._file = open(file_name, "rb")
+        try:
+            try:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError("Invalid binary data: the file is empty")
+            self._read_block_headers()
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_block_headers(self) -> None:
+        """
+        Private helper method to find the offset, header and first record of every block.
+
+        Raises:
+            ValueError: If the file is not a binary export or is truncated.
+        """
+        _check_file_header(self._map[:FILE_HEADER.size])
+
+        # The offset and header of each block, and the index of its first record
+        self._blocks = []
+        self._first_records = []
+        offset = FILE_HEADER.size
+        records = 0
+        while True:
+            if offset + BLOCK_HEADER.size > len(self._map):
+                raise ValueError("Invalid binary data: missing end of data")
+            header = BLOCK_HEADER.unpack_from(self._map, offset)
+            if header[0] == 0:
+                break
+
+            self._blocks.append((offset, header))
+            self._first_records.append(records)
+            offset += BLOCK_HEADER.size + header[1]
+            records += header[0]
+
+        self._record_count = records
+
+    @property
+    def block_count(self) -> int:
+        """int: The number of blocks of the file."""
+        return len(self._blocks)
+
+    def read_block(self, index: int) -> RecordBatch:
+        """
+        Decode a block, after verifying its checksum.
+
+        Args:
+            index (int): The index of the block.
+
+        Returns:
+            RecordBatch: The records of the block.
+
+        Raises:
+            IndexError: If there is no such block.
+            ValueError: If the block is truncated or corrupted.
+        """
+        count, length_size, payload = self._read_payload(index)
+        with payload:
+            return _decode_payload(payload, count, length_size)
+
+    def _read_payload(self, index: int) -> Tuple[int, int, memoryview]:
+        """
+        Private helper method to get the payload of a block, after verifying its checksum.
+
+        Args:
+            index (int): The index of the block.
+
+        Returns:
+            Tuple[int, int, memoryview]: The number of records and the size of the field lengths of the block,
+                                         and a view of its payload in the memory map, which must be released.
+
+        Raises:
+            IndexError: If there is no such block.
+            ValueError: If the block is truncated or corrupted.
+        """
+        offset, (count, size, checksum, length_size) = self._blocks[index]
+        start = offset + BLOCK_HEADER.size
+        if start + size > len(self._map):
+            raise ValueError(f"Invalid binary data: block {index} is truncated")
+
+        payload = memoryview(self._map)[start:start + size]
+        if zlib.crc32(payload) != checksum:
+            payload.release()
+            raise ValueError(f"Invalid binary data: checksum mismatch in block {index}")
+        if length_size not in _LENGTH_CODES:
+            payload.release()
+            raise ValueError(f"Invalid binary data: unknown field length size {length_size}")
+        return count, length_size, payload
+
+    def iter_batches(self) -> Iterator[RecordBatch]:
+        """
+        Decode every block in order.
+
+        Yields:
+            RecordBatch: The records of each block.
+        """
+        for index in range(len(self._blocks)):
+            yield self.read_block(index)
+
+    def __getitem__(self, index: int) -> PersonalData:
+        """
+        Get a record by its position in the file, decoding only the block holding it.
+
+        Args:
+            index (int): The index of the record, negative indexes counting from the end.
+
+        Returns:
+            PersonalData: The record.
+
+        Raises:
+            IndexError: If there is no such record.
+        """
+        if index < 0:
+            index += self._record_count
+        if not 0 <= index < self._record_count:
+            raise IndexError("record index out of range")
+
+        block = bisect_right(self._first_records, index) - 1
+        count, length_size, payload = self._read_payload(block)
+        with payload:
+            # Only decode the fields of the record, found by summing the lengths of the fields before them
+            field_count = 3 * count
+            lengths = struct.unpack_from(f"<{field_count}{_LENGTH_CODES[length_size]}", payload)
+            first_field = 3 * (index - self._first_records[block])
+            start = field_count * length_size + sum(lengths[:first_field])
+            fields = []
+            for length in lengths[first_field:first_field + 3]:
+                fields.append(str(payload[start:start + length], "utf-8"))
+                start += length
+        return PersonalData.from_row(fields)
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def __iter__(self) -> Iterator:
+        for batch in self.iter_batches():
+            yield from batch
+
+    def close(self) -> None:
+        """
+        Close the memory map and the file.
+        """
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "BinaryReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -1,9 +1,10 @@
 import csv
 from io import StringIO
-from typing import List
+from typing import Iterator, List, TextIO, Union
 
 from .base_ser import BaseSerializer
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_rows
 
 
 class CSVSerializer(BaseSerializer):
@@ -11,41 +12,36 @@ class CSVSerializer(BaseSerializer):
     A serializer for converting PersonalData objects to and from CSV format.
     """
 
-    def serialize(self, records: List[PersonalData]) -> str:
-        """
-        Serialize a list of PersonalData objects to CSV format.
+    # The names of the CSV columns, in the order they are written
+    fieldnames = ["name", "address", "phone_number"]
 
-        Args:
-            records (List[PersonalData]): A list of PersonalData objects.
+    def serialize_header(self) -> str:
+        """
+        Get the CSV header row.
 
         Returns:
-            str: Serialized records in CSV format.
-
-        Raises:
-            ValueError: If no records are found to serialize.
+            str: The header row in CSV format.
         """
-        # Call the base class implementation
-        super().serialize(records)
+        # Open a string buffer to write the header row
+        with StringIO() as buffer:
+            csv.writer(buffer).writerow(self.fieldnames)
+            return buffer.getvalue()
 
-        # Open a string buffer to write the CSV output
-        buffer = StringIO()
-
-        # Write the header row
-        fieldnames = ["name", "address", "phone_number"]
-        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-        writer.writeheader()
-
-        # Write each PersonalData object to the CSV buffer
-        for record in records:
-            writer.writerow(record.__dict__)
-
-        # Get the CSV output as a string
-        csv_data = buffer.getvalue()
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> str:
+        """
+        Serialize a chunk of PersonalData objects to CSV rows.
 
-        # Close the buffer and return the CSV data
-        buffer.close()
+        Args:
+            records (Union[List[PersonalData], RecordBatch]): A list of PersonalData objects or a RecordBatch.
 
-        return csv_data
+        Returns:
+            str: Serialized records in CSV format, without the header row.
+        """
+        # Open a string buffer to write the CSV rows
+        with StringIO() as buffer:
+            # Write each PersonalData object to the CSV buffer
+            csv.writer(buffer).writerows(iter_rows(records))
+            return buffer.getvalue()
 
     def deserialize(self, serialized_records: str) -> List[PersonalData]:
         """
@@ -63,25 +59,36 @@ class CSVSerializer(BaseSerializer):
         # Call the base class implementation
         super().deserialize(serialized_records)
 
-        # Open a string buffer to read the CSV data
-        buffer = StringIO(serialized_records)
+        # Open a string buffer to read the CSV data and convert its rows to a list of PersonalData objects
+        with StringIO(serialized_records) as buffer:
+            return list(self._read_records(buffer))
+
+    def deserialize_iter(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from a CSV stream one row at a time.
 
-        # Read the CSV data and convert to a list of dictionaries
-        reader = csv.DictReader(buffer)
-        csv_data = list(reader)
+        Args:
+            stream (TextIO): A readable text stream containing records in CSV format.
 
-        # Close the buffer
-        buffer.close()
+        Yields:
+            PersonalData: The deserialized records.
 
-        # Convert the list of dictionaries to a list of PersonalData objects
-        records = []
-        for record_data in csv_data:
-            try:
-                name = record_data["name"]
-                address = record_data["address"]
-                phone_number = record_data["phone_number"]
-                records.append(PersonalData(name, address, phone_number))
-            except KeyError as e:
-                raise ValueError(f"Missing required field: {e}")
+        Raises:
+            ValueError: If a row is missing a required field.
+        """
+        yield from self._read_records(stream)
 
-        return records
+    def _read_records(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Private helper method to convert the rows of a CSV stream to PersonalData objects.
+
+        Args:
+            stream (TextIO): A readable text stream containing records in CSV format.
+
+        Yields:
+            PersonalData: The deserialized records.
+        """
+        # Read the CSV data as dictionaries, one row at a time
+        reader = csv.DictReader(stream)
+        for record_data in reader:
+            yield self._record_from_mapping(record_data)
@@ -1,7 +1,98 @@
-from typing import List
+import re
+from html import escape, unescape
+from io import StringIO
+from typing import Iterator, List, TextIO, Tuple, Union
 
 from .base_ser import BaseSerializer
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_rows
+
+
+class HTMLTableParser:
+    """
+    An incremental tokenizer collecting the text of the <td> cells of each <tr> row of an HTML table.
+
+    Only the tags that delimit rows and cells are interpreted: other tags and comments are skipped and the
+    text between them is kept as the cell content, so the table layout written by HTMLSerializer is read
+    without the cost of a general HTML parser. Data can be fed in arbitrary pieces. Character references
+    are resolved, and the completed rows are kept in the rows list until the caller drains it.
+    """
+
+    # A comment, or a start or end tag with its name
+    _TOKEN = re.compile(r"<!--.*?-->|<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>", re.DOTALL)
+
+    def __init__(self) -> None:
+        """
+        Initialize the parser.
+        """
+        self.rows: List[Tuple[str, ...]] = []
+        self._pending = ""
+        self._row: List[str] = []
+        self._cell: List[str] = []
+        self._in_row = False
+        self._in_cell = False
+
+    def feed(self, data: str) -> None:
+        """
+        Tokenize a piece of HTML.
+
+        Text after the last complete tag is kept until the next piece, as it may be cut in the middle of a tag.
+
+        Args:
+            data (str): The next piece of the document.
+        """
+        data = self._pending + data
+        position = 0
+        for match in self._TOKEN.finditer(data):
+            if self._in_cell and match.start() > position:
+                self._cell.append(data[position:match.start()])
+            position = match.end()
+
+            name = match.group(2)
+            if name is None:
+                continue
+            name = name.lower()
+            if not match.group(1):
+                if name == "tr":
+                    # An unclosed row ends where the next one starts
+                    self._end_row()
+                    self._in_row = True
+                elif name == "td" and self._in_row:
+                    # An unclosed cell ends where the next one starts
+                    self._end_cell()
+                    self._in_cell = True
+            elif name == "td":
+                self._end_cell()
+            elif name in ("tr", "table"):
+                self._end_row()
+        self._pending = data[position:]
+
+    def close(self) -> None:
+        """
+        Process the remaining text and complete the last row, even if its closing tags are missing.
+        """
+        if self._in_cell:
+            self._cell.append(self._pending)
+        self._pending = ""
+        self._end_row()
+
+    def _end_cell(self) -> None:
+        """Private helper method to add the unescaped text of the current cell to the current row."""
+        if self._in_cell:
+            text = "".join(self._cell)
+            if "&" in text:
+                text = unescape(text)
+            self._row.append(text.strip())
+            self._cell.clear()
+            self._in_cell = False
+
+    def _end_row(self) -> None:
+        """Private helper method to add the current row to the completed rows."""
+        self._end_cell()
+        if self._in_row:
+            self.rows.append(tuple(self._row))
+            self._row.clear()
+            self._in_row = False
 
 
 class HTMLSerializer(BaseSerializer):
@@ -9,26 +100,43 @@ class HTMLSerializer(BaseSerializer):
     A class to represent an HTML serializer.
     """
 
-    def serialize(self, records: List[PersonalData]) -> str:
+    # The number of characters read from a stream at once when deserializing incrementally
+    read_size = 1 << 16
+
+    def serialize_header(self) -> str:
+        """
+        Get the HTML markup written before the table rows.
+
+        Returns:
+            str: The opening HTML markup.
+        """
+        return "<html>\n<body>\n<table>\n"
+
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> str:
         """
-        Serialize the records into an HTML format.
+        Serialize a chunk of records into HTML table rows.
 
         Args:
-            records (list): A list of records to be serialized.
+            records (Union[List[PersonalData], RecordBatch]): A list of records or a RecordBatch.
 
         Returns:
-            str: The serialized HTML output.
+            str: The serialized HTML table rows.
         """
-        # Call the base class implementation
-        super().serialize(records)
+        # Join one table row of record information per record, escaping the markup characters of the values
+        return "".join(
+            f"<tr><td>{escape(name, False)}</td><td>{escape(address, False)}</td>"
+            f"<td>{escape(phone_number, False)}</td></tr>\n"
+            for name, address, phone_number in iter_rows(records)
+        )
 
-        output = "<html>\n<body>\n<table>\n"
-        # Loop through each record and append the record information to the output string
-        for record in records:
-            output += f"<tr><td>{record.name}</td><td>{record.address}</td><td>{record.phone_number}</td></tr>\n"
-        output += "</table>\n</body>\n</html>"
+    def serialize_footer(self) -> str:
+        """
+        Get the HTML markup written after the table rows.
 
-        return output
+        Returns:
+            str: The closing HTML markup.
+        """
+        return "</table>\n</body>\n</html>"
 
     def deserialize(self, serialized_records: str) -> list:
         """
@@ -43,18 +151,34 @@ class HTMLSerializer(BaseSerializer):
         # Call the base class implementation
         super().deserialize(serialized_records)
 
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(serialized_records, 'html.parser')
-        records = []
-        # Loop through each row of the HTML table
-        for row in soup.find_all("tr"):
-            # Extract the data from each cell
-            cells = row.find_all("td")
-            if len(cells) == 3:
-                name, address, phone_number = [cell.text.strip() for cell in cells]
-                # Create a PersonalData object from the data
-                record = PersonalData(name, address, phone_number)
-                records.append(record)
-
-        return records
+        return list(self.deserialize_iter(StringIO(serialized_records)))
+
+    def deserialize_iter(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from an HTML stream one table row at a time.
+
+        The stream is fed to an HTMLTableParser in blocks of read_size characters, and a record is created for
+        each row of exactly three cells. Header rows, whose cells are <th> elements, are skipped.
+
+        Args:
+            stream (TextIO): A readable text stream containing records in HTML format.
+
+        Yields:
+            PersonalData: The deserialized records.
+        """
+        parser = HTMLTableParser()
+        while True:
+            data = stream.read(self.read_size)
+            if data:
+                parser.feed(data)
+            else:
+                parser.close()
+
+            # Create a record from each row completed by this block
+            for row in parser.rows:
+                if len(row) == 3:
+                    yield self._new_record(*row)
+            parser.rows.clear()
 
+            if not data:
+                break
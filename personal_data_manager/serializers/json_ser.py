@@ -1,8 +1,9 @@
 import json
-from typing import List
+from typing import Iterator, List, TextIO, Union
 
 from .base_ser import BaseSerializer
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_rows
 
 
 class JSONSerializer(BaseSerializer):
@@ -10,29 +11,48 @@ class JSONSerializer(BaseSerializer):
     A serializer for converting PersonalData objects to and from JSON format.
     """
 
-    def serialize(self, records: List[PersonalData]) -> str:
+    # Records are serialized as the items of a single JSON array
+    record_separator = ", "
+
+    # The number of characters read from a stream at once when deserializing incrementally
+    read_size = 1 << 16
+
+    # The largest serialized record accepted when deserializing incrementally, in characters
+    max_record_size = 1 << 20
+
+    def serialize_header(self) -> str:
+        """
+        Get the opening bracket of the JSON array.
+
+        Returns:
+            str: The JSON array opening bracket.
         """
-        Serialize a list of PersonalData objects to JSON format.
+        return "["
+
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> str:
+        """
+        Serialize a chunk of PersonalData objects to JSON array items.
 
         Args:
-            records (List[PersonalData]): A list of PersonalData objects.
+            records (Union[List[PersonalData], RecordBatch]): A list of PersonalData objects or a RecordBatch.
 
         Returns:
-            str: Serialized records in JSON format.
-
-        Raises:
-            ValueError: If no records are found to serialize.
+            str: Serialized records in JSON format, separated by the record separator and without brackets.
         """
-        # Call the base class implementation
-        super().serialize(records)
+        # Convert the chunk to a JSON array in one call and strip the brackets
+        return json.dumps([
+            {"name": name, "address": address, "phone_number": phone_number}
+            for name, address, phone_number in iter_rows(records)
+        ])[1:-1]
 
-        # Convert each PersonalData object to a dictionary and store in a list
-        json_data = []
-        for record in records:
-            json_data.append(record.to_dict())
+    def serialize_footer(self) -> str:
+        """
+        Get the closing bracket of the JSON array.
 
-        # Convert the list of dictionaries to a JSON string
-        return json.dumps(json_data)
+        Returns:
+            str: The JSON array closing bracket.
+        """
+        return "]"
 
     def deserialize(self, serialized_records: str) -> List[PersonalData]:
         """
@@ -57,19 +77,84 @@ class JSONSerializer(BaseSerializer):
             # Raise an error if the input data is not valid JSON format
             raise ValueError(f"Invalid JSON data: {e}")
 
-        records = []
-
-        # Read each dictionary from the json_data list
-        for record_data in json_data:
-            try:
-                # Extract each field from the dictionary and create a new PersonalData object
-                name = record_data["name"]
-                address = record_data["address"]
-                phone_number = record_data["phone_number"]
-                records.append(PersonalData(name, address, phone_number))
-            except KeyError as e:
-                # Raise an error if any required field is missing from the record_data
-                raise ValueError(f"Missing required field: {e}")
-
-        # Return the list of PersonalData objects
-        return records
+        # Create a PersonalData object from each dictionary of the json_data list
+        return [self._record_from_mapping(record_data) for record_data in json_data]
+
+    def deserialize_iter(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from a stream containing a JSON array, one array item at a time.
+
+        The stream is read in blocks of read_size characters and each item is decoded as soon as it is
+        complete, so memory usage is bounded by the block size and the largest record, not by the document.
+
+        Args:
+            stream (TextIO): A readable text stream containing records in JSON format.
+
+        Yields:
+            PersonalData: The deserialized records.
+
+        Raises:
+            ValueError: If the input data is not a valid JSON array or a record is missing a required field.
+        """
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            # Drop the consumed characters and read the next block, returning False at the end of the stream
+            nonlocal buffer, pos, eof
+            if eof:
+                return False
+            data = stream.read(self.read_size)
+            if not data:
+                eof = True
+                return False
+            buffer = buffer[pos:] + data
+            pos = 0
+            return True
+
+        def next_token() -> str:
+            # Skip whitespace and return the next character without consuming it, or "" at the end of the stream
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    return buffer[pos:pos + 1]
+
+        if next_token() != "[":
+            raise ValueError("Invalid JSON data: expected '[' at the start of the document")
+        pos += 1
+
+        if next_token() == "]":
+            pos += 1
+        else:
+            while True:
+                next_token()
+
+                # Decode the next item, reading more of the stream while it is incomplete
+                while True:
+                    try:
+                        record_data, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError as e:
+                        if len(buffer) - pos > self.max_record_size or not fill():
+                            raise ValueError(f"Invalid JSON data: {e}")
+                        continue
+
+                    # A value ending at the end of the buffer, such as a number, may continue in the next block
+                    if end < len(buffer) or not fill():
+                        break
+                pos = end
+                yield self._record_from_mapping(record_data)
+
+                # Expect a comma before the next item or the closing bracket of the array
+                token = next_token()
+                pos += 1
+                if token == "]":
+                    break
+                if token != ",":
+                    raise ValueError(f"Invalid JSON data: expected ',' or ']' but found {token or 'end of data'!r}")
+
+        if next_token():
+            raise ValueError("Invalid JSON data: unexpected data after the end of the array")
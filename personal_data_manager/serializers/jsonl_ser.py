@@ -0,0 +1,99 @@
+import json
+from io import StringIO
+from typing import Iterator, List, TextIO, Union
+
+from .json_ser import JSONSerializer
+from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_rows
+
+
+class JSONLSerializer(JSONSerializer):
+    """
+    A serializer for converting PersonalData objects to and from JSON Lines format, one JSON object per line.
+
+    Unlike a JSON array, a JSON Lines document has no enclosing brackets or separators, so records are
+    written and read one line at a time with constant memory.
+    """
+
+    # Records are terminated by a newline rather than separated
+    record_separator = ""
+
+    def serialize_header(self) -> str:
+        """
+        Get the JSON Lines header, which is empty.
+
+        Returns:
+            str: An empty string.
+        """
+        return ""
+
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> str:
+        """
+        Serialize a chunk of PersonalData objects to JSON objects, one per line.
+
+        Args:
+            records (Union[List[PersonalData], RecordBatch]): A list of PersonalData objects or a RecordBatch.
+
+        Returns:
+            str: Serialized records in JSON Lines format.
+        """
+        encode = json.JSONEncoder().encode
+        return "".join(
+            f"{encode({'name': name, 'address': address, 'phone_number': phone_number})}\n"
+            for name, address, phone_number in iter_rows(records)
+        )
+
+    def serialize_footer(self) -> str:
+        """
+        Get the JSON Lines footer, which is empty.
+
+        Returns:
+            str: An empty string.
+        """
+        return ""
+
+    def deserialize(self, serialized_records: str) -> List[PersonalData]:
+        """
+        Deserialize records from a JSON Lines format.
+
+        Args:
+            serialized_records (str): Serialized records in JSON Lines format.
+
+        Returns:
+            List[PersonalData]: A list of deserialized PersonalData objects.
+
+        Raises:
+            ValueError: If no records are found to deserialize or if a line is not a valid JSON record.
+        """
+        # Call the base class implementation
+        super(JSONSerializer, self).deserialize(serialized_records)
+
+        return list(self.deserialize_iter(StringIO(serialized_records)))
+
+    def deserialize_iter(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from a JSON Lines stream one line at a time.
+
+        Args:
+            stream (TextIO): A readable text stream containing records in JSON Lines format.
+
+        Yields:
+            PersonalData: The deserialized records.
+
+        Raises:
+            ValueError: If a line is not a valid JSON record.
+        """
+        for line_number, line in enumerate(stream, 1):
+            # Skip blank lines, such as a trailing newline
+            if not line.strip():
+                continue
+
+            try:
+                record_data = json.loads(line)
+            except json.JSONDecodeError as e:
+                # A malformed line only invalidates its own record
+                error = ValueError(f"Invalid JSON data on line {line_number}: {e}")
+                yield self._invalid_record(line.rstrip("\r\n"), error)
+                continue
+
+            yield self._record_from_mapping(record_data)
@@ -1,7 +1,8 @@
-from typing import List
+from typing import Iterator, List, TextIO, Union
 
 from .base_ser import BaseSerializer
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_rows
 
 
 class TextSerializer(BaseSerializer):
@@ -9,27 +10,18 @@ class TextSerializer(BaseSerializer):
     A class to represent a text serializer.
     """
 
-    def serialize(self, records: List[PersonalData]) -> str:
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> str:
         """
-        Serialize a list of PersonalData objects to a plain text format.
+        Serialize a chunk of PersonalData objects to a plain text format.
 
         Args:
-            records (List[PersonalData]): A list of PersonalData objects.
+            records (Union[List[PersonalData], RecordBatch]): A list of PersonalData objects or a RecordBatch.
 
         Returns:
             str: Serialized records in plain text format.
-
-        Raises:
-            ValueError: If no records are found to serialize.
         """
-        # Call the base class implementation
-        super().serialize(records)
-
-        output = ""
-        # Loop through each record and append the record information to the output string
-        for record in records:
-            output += f"{record.name},{record.address},{record.phone_number}\n"
-        return output
+        # Join one line of record information per record
+        return "".join(f"{name},{address},{phone_number}\n" for name, address, phone_number in iter_rows(records))
 
     def deserialize(self, serialized_records: str) -> list:
         """
@@ -47,16 +39,50 @@ class TextSerializer(BaseSerializer):
         # Call the base class implementation
         super().deserialize(serialized_records)
 
-        records = []
-        # Split serialized data into lines and loop through each line
-        for line in serialized_records.strip().split("\n"):
-            # Split line into components
-            components = line.strip().split(",")
-            # Ensure that there are exactly three components
-            if len(components) != 3:
-                raise ValueError("Invalid data format.")
-            # Create a PersonalData object from the components and add it to the list
-            record = PersonalData(components[0], components[1], components[2])
-            records.append(record)
-
-        return records
+        # Split serialized data into lines and convert each line to a PersonalData object
+        return [self._parse_line(line) for line in serialized_records.strip().split("\n")]
+
+    def deserialize_iter(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from a plain text stream one line at a time.
+
+        Args:
+            stream (TextIO): A readable text stream containing records in plain text format.
+
+        Yields:
+            PersonalData: The deserialized records.
+
+        Raises:
+            ValueError: If a line is not in the expected format.
+        """
+        for line in stream:
+            # Skip blank lines, such as the trailing newline of the serialized output
+            if not line.strip():
+                continue
+            try:
+                record = self._parse_line(line)
+            except (ValueError, TypeError) as e:
+                record = self._invalid_record(line.rstrip("\r\n"), e)
+            yield record
+
+    @staticmethod
+    def _parse_line(line: str) -> PersonalData:
+        """
+        Private helper method to convert a single line of plain text to a PersonalData object.
+
+        Args:
+            line (str): A line in plain text format.
+
+        Returns:
+            PersonalData: The deserialized record.
+
+        Raises:
+            ValueError: If the line is not in the expected format.
+        """
+        # Split line into components
+        components = line.strip().split(",")
+        # Ensure that there are exactly three components
+        if len(components) != 3:
+            raise ValueError("Invalid data format.")
+        # Create a PersonalData object from the components
+        return PersonalData(components[0], components[1], components[2])
@@ -1,9 +1,85 @@
 import xml.etree.ElementTree as et
-from xml.dom import minidom
-from typing import List
+from io import StringIO
+from typing import Iterable, Iterator, List, TextIO, Union
 
 from .base_ser import BaseSerializer
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_rows
+
+
+class XMLStreamWriter:
+    """
+    An incremental writer emitting <record> elements to a text stream as records are iterated.
+
+    No document tree is built: each record is formatted straight from its field values, either indented
+    by two spaces per level (pretty) or without any whitespace between elements (compact).
+    """
+
+    # The names of the fields of a record, in the order they are written
+    fields = ("name", "address", "phone_number")
+
+    def __init__(self, stream: TextIO, pretty: bool = True) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            stream (TextIO): A writable text stream.
+            pretty (bool): Whether to indent the elements, one per line (default: True).
+        """
+        self.stream = stream
+        self.pretty = pretty
+
+        # Precompute the markup surrounding the records and their fields
+        newline, indent = ("\n", "  ") if pretty else ("", "")
+        self._record_start = f"{indent}<record>{newline}"
+        self._record_end = f"{indent}</record>{newline}"
+        self._field_starts = [f"{indent * 2}<{field}>" for field in self.fields]
+        self._field_ends = [f"</{field}>{newline}" for field in self.fields]
+        self._empty_fields = [f"{indent * 2}<{field}/>{newline}" for field in self.fields]
+        self._newline = newline
+
+    @staticmethod
+    def escape(value: str) -> str:
+        """
+        Escape the characters of a value that are not allowed in XML text.
+
+        Args:
+            value (str): The value to escape.
+
+        Returns:
+            str: The escaped value.
+        """
+        return value.replace("&", "&amp;").replace("<", "&lt;").replace('"', "&quot;").replace(">", "&gt;")
+
+    def start_document(self) -> None:
+        """Write the XML declaration and the opening tag of the root element."""
+        self.stream.write(f'<?xml version="1.0" ?>\n<records>{self._newline}')
+
+    def write_records(self, rows: Iterable[Iterable[str]]) -> None:
+        """
+        Write a <record> element for each row of field values.
+
+        Args:
+            rows (Iterable[Iterable[str]]): The name, address and phone number of each record.
+        """
+        escape = self.escape
+        parts = []
+        for row in rows:
+            parts.append(self._record_start)
+            for value, start, end, empty in zip(row, self._field_starts, self._field_ends, self._empty_fields):
+                value = str(value)
+                if value:
+                    parts.append(start)
+                    parts.append(escape(value))
+                    parts.append(end)
+                else:
+                    parts.append(empty)
+            parts.append(self._record_end)
+        self.stream.write("".join(parts))
+
+    def end_document(self) -> None:
+        """Write the closing tag of the root element."""
+        self.stream.write(f"</records>{self._newline}")
 
 
 class XMLSerializer(BaseSerializer):
@@ -11,43 +87,51 @@ class XMLSerializer(BaseSerializer):
     A serializer for converting PersonalData objects to and from XML format.
     """
 
-    def serialize(self, records: List[PersonalData]) -> str:
+    def __init__(self, pretty: bool = True) -> None:
         """
-        Serialize a list of PersonalData objects to XML format.
+        Initialize the serializer.
 
         Args:
-            records (List[PersonalData]): A list of PersonalData objects.
+            pretty (bool): Whether to indent the output, one element per line (default: True). Compact output
+                           skips indentation entirely, for exports read by other programs.
+        """
+        self.pretty = pretty
 
-        Returns:
-            str: Serialized records in XML format.
+    def serialize_header(self) -> str:
+        """
+        Get the XML declaration and the opening tag of the root element.
 
-        Raises:
-            ValueError: If no records are found to serialize.
+        Returns:
+            str: The XML document header.
         """
-        # Call the base class implementation
-        super().serialize(records)
+        output = StringIO()
+        XMLStreamWriter(output, self.pretty).start_document()
+        return output.getvalue()
 
-        # Create the root element of the XML document.
-        root = et.Element("records")
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> str:
+        """
+        Serialize a chunk of PersonalData objects to <record> elements.
 
-        # Iterate over each record in the list of records.
-        for record in records:
-            # Create a new element for this record.
-            record_element = et.SubElement(root, "record")
+        Args:
+            records (Union[List[PersonalData], RecordBatch]): A list of PersonalData objects or a RecordBatch.
 
-            # Iterate over each key-value pair in the record's dictionary.
-            for key, value in record.__dict__.items():
-                # Create a new element for this field.
-                if key == 'phone_number':
-                    field_element = et.SubElement(record_element, "phone_number")
-                else:
-                    field_element = et.SubElement(record_element, key)
+        Returns:
+            str: Serialized records in XML format.
+        """
+        output = StringIO()
+        XMLStreamWriter(output, self.pretty).write_records(iter_rows(records))
+        return output.getvalue()
 
-                # Set the text of the field element to the value of the corresponding attribute.
-                field_element.text = str(value)
+    def serialize_footer(self) -> str:
+        """
+        Get the closing tag of the root element.
 
-        # Serialize the XML tree to a string, with pretty formatting.
-        return minidom.parseString(et.tostring(root)).toprettyxml(indent="  ")
+        Returns:
+            str: The XML document footer.
+        """
+        output = StringIO()
+        XMLStreamWriter(output, self.pretty).end_document()
+        return output.getvalue()
 
     def deserialize(self, serialized_records: str) -> List[PersonalData]:
         """
@@ -65,35 +149,49 @@ class XMLSerializer(BaseSerializer):
         # Call the base class implementation
         super().deserialize(serialized_records)
 
+        return list(self.deserialize_iter(StringIO(serialized_records)))
+
+    def deserialize_iter(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from an XML stream one <record> element at a time.
+
+        The document is parsed incrementally and each <record> element is freed once its record is created,
+        so memory usage does not grow with the size of the document.
+
+        Args:
+            stream (TextIO): A readable text stream containing records in XML format.
+
+        Yields:
+            PersonalData: The deserialized records.
+
+        Raises:
+            ValueError: If the input data is not valid XML format.
+        """
+        root = None
+        depth = 0
         try:
-            # Parse the serialized XML into an ElementTree object.
-            root = et.fromstring(serialized_records)
+            for event, element in et.iterparse(stream, events=("start", "end")):
+                if event == "start":
+                    # Keep a reference to the root element to detach the records once they are read
+                    if root is None:
+                        root = element
+                    depth += 1
+                    continue
+
+                depth -= 1
+
+                # Only the <record> children of the root element hold records
+                if depth != 1 or element.tag != "record":
+                    continue
+
+                # Set the appropriate field to the text value of each child element of the <record> element
+                fields = {"name": None, "address": None, "phone_number": None}
+                for field_element in element:
+                    if field_element.tag in fields:
+                        fields[field_element.tag] = field_element.text
+
+                # Free the parsed elements before creating the record
+                root.clear()
+                yield self._new_record(**fields)
         except et.ParseError as e:
             raise ValueError(f"Invalid XML data: {e}")
-
-        # Create an empty list to hold the deserialized records.
-        records = []
-
-        # Iterate over each <record> element in the root element.
-        for record_element in root.findall("record"):
-            # Create variables to hold the data for this record.
-            name = None
-            address = None
-            phone_number = None
-
-            # Iterate over each child element of the <record> element.
-            for field_element in record_element:
-                # Set the appropriate variable to the text value of the field element.
-                if field_element.tag == "name":
-                    name = field_element.text
-                elif field_element.tag == "address":
-                    address = field_element.text
-                elif field_element.tag == "phone_number":
-                    phone_number = field_element.text
-
-            # Create a new PersonalData object from the record data and append it to the list of records.
-            record = PersonalData(name=name, address=address, phone_number=phone_number)
-            records.append(record)
-
-        # Return the list of deserialized records.
-        return records
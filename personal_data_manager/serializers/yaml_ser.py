@@ -1,8 +1,14 @@
 import yaml
-from typing import List
+from io import StringIO
+from typing import Iterator, List, TextIO, Union
 
 from .base_ser import BaseSerializer
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, iter_rows
+
+# Use the libyaml C implementation when PyYAML was built with it, falling back to the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 class YAMLSerializer(BaseSerializer):
@@ -10,39 +16,41 @@ class YAMLSerializer(BaseSerializer):
     A serializer for converting PersonalData objects to and from YAML format.
     """
 
-    def serialize(self, records: List[PersonalData]) -> str:
+    def __init__(self, multi_document: bool = False) -> None:
         """
-        Serialize a list of PersonalData objects to YAML format.
+        Initialize the serializer.
 
         Args:
-            records (List[PersonalData]): A list of PersonalData objects.
-
-        Returns:
-            str: Serialized records in YAML format.
+            multi_document (bool): Whether to write each chunk of records as its own YAML document, starting
+                                   with "---", instead of a single list (default: False). Multi-document
+                                   output can be read back one document at a time.
+        """
+        self.multi_document = multi_document
 
-        Raises:
-            ValueError: If no records are found to serialize.
+    def serialize_chunk(self, records: Union[List[PersonalData], RecordBatch]) -> str:
         """
-        # Call the base class implementation
-        super().serialize(records)
+        Serialize a chunk of PersonalData objects to YAML format.
 
-        # Create an empty list
-        yaml_data = []
+        Block-style YAML sequences can be concatenated, so each chunk is dumped as its own list.
 
-        # Loop through each record in the input list
-        for record in records:
-            # Convert the record to a dictionary and add it to the list
-            yaml_data.append(record.__dict__)
+        Args:
+            records (Union[List[PersonalData], RecordBatch]): A list of PersonalData objects or a RecordBatch.
 
-        # Serialize the list of dictionaries to YAML format
-        return yaml.dump(yaml_data)
+        Returns:
+            str: Serialized records in YAML format.
+        """
+        # Convert each record to a dictionary and serialize the list of dictionaries to YAML format
+        return yaml.dump([
+            {"name": name, "address": address, "phone_number": phone_number}
+            for name, address, phone_number in iter_rows(records)
+        ], Dumper=YAML_DUMPER, explicit_start=self.multi_document)
 
     def deserialize(self, serialized_records: str) -> List[PersonalData]:
         """
         Deserialize records from a YAML format.
 
         Args:
-            serialized_records (str): Serialized records in YAML format.
+            serialized_records (str): Serialized records in YAML format, as a single document or several.
 
         Returns:
             List[PersonalData]: A list of deserialized PersonalData objects.
@@ -53,26 +61,34 @@ class YAMLSerializer(BaseSerializer):
         # Call the base class implementation
         super().deserialize(serialized_records)
 
+        return list(self.deserialize_iter(StringIO(serialized_records)))
+
+    def deserialize_iter(self, stream: TextIO) -> Iterator[PersonalData]:
+        """
+        Deserialize records from a YAML stream one document at a time.
+
+        Each document holds a list of records. A multi-document stream is parsed incrementally, so only one
+        document is held in memory at a time.
+
+        Args:
+            stream (TextIO): A readable text stream containing records in YAML format.
+
+        Yields:
+            PersonalData: The deserialized records.
+
+        Raises:
+            ValueError: If the input data is not valid YAML format or a record is missing a required field.
+        """
         try:
-            # Deserialize the YAML string into a list of dictionaries
-            yaml_data = yaml.safe_load(serialized_records)
+            for yaml_data in yaml.load_all(stream, Loader=YAML_LOADER):
+                # Skip empty documents
+                if yaml_data is None:
+                    continue
+                if not isinstance(yaml_data, list):
+                    raise ValueError("Invalid YAML data: expected a list of records")
+
+                # Convert the dictionaries to PersonalData objects
+                for record_data in yaml_data:
+                    yield self._record_from_mapping(record_data)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML data: {e}")
-
-        # Convert the dictionaries to PersonalData objects
-        records = []
-        for record_data in yaml_data:
-            try:
-                # Create a new PersonalData object from the dictionary data
-                personal_data = PersonalData(
-                    name=record_data['name'],
-                    address=record_data['address'],
-                    phone_number=record_data['phone_number']
-                )
-                # Append the new PersonalData object to the list of records
-                records.append(personal_data)
-            except KeyError as e:
-                raise ValueError(f"Missing required field: {e}")
-
-        # Return the list of PersonalData objects
-        return records
@@ -0,0 +1 @@
+from .chunk_writer import ChunkWriter
@@ -0,0 +1,76 @@
+from typing import Iterable, List, Optional, TextIO
+
+
+class ChunkWriter:
+    """
+    A text writer that collects output in chunks instead of concatenating strings.
+
+    Written strings are appended to a list and joined once, so building an output of n records takes linear
+    time. When a stream is given, the chunks are flushed to it whenever the buffered text reaches the buffer
+    size, so the output can be written straight to a file or stdout without being held in memory.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = 1 << 16) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            stream (TextIO): A writable text stream to flush the output to (optional). If not provided, the
+                             output is kept in memory until getvalue is called.
+            buffer_size (int): The number of buffered characters flushed to the stream at once (default: 65536).
+        """
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._chunks: List[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> int:
+        """
+        Write a string, flushing the buffered chunks to the stream if the buffer is full.
+
+        Args:
+            text (str): The string to write.
+
+        Returns:
+            int: The number of characters written.
+        """
+        self._chunks.append(text)
+        self._size += len(text)
+        if self.stream is not None and self._size >= self.buffer_size:
+            self.flush()
+        return len(text)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        """
+        Write a sequence of strings.
+
+        Args:
+            lines (Iterable[str]): The strings to write.
+        """
+        for line in lines:
+            self.write(line)
+
+    def flush(self) -> None:
+        """Write the buffered chunks to the stream as a single string, if a stream is set."""
+        if self.stream is not None and self._chunks:
+            self.stream.write("".join(self._chunks))
+            self._chunks.clear()
+            self._size = 0
+
+    def getvalue(self) -> str:
+        """
+        Get the buffered output.
+
+        Returns:
+            str: The text written since the last flush.
+        """
+        # Keep the joined string as the only chunk so that repeated calls do not join the chunks again
+        value = "".join(self._chunks)
+        self._chunks[:] = [value] if value else []
+        return value
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
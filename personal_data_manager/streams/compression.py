@@ -0,0 +1,376 @@
+import io
+import os
+import queue
+import threading
+import time
+from typing import IO, Dict, Optional, Tuple
+
+# The file extension of each compression
+COMPRESSIONS: Dict[str, str] = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "zstd": ".zst"}
+
+# The default, minimum and maximum level of each compression
+COMPRESSION_LEVELS: Dict[str, Tuple[int, int, int]] = {
+    "gzip": (6, 0, 9),
+    "bz2": (9, 1, 9),
+    "xz": (6, 0, 9),
+    "zstd": (3, 1, 22),
+}
+
+# The magic number at the start of the files of each compression
+_MAGIC_NUMBERS = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+
+def compression_from_extension(file_name: str) -> Optional[str]:
+    """
+    Get the compression of a file from its extension.
+
+    Args:
+        file_name (str): The name of the file.
+
+    Returns:
+        Optional[str]: The compression, or None if the extension is not one of a compressed file.
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    for compression, compression_extension in COMPRESSIONS.items():
+        if extension == compression_extension:
+            return compression
+    return None
+
+
+def sniff_compression(file_name: str) -> Optional[str]:
+    """
+    Get the compression of a file from its first bytes.
+
+    Args:
+        file_name (str): The name of the file.
+
+    Returns:
+        Optional[str]: The compression, or None if the file is not compressed.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(file_name, "rb") as f:
+        start = f.read(6)
+    for compression, magic in _MAGIC_NUMBERS.items():
+        if start.startswith(magic):
+            return compression
+    return None
+
+
+def _import_zstandard():
+    """
+    Private helper function to import the optional zstandard package.
+
+    Returns:
+        module: The zstandard module.
+
+    Raises:
+        ValueError: If zstandard is not installed.
+    """
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError("The zstd compression requires the zstandard package: pip install zstandard")
+    return zstandard
+
+
+def check_compression(compression: str, level: Optional[int] = None) -> int:
+    """
+    Validate a compression and its level.
+
+    Args:
+        compression (str): The compression: gzip, bz2, xz or zstd.
+        level (int): The compression level, or None for the default level of the compression.
+
+    Returns:
+        int: The compression level.
+
+    Raises:
+        ValueError: If the compression or the level is not supported, or zstd is requested but the zstandard
+                    package is not installed.
+    """
+    if compression not in COMPRESSION_LEVELS:
+        raise ValueError(f"Unsupported compression '{compression}'. Supported compressions are: "
+                         f"{list(COMPRESSION_LEVELS)}")
+    if compression == "zstd":
+        _import_zstandard()
+
+    default, minimum, maximum = COMPRESSION_LEVELS[compression]
+    if level is None:
+        return default
+    if not minimum <= level <= maximum:
+        raise ValueError(f"The {compression} compression level must be between {minimum} and {maximum}.")
+    return level
+
+
+def _new_compressor(compression: str, level: int):
+    """
+    Private helper function to create an incremental compressor.
+
+    The compression modules are only imported when a compressor is created.
+
+    Args:
+        compression (str): The compression: gzip, bz2, xz or zstd.
+        level (int): The compression level.
+
+    Returns:
+        object: A compressor with compress() and flush() methods.
+
+    Raises:
+        ValueError: If the zstd compression is requested but zstandard is not installed.
+    """
+    if compression == "gzip":
+        import zlib
+
+        # A window size of 16 + 15 bits writes a gzip header and trailer around the deflate stream
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if compression == "bz2":
+        import bz2
+        return bz2.BZ2Compressor(level)
+    if compression == "xz":
+        import lzma
+        return lzma.LZMACompressor(preset=level)
+    return _import_zstandard().ZstdCompressor(level=level).compressobj()
+
+
+class CompressionStats:
+    """
+    The throughput of a compressed write.
+
+    Attributes:
+        compression (str): The compression.
+        level (int): The compression level.
+        raw_bytes (int): The number of bytes written before compression.
+        compressed_bytes (int): The number of compressed bytes written to the file.
+        elapsed (float): The wall time from opening to closing the file, in seconds.
+        compress_time (float): The time spent compressing in the background thread, in seconds.
+    """
+
+    def __init__(self, compression: str, level: int) -> None:
+        self.compression = compression
+        self.level = level
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.elapsed = 0.0
+        self.compress_time = 0.0
+
+    @property
+    def ratio(self) -> float:
+        """float: The number of raw bytes per compressed byte."""
+        if not self.compressed_bytes:
+            return 0.0
+        return self.raw_bytes / self.compressed_bytes
+
+    @property
+    def throughput(self) -> float:
+        """float: The number of raw bytes written per second."""
+        if not self.elapsed:
+            return 0.0
+        return self.raw_bytes / self.elapsed
+
+    def __str__(self) -> str:
+        return (f"{self.compression} level {self.level}: {self.raw_bytes / 2 ** 20:.1f} MiB compressed to "
+                f"{self.compressed_bytes / 2 ** 20:.1f} MiB ({self.ratio:.1f}x) at "
+                f"{self.throughput / 2 ** 20:.1f} MiB/s, compressing for {self.compress_time:.2f}s "
+                f"of {self.elapsed:.2f}s in the background")
+
+    def __repr__(self) -> str:
+        return (f"CompressionStats(compression={self.compression!r}, level={self.level}, "
+                f"raw_bytes={self.raw_bytes}, compressed_bytes={self.compressed_bytes}, elapsed={self.elapsed:.3f})")
+
+
+class BackgroundCompressor(io.BufferedIOBase):
+    """
+    A writable binary stream compressing its output to a file in a background thread.
+
+    Written bytes are collected into chunks of buffer_size bytes, which are handed to the thread through a
+    bounded queue, so serializing the next records overlaps with compressing and writing the previous ones.
+    The gzip, bz2 and xz compressors release the GIL while they compress, so both run in parallel on separate
+    cores; large chunks keep the thread from waiting for the GIL after every chunk. An error of the thread,
+    such as a full disk, is raised by the next write or by close().
+
+    Wrap it in an io.TextIOWrapper to write text, as open_compressed() does.
+    """
+
+    def __init__(self, file_name: str, compression: str, level: Optional[int] = None,
+                 buffer_size: int = 1 << 20, max_pending_chunks: int = 4) -> None:
+        """
+        Creates the file and starts the compression thread.
+
+        Args:
+            file_name (str): The file to write.
+            compression (str): The compression: gzip, bz2, xz or zstd.
+            level (int): The compression level (default: the default level of the compression).
+            buffer_size (int): The number of bytes handed to the thread at once (default: 1 MiB).
+            max_pending_chunks (int): The maximum number of chunks waiting to be compressed (default: 4).
+
+        Raises:
+            ValueError: If the compression or the level is not supported.
+            OSError: If the file cannot be created.
+        """
+        super().__init__()
+        level = check_compression(compression, level)
+        self._compressor = _new_compressor(compression, level)
+        self.stats = CompressionStats(compression, level)
+
+        self._start = time.perf_counter()
+        self._file = open(file_name, "wb")
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(max_pending_chunks)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="compressor", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Private helper method run by the compression thread, until close() queues None.
+        """
+        try:
+            while True:
+                chunk = self._queue.get()
+                if chunk is None:
+                    break
+                start = time.perf_counter()
+                compressed = self._compressor.compress(chunk)
+                self.stats.compress_time += time.perf_counter() - start
+                self._file.write(compressed)
+                self.stats.compressed_bytes += len(compressed)
+
+            compressed = self._compressor.flush()
+            self._file.write(compressed)
+            self.stats.compressed_bytes += len(compressed)
+        except BaseException as e:
+            self._error = e
+
+            # Keep consuming the queue so that the writer is never blocked
+            while chunk is not None:
+                chunk = self._queue.get()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        """
+        Buffer bytes to be compressed, handing the buffer to the thread once it is full.
+
+        Args:
+            data (bytes-like): The bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            ValueError: If the stream is closed.
+            OSError: If the compression thread failed to write the file.
+        """
+        if self.closed:
+            raise ValueError("write to closed file")
+        self._raise_error()
+
+        # Copy the data, as the caller may reuse its buffer
+        size = len(self._buffer)
+        self._buffer += data
+        size = len(self._buffer) - size
+        self.stats.raw_bytes += size
+        if len(self._buffer) >= self.buffer_size:
+            self._queue.put(bytes(self._buffer))
+            self._buffer.clear()
+        return size
+
+    def close(self) -> None:
+        """
+        Compress the queued bytes, finish the compressed stream and close the file.
+
+        Raises:
+            OSError: If the compression thread failed to write the file.
+        """
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._queue.put(bytes(self._buffer))
+                self._buffer.clear()
+            self._queue.put(None)
+            self._thread.join()
+            self._file.close()
+            self.stats.elapsed = time.perf_counter() - self._start
+        finally:
+            super().close()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        """
+        Private helper method to raise the error of the compression thread, if any.
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
+def open_compressed(file_name: str, mode: str, compression: str, level: Optional[int] = None) -> IO:
+    """
+    Open a file for writing, compressing its content in a background thread.
+
+    Args:
+        file_name (str): The file to write.
+        mode (str): "w" to write text, with the same encoding and newlines as open(), or "wb" to write bytes.
+        compression (str): The compression: gzip, bz2, xz or zstd.
+        level (int): The compression level (default: the default level of the compression).
+
+    Returns:
+        IO: The writable stream. Its compression statistics are in the stats attribute of the
+            BackgroundCompressor, which is the stream itself in binary mode and its buffer in text mode.
+
+    Raises:
+        ValueError: If the mode, the compression or the level is not supported.
+        OSError: If the file cannot be created.
+    """
+    if mode not in ("w", "wb"):
+        raise ValueError(f"Invalid mode '{mode}' for a compressed file, use 'w' or 'wb'.")
+
+    compressor = BackgroundCompressor(file_name, compression, level)
+    if mode == "wb":
+        return compressor
+    return io.TextIOWrapper(compressor)
+
+
+def open_decompressed(file_name: str, mode: str, compression: str) -> IO:
+    """
+    Open a compressed file for reading.
+
+    Args:
+        file_name (str): The file to read.
+        mode (str): "r" to read text, without translating newlines, or "rb" to read bytes.
+        compression (str): The compression: gzip, bz2, xz or zstd.
+
+    Returns:
+        IO: The readable stream of the decompressed content.
+
+    Raises:
+        ValueError: If the mode or the compression is not supported.
+        OSError: If the file cannot be opened.
+    """
+    if mode not in ("r", "rb"):
+        raise ValueError(f"Invalid mode '{mode}' for a compressed file, use 'r' or 'rb'.")
+    check_compression(compression)
+
+    # Keep newlines as they are, like the uncompressed files read by the import command
+    text_options = {"newline": ""} if mode == "r" else {}
+    mode = "rt" if mode == "r" else "rb"
+    if compression == "gzip":
+        import gzip
+        return gzip.open(file_name, mode, **text_options)
+    if compression == "bz2":
+        import bz2
+        return bz2.open(file_name, mode, **text_options)
+    if compression == "xz":
+        import lzma
+        return lzma.open(file_name, mode, **text_options)
+    return _import_zstandard().open(file_name, mode, **text_options)
@@ -6,8 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "PyYAML",
-        "setuptools",
-        "beautifulsoup4"
+        "setuptools"
     ],
     classifiers=[
         "Development Status :: 3 - Alpha",
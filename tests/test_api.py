@@ -1,7 +1,14 @@
+import io
+import os
+import sys
+import tempfile
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
 
 from personal_data_manager.api import PersonalDataAPI
-from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.main import main
+from personal_data_manager.models.personal_data import InvalidRecord, PersonalData
 
 
 class TestAPI(unittest.TestCase):
@@ -27,7 +34,7 @@ class TestAPI(unittest.TestCase):
     @classmethod
     def tearDownClass(cls) -> None:
         """Tear down the test fixture."""
-        cls.api.conn.close()
+        cls.api.close()
 
     def test_add_record(self) -> None:
         """
@@ -37,11 +44,24 @@ class TestAPI(unittest.TestCase):
         record = PersonalData("John", "123 Main St", "555-908-1234")
 
         # Add the new PersonalData object to the PersonalDataAPI instance
-        self.api.add_record(record)
+        self.assertTrue(self.api.add_record(record))
 
         # Verify that the number of records in the PersonalDataAPI instance is 1
         self.assertEqual(len(self.api.get_all_records()), 1)
 
+    def test_add_record_duplicate_phone_number(self) -> None:
+        """
+        Test that adding a record with the phone number of another record reports the failure.
+        """
+        self.assertTrue(self.api.add_record(PersonalData("John", "123 Main St", "555-908-1234")))
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertFalse(self.api.add_record(PersonalData("Jane", "456 Second St", "555-908-1234")))
+        self.assertIn("Error adding record", output.getvalue())
+
+        # Verify that the dataset is unchanged and still accepts new records
+        self.assertEqual([record.name for record in self.api.get_all_records()], ["John"])
+        self.assertTrue(self.api.add_record(PersonalData("Jane", "456 Second St", "555-908-5678")))
+
     def test_create_invalid_data_value_error(self):
         """
         Test that adding a record with invalid data raises a ValueError.
@@ -98,3 +118,365 @@ class TestAPI(unittest.TestCase):
 
         # Verify that filtering for a non-existent record returns an empty list
         self.assertEqual(self.api.filter_records("name", "Jane"), [])
+
+    def test_add_records(self):
+        """
+        Test that many records can be added to the dataset in batches.
+        """
+        # Create three new PersonalData objects
+        records = [
+            PersonalData("John", "123 Main St", "555-908-1234"),
+            PersonalData("Jane", "456 Second St", "555-908-5678"),
+            PersonalData("Jack", "789 Third St", "555-908-9012"),
+        ]
+
+        # Add the records in batches of two and verify that all of them were inserted
+        report = self.api.add_records(iter(records), batch_size=2)
+        self.assertEqual(report.inserted, 3)
+        self.assertEqual(report.failed_batches, [])
+        self.assertEqual(len(self.api.get_all_records()), 3)
+
+    def test_add_records_skips_invalid_records(self):
+        """
+        Test that invalid records are counted in the report of their batch while the other records are added.
+        """
+        records = [
+            PersonalData("John", "123 Main St", "555-908-1234"),
+            "not a record",
+            InvalidRecord(("Jane", "456 Second St", "12345"), "Phone number must be in the format ###-###-####"),
+            PersonalData("Jack", "789 Third St", "555-908-9012"),
+        ]
+        report = self.api.add_records(records, batch_size=2)
+        self.assertEqual((report.inserted, report.invalid, report.failed), (2, 2, 2))
+        self.assertEqual(report.invalid_batches, [(1, 1, "Record must be an instance of PersonalData."),
+                                                  (2, 1, "Phone number must be in the format ###-###-####")])
+        self.assertIsNone(report.error)
+
+    def test_add_records_stops_at_parse_error(self):
+        """
+        Test that the records read before an error of the iterable are added and the error is reported.
+        """
+        def records():
+            yield PersonalData("John", "123 Main St", "555-908-1234")
+            yield PersonalData("Jane", "456 Second St", "555-908-5678")
+            yield PersonalData("Jack", "789 Third St", "555-908-9012")
+            raise ValueError("Invalid JSON data")
+
+        report = self.api.add_records(records(), batch_size=2)
+        self.assertEqual(report.inserted, 3)
+        self.assertEqual(report.error, "Invalid JSON data")
+        self.assertEqual(len(self.api.get_all_records()), 3)
+
+    def test_filter_records_prefix_pattern(self):
+        """
+        Test that prefix patterns return the same records as the unindexed LIKE and GLOB operators.
+        """
+        # Add records whose names differ in case and in characters around the ASCII letters
+        for i, name in enumerate(["John", "jOHNNY", "Joz", "Jo[", "Jane"]):
+            self.api.add_record(PersonalData(name, "123 Main St", f"555-908-123{i}"))
+
+        # LIKE is case-insensitive and GLOB is case-sensitive
+        self.assertEqual(sorted(r.name for r in self.api.filter_records("name", "jo%")), ["Jo[", "John", "Johnny", "Joz"])
+        self.assertEqual(sorted(r.name for r in self.api.filter_records("name", "JOHN%")), ["John", "Johnny"])
+        self.assertEqual([r.name for r in self.api.filter_records("name", "Jo*", use_glob=True)], ["Jo[", "John", "Joz"])
+
+        # An empty pattern matches every record
+        self.assertEqual(len(self.api.filter_records("name")), 5)
+
+    def test_explain_filter_uses_index(self):
+        """
+        Test that prefix filters are answered with an index range scan.
+        """
+        for field in ["name", "address", "phone_number"]:
+            for pattern, use_glob in [("Jo%", False), ("Jo*", True)]:
+                query_plan = " ".join(self.api.explain_filter(field, pattern, use_glob))
+                self.assertIn("USING INDEX", query_plan)
+
+    def test_add_records_reports_failed_batches(self):
+        """
+        Test that a batch violating a constraint is rolled back and reported without stopping the insert.
+        """
+        records = [
+            PersonalData("John", "123 Main St", "555-908-1234"),
+            PersonalData("Jane", "456 Second St", "555-908-5678"),
+            PersonalData("Johnny", "789 Third St", "555-908-1234"),
+            PersonalData("Jack", "10 Fourth St", "555-908-9012"),
+        ]
+
+        # The second batch repeats the phone number of the first one
+        report = self.api.add_records(records, batch_size=2)
+        self.assertEqual(report.inserted, 2)
+        self.assertEqual(report.failed, 2)
+        self.assertEqual([batch_number for batch_number, _, _ in report.failed_batches], [2])
+        self.assertEqual(len(self.api.get_all_records()), 2)
+
+    def test_point_lookup_update_and_delete(self):
+        """
+        Test that records can be found, updated and deleted by phone number.
+        """
+        self.api.add_record(PersonalData("John", "123 Main St", "555-908-1234"))
+
+        # Phone numbers are matched on their digits
+        self.assertEqual(str(self.api.find_by_phone_number("(555) 908 1234")), "John, 123 Main St, 555-908-1234")
+
+        self.assertTrue(self.api.update_record("555-908-1234", PersonalData("John", "9 New St", "555-908-1234")))
+        self.assertEqual(self.api.find_by_phone_number("5559081234").address, "9 New St")
+
+        self.assertTrue(self.api.delete_record("555-908-1234"))
+        self.assertFalse(self.api.delete_record("555-908-1234"))
+        self.assertIsNone(self.api.find_by_phone_number("555-908-1234"))
+
+    def test_filter_records_as_batch(self):
+        """
+        Test that filtered records can be returned as a columnar batch.
+        """
+        self.api.add_record(PersonalData("john", "123 main st", "555-908-1234"))
+        self.api.add_record(PersonalData("Jane", "456 Second St", "555-908-5678"))
+
+        batch = self.api.filter_records("name", "J%", as_batch=True)
+        self.assertEqual(sorted(batch.rows()), [("Jane", "456 Second St", "555-908-5678"),
+                                                ("John", "123 Main St", "555-908-1234")])
+
+    def test_get_records_pages(self):
+        """
+        Test that paging through the records with continuation tokens returns each record once, in order.
+        """
+        self.api.add_records(PersonalData(f"Name {i % 3}", f"{i} Main St", f"555-908-{i:04d}") for i in range(25))
+
+        phone_numbers = []
+        token = None
+        while True:
+            page = self.api.get_records(after=token, limit=10)
+            self.assertLessEqual(len(page), 10)
+            phone_numbers.extend(record.phone_number for record in page)
+            token = page.next_token
+            if token is None:
+                break
+        self.assertEqual(phone_numbers, [f"555-908-{i:04d}" for i in range(25)])
+
+    def test_get_records_order_by_with_ties(self):
+        """
+        Test that pages sorted by a key with duplicate values break ties by insertion order.
+        """
+        self.api.add_records(PersonalData(f"Name {i % 3}", f"{i} Main St", f"555-908-{i:04d}") for i in range(9))
+
+        first = self.api.get_records(limit=4, order_by="name")
+        second = self.api.get_records(after=first.next_token, limit=4, order_by="name")
+        last = self.api.get_records(after=second.next_token, limit=4, order_by="name")
+
+        records = list(first) + list(second) + list(last)
+        self.assertEqual([record.phone_number for record in records],
+                         [f"555-908-{i:04d}" for i in (0, 3, 6, 1, 4, 7, 2, 5, 8)])
+        self.assertIsNone(last.next_token)
+
+    def test_get_records_offset(self):
+        """
+        Test that the offset skips records after the position of the token.
+        """
+        self.api.add_records(PersonalData("John", f"{i} Main St", f"555-908-{i:04d}") for i in range(10))
+
+        page = self.api.get_records(limit=2, offset=3)
+        self.assertEqual([record.phone_number for record in page], ["555-908-0003", "555-908-0004"])
+        page = self.api.get_records(after=page.next_token, limit=2, offset=1)
+        self.assertEqual([record.phone_number for record in page], ["555-908-0006", "555-908-0007"])
+
+    def test_get_records_stable_under_inserts(self):
+        """
+        Test that records inserted between two pages do not shift the next page.
+        """
+        self.api.add_records(PersonalData("John", f"{i} Main St", f"555-908-{i:04d}") for i in range(4))
+
+        first = self.api.get_records(limit=2, order_by="phone_number")
+        self.api.add_record(PersonalData("Jane", "1 First St", "555-100-0000"))
+        second = self.api.get_records(after=first.next_token, limit=2, order_by="phone_number")
+        self.assertEqual([record.phone_number for record in second], ["555-908-0002", "555-908-0003"])
+
+    def test_get_records_invalid_token(self):
+        """
+        Test that malformed tokens and tokens issued for another sort key raise a ValueError.
+        """
+        self.api.add_records(PersonalData("John", f"{i} Main St", f"555-908-{i:04d}") for i in range(3))
+        token = self.api.get_records(limit=1).next_token
+
+        with self.assertRaises(ValueError):
+            self.api.get_records(after="not a token")
+        with self.assertRaises(ValueError):
+            self.api.get_records(after=token, order_by="name")
+        with self.assertRaises(ValueError):
+            self.api.get_records(limit=0)
+
+    def test_filter_page(self):
+        """
+        Test that paging through filtered records returns the same records as filter_records.
+        """
+        self.api.add_records(PersonalData(f"John {i}", f"{i} Main St", f"555-908-{i:04d}") for i in range(12))
+        self.api.add_record(PersonalData("Jane", "1 First St", "555-100-0000"))
+
+        records = []
+        token = None
+        while True:
+            page = self.api.filter_page("name", "john%", after=token, limit=5)
+            records.extend(page)
+            token = page.next_token
+            if token is None:
+                break
+        self.assertEqual(sorted(record.phone_number for record in records),
+                         sorted(record.phone_number for record in self.api.filter_records("name", "john%")))
+        self.assertEqual(len(records), 12)
+
+    def test_iter_records(self):
+        """
+        Test that records are read lazily, a few rows at a time, and that filters are standardized.
+        """
+        self.api.add_records(PersonalData(f"john {i}", f"{i} main st", f"555-908-{i:04d}") for i in range(5))
+
+        records = self.api.iter_records(arraysize=2)
+        self.assertEqual(next(records).phone_number, "555-908-0000")
+        self.assertEqual([record.phone_number for record in records], [f"555-908-{i:04d}" for i in range(1, 5)])
+
+        records = list(self.api.iter_records("name", "john 1%"))
+        self.assertEqual([(record.name, record.address) for record in records], [("John 1", "1 Main St")])
+
+    def test_iter_records_invalid_arguments(self):
+        """
+        Test that an invalid field or array size raises a ValueError before any record is requested.
+        """
+        with self.assertRaises(ValueError):
+            self.api.iter_records("email", "john%")
+        with self.assertRaises(ValueError):
+            self.api.iter_records(arraysize=0)
+
+    def test_filter_records_cache(self):
+        """
+        Test that repeated filters are served from the cache until a record is added.
+        """
+        self.api.add_record(PersonalData("John", "123 Main St", "555-908-1234"))
+        self.api.filter_records("name", "jo%")
+        hits = self.api.query_cache.stats.hits
+
+        self.assertEqual(len(self.api.filter_records("name", "jo%")), 1)
+        self.assertEqual(self.api.query_cache.stats.hits, hits + 1)
+
+        # Verify that the cached batch cannot be modified by the caller
+        self.api.filter_records("name", "jo%", as_batch=True).append("Joe", "1 First St", "555-100-0000")
+        self.assertEqual(len(self.api.filter_records("name", "jo%")), 1)
+
+        self.api.add_record(PersonalData("Joe", "456 Second St", "555-908-5678"))
+        self.assertEqual(len(self.api.filter_records("name", "jo%")), 2)
+
+    def test_filter_records_cache_other_connection(self):
+        """
+        Test that changes committed by another connection invalidate the cache.
+        """
+        self.api.add_record(PersonalData("John", "123 Main St", "555-908-1234"))
+        self.assertEqual(len(self.api.filter_records("name", "jo%")), 1)
+
+        with PersonalDataAPI() as other_api:
+            other_api.add_record(PersonalData("Joe", "456 Second St", "555-908-5678"))
+        self.assertEqual(len(self.api.filter_records("name", "jo%")), 2)
+
+        # Verify that SQL run directly on the connection also invalidates the cache
+        self.api.cursor.execute("DELETE FROM personal_data WHERE name = 'Joe'")
+        self.api.conn.commit()
+        self.assertEqual(len(self.api.filter_records("name", "jo%")), 1)
+
+
+class TestCommands(unittest.TestCase):
+    """Test the add, convert and import commands of the command-line interface."""
+
+    def setUp(self) -> None:
+        """Set up a database in a temporary directory."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.tempdir.name, "address_book.db")
+
+    def tearDown(self) -> None:
+        """Tear down the test case."""
+        self.tempdir.cleanup()
+
+    def run_command(self, *args: str) -> str:
+        """
+        Run a command on the database.
+
+        Args:
+            *args (str): The command and its arguments.
+
+        Returns:
+            str: The output of the command.
+        """
+        argv = ["personal_data_manager", "--database", self.database, *args]
+        with mock.patch.object(sys, "argv", argv), redirect_stdout(io.StringIO()) as output:
+            main()
+        return output.getvalue()
+
+    def run_import(self, file_name: str, content: str) -> str:
+        """
+        Write a file and import it in batches of two records.
+
+        Args:
+            file_name (str): The name of the file in the temporary directory.
+            content (str): The content of the file.
+
+        Returns:
+            str: The output of the command.
+        """
+        path = os.path.join(self.tempdir.name, file_name)
+        with open(path, "w") as f:
+            f.write(content)
+        return self.run_command("import", "-i", path, "-b", "2")
+
+    def test_add_duplicate_phone_number(self):
+        """
+        Test that the add command only reports a record as added when it was inserted.
+        """
+        output = self.run_command("add", "-n", "John", "-a", "123 Main St", "-p", "555-908-1234")
+        self.assertIn("Record added", output)
+
+        output = self.run_command("add", "-n", "Jane", "-a", "456 Second St", "-p", "555-908-1234")
+        self.assertIn("Error adding record", output)
+        self.assertNotIn("Record added", output)
+
+    def test_convert_empty_dataset(self):
+        """
+        Test that converting an empty dataset reports the error the same way with and without partitions.
+        """
+        output_file = os.path.join(self.tempdir.name, "out", "address_book.json")
+        os.mkdir(os.path.dirname(output_file))
+        outputs = [self.run_command("convert", "-f", "json", "-o", output_file, "-w", workers)
+                   for workers in ["1", "3"]]
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn("Error: No records found to serialize", outputs[1])
+        self.assertEqual(os.listdir(os.path.dirname(output_file)), [])
+
+    def test_convert_workers_with_several_formats(self):
+        """
+        Test that the workers option is rejected with several formats, which are exported in parallel anyway.
+        """
+        output_file = os.path.join(self.tempdir.name, "address_book.json")
+        with redirect_stderr(io.StringIO()) as errors, self.assertRaises(SystemExit):
+            self.run_command("convert", "-f", "json", "xml", "-o", output_file, "-w", "4")
+        self.assertIn("--workers only applies to a single format", errors.getvalue())
+
+    def test_import_reports_invalid_records(self):
+        """
+        Test that the invalid records are reported per batch while the other records are imported.
+        """
+        output = self.run_import("address_book.jsonl", "\n".join([
+            '{"name": "John", "address": "1 St", "phone_number": "555-908-1234"}',
+            '{"name": "Jane", "address": "2 St", "phone_number": "12345"}',
+            '{"name": ',
+            '{"name": "Jack", "address": "3 St", "phone_number": "555-908-9012"}',
+        ]))
+        self.assertIn("Batch 1: 1 invalid records skipped", output)
+        self.assertIn("Batch 2: 1 invalid records skipped, such as: Invalid JSON data on line 3", output)
+        self.assertIn("Imported 2 records", output)
+        self.assertIn("2 records failed", output)
+
+    def test_import_reports_partial_import(self):
+        """
+        Test that the records read before a malformed part of a document are imported and reported.
+        """
+        output = self.run_import("address_book.json", "[" + ", ".join(
+            f'{{"name": "Person {i}", "address": "{i} St", "phone_number": "555-908-{i:04d}"}}' for i in range(3)
+        ) + ", {oops")
+        self.assertIn("the records after the error were not imported: Invalid JSON data", output)
+        self.assertIn("Imported 3 records", output)
@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from personal_data_manager.api import PersonalDataAPI
+from personal_data_manager.async_api import AsyncPersonalDataAPI
+from personal_data_manager.models.personal_data import PersonalData
+
+
+class TestAsyncAPI(unittest.IsolatedAsyncioTestCase):
+    """Test the AsyncPersonalDataAPI class."""
+
+    async def asyncSetUp(self) -> None:
+        """Open the API on a new database file."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tempdir.name, "address_book.db")
+        self.cpu_executor = ThreadPoolExecutor(max_workers=2)
+        self.api = AsyncPersonalDataAPI(db_path=self.db_path, cpu_executor=self.cpu_executor, chunk_size=3)
+        await self.api.open()
+        self.records = [PersonalData(f"Person {i}", f"{i} Main St", f"555-908-{i:04d}") for i in range(10)]
+
+    async def asyncTearDown(self) -> None:
+        """Close the API and remove the database file."""
+        await self.api.close()
+        self.cpu_executor.shutdown()
+        self.tempdir.cleanup()
+
+    async def test_add_and_get_records(self) -> None:
+        """Test adding records and iterating over them asynchronously."""
+        await self.api.add_record(self.records[0])
+        report = await self.api.add_records(self.records[1:], batch_size=4)
+        self.assertEqual(report.inserted, 9)
+
+        records = [record async for record in self.api.get_all_records()]
+        self.assertEqual([str(record) for record in records], [str(record) for record in self.records])
+
+    async def test_add_records_from_async_iterable(self) -> None:
+        """Test that records from an async iterable are inserted batch by batch, reporting failed batches."""
+        async def produce():
+            for record in self.records + [self.records[0]]:
+                yield record
+
+        report = await self.api.add_records(produce(), batch_size=4)
+        self.assertEqual(report.inserted, 8)
+        self.assertEqual([(number, size) for number, size, _ in report.failed_batches], [(3, 3)])
+
+    async def test_add_records_async_iterable_error(self) -> None:
+        """Test that the records produced before an error are inserted and the error is reported."""
+        async def produce():
+            for record in self.records[:5]:
+                yield record
+            raise ValueError("Invalid JSON data on line 6")
+
+        report = await self.api.add_records(produce(), batch_size=4)
+        self.assertEqual(report.inserted, 5)
+        self.assertEqual(report.error, "Invalid JSON data on line 6")
+        self.assertEqual(len([record async for record in self.api.get_all_records()]), 5)
+
+    async def test_add_records_keeps_batch_error(self) -> None:
+        """Test that an error reported for a batch by the synchronous API is kept in the combined report."""
+        class Batch(list):
+            def __iter__(self):
+                yield from super().__iter__()
+                raise TypeError("Unexpected record")
+
+        sync_api = self.api._sync_api()
+        add_records = sync_api.add_records
+        with mock.patch.object(sync_api, "add_records",
+                                        lambda batch, batch_size: add_records(Batch(batch), batch_size)):
+            async def produce():
+                for record in self.records:
+                    yield record
+
+            report = await self.api.add_records(produce(), batch_size=4)
+        self.assertEqual(report.error, "Unexpected record")
+
+    async def test_get_all_records_reads_on_demand(self) -> None:
+        """Test that records are read one chunk at a time as they are consumed."""
+        await self.api.add_records(self.records)
+        records = self.api.get_all_records()
+        self.assertEqual(str(await records.__anext__()), str(self.records[0]))
+
+        # The remaining records are read in the following chunks
+        remaining = [record async for record in records]
+        self.assertEqual([str(record) for record in remaining], [str(record) for record in self.records[1:]])
+
+    async def test_filter_records(self) -> None:
+        """Test filtering records asynchronously."""
+        await self.api.add_records(self.records)
+        records = await self.api.filter_records("name", "Person 1%")
+        self.assertEqual([record.name for record in records], ["Person 1"])
+
+    async def test_convert_dataset(self) -> None:
+        """Test that the asynchronous export matches the synchronous one for several formats at once."""
+        await self.api.add_records(self.records)
+        with tempfile.TemporaryDirectory() as output_dir:
+            file_names = await self.api.convert_dataset(["json", "xml", "csv"], os.path.join(output_dir, "out"))
+            self.assertEqual([os.path.basename(name) for name in file_names],
+                             ["address_book.json", "address_book.xml", "address_book.csv"])
+
+            with PersonalDataAPI(db_path=self.db_path) as api:
+                for file_name in file_names:
+                    with open(file_name, "r") as f:
+                        content = f.read()
+                    fmt = os.path.splitext(file_name)[1][1:]
+                    api.convert_dataset(fmt, file_name)
+                    with open(os.path.join(output_dir, f"address_book_1.{fmt}"), "r") as f:
+                        self.assertEqual(content, f.read())
+
+    async def test_convert_empty_dataset(self) -> None:
+        """Test that converting an empty dataset raises a ValueError and leaves no file behind."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            with self.assertRaises(ValueError):
+                await self.api.convert_dataset("json", os.path.join(output_dir, "out"))
+            self.assertEqual(os.listdir(output_dir), [])
+
+    async def test_closed_api(self) -> None:
+        """Test that a closed API refuses calls."""
+        await self.api.close()
+        with self.assertRaises(RuntimeError):
+            await self.api.add_record(self.records[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
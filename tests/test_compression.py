@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+from personal_data_manager.streams.compression import (BackgroundCompressor, check_compression,
+                                                       compression_from_extension, open_compressed, open_decompressed,
+                                                       sniff_compression)
+
+
+class FailingCompressor:
+    """A compressor failing like a full disk."""
+
+    def compress(self, data: bytes) -> bytes:
+        raise OSError("No space left on device")
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class TestCompression(unittest.TestCase):
+    """Test the compressed streams."""
+
+    def setUp(self) -> None:
+        """Set up a temporary directory."""
+        self.tempdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """Tear down the test case."""
+        self.tempdir.cleanup()
+
+    def test_round_trip(self) -> None:
+        """
+        Test that text and bytes written through the background thread are read back by every compression.
+        """
+        text = "".join(f"Person {i},{i} Main St,555-908-{i % 10000:04d}\r\n" for i in range(20000))
+        for compression in ["gzip", "bz2", "xz"]:
+            file_name = os.path.join(self.tempdir.name, f"address_book.csv.{compression}")
+
+            # Write the text in small pieces, through a small buffer
+            with open_compressed(file_name, "w", compression, level=1) as f:
+                f.buffer.buffer_size = 4096
+                for start in range(0, len(text), 1000):
+                    f.write(text[start:start + 1000])
+            stats = f.buffer.stats
+            self.assertEqual((stats.compression, stats.level), (compression, 1))
+            self.assertEqual(stats.raw_bytes, len(text.encode()))
+            self.assertEqual(stats.compressed_bytes, os.path.getsize(file_name))
+            self.assertGreater(stats.ratio, 1)
+
+            self.assertEqual(sniff_compression(file_name), compression)
+            with open_decompressed(file_name, "r", compression) as f:
+                self.assertEqual(f.read(), text)
+
+            with open_compressed(file_name, "wb", compression) as f:
+                f.write(b"\x00\x01" * 1000)
+            with open_decompressed(file_name, "rb", compression) as f:
+                self.assertEqual(f.read(), b"\x00\x01" * 1000)
+
+    def test_detection(self) -> None:
+        """
+        Test detecting the compression of files from their extension and their first bytes.
+        """
+        self.assertEqual(compression_from_extension("exports/address_book.csv.gz"), "gzip")
+        self.assertEqual(compression_from_extension("address_book.JSON.XZ"), "xz")
+        self.assertEqual(compression_from_extension("address_book.bin.zst"), "zstd")
+        self.assertIsNone(compression_from_extension("address_book.csv"))
+
+        file_name = os.path.join(self.tempdir.name, "address_book.csv")
+        with open(file_name, "w") as f:
+            f.write("John Doe,123 Main St,555-908-1234\n")
+        self.assertIsNone(sniff_compression(file_name))
+
+    def test_check_compression(self) -> None:
+        """
+        Test the default levels and the validation of the compressions and levels.
+        """
+        self.assertEqual(check_compression("gzip"), 6)
+        self.assertEqual(check_compression("bz2"), 9)
+        self.assertEqual(check_compression("xz", 0), 0)
+        for compression, level in [("zip", None), ("gzip", 10), ("bz2", 0), ("xz", -1)]:
+            with self.assertRaises(ValueError):
+                check_compression(compression, level)
+
+    def test_background_error(self) -> None:
+        """
+        Test that an error of the compression thread is raised in the writing thread.
+        """
+        compressor = BackgroundCompressor(os.path.join(self.tempdir.name, "address_book.csv.gz"), "gzip",
+                                          buffer_size=10)
+        compressor._compressor = FailingCompressor()
+        with self.assertRaises(OSError):
+            for _ in range(100):
+                compressor.write(b"John Doe,123 Main St,555-908-1234\n")
+            compressor.close()
+
+        # Closing the stream after the error stops the thread
+        compressor.close()
+        self.assertTrue(compressor.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from personal_data_manager.api import PersonalDataAPI
+from personal_data_manager.database import ConnectionPool
+from personal_data_manager.models.personal_data import PersonalData
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test the ConnectionPool class and its use by the PersonalDataAPI class."""
+
+    def setUp(self) -> None:
+        """Set up a pool on a new database file."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tempdir.name, "address_book.db")
+        self.pool = ConnectionPool(self.db_path, max_connections=4, synchronous="full", cache_size=-2000,
+                                   mmap_size=0, busy_timeout=10000)
+
+    def tearDown(self) -> None:
+        """Close the pool and remove the database file."""
+        self.pool.close()
+        self.tempdir.cleanup()
+
+    def test_pragmas(self) -> None:
+        """Test that connections are opened with the settings of the pool."""
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 2)
+            self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -2000)
+            self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 10000)
+
+    def test_invalid_settings(self) -> None:
+        """Test that invalid settings are rejected."""
+        with self.assertRaises(ValueError):
+            ConnectionPool(self.db_path, synchronous="sometimes")
+        with self.assertRaises(ValueError):
+            ConnectionPool(self.db_path, max_connections=0)
+
+    def test_reuse_and_validation(self) -> None:
+        """Test that released connections are reused and that closed connections are replaced."""
+        conn = self.pool.acquire()
+        self.pool.release(conn)
+        self.assertIs(self.pool.acquire(), conn)
+
+        # A connection closed by its user is discarded on release
+        conn.close()
+        self.pool.release(conn)
+        replacement = self.pool.acquire()
+        self.assertIsNot(replacement, conn)
+        self.assertEqual(replacement.execute("SELECT 1").fetchone(), (1,))
+        self.pool.release(replacement)
+
+    def test_acquire_timeout(self) -> None:
+        """Test that checking out more connections than the maximum waits and then times out."""
+        connections = [self.pool.acquire() for _ in range(self.pool.max_connections)]
+        with self.assertRaises(TimeoutError):
+            self.pool.acquire(timeout=0.05)
+        for conn in connections:
+            self.pool.release(conn)
+
+    def test_closed_pool(self) -> None:
+        """Test that a closed pool refuses checkouts."""
+        self.pool.close()
+        with self.assertRaises(RuntimeError):
+            self.pool.acquire()
+
+    def test_api_lifecycle(self) -> None:
+        """Test that the API returns its connection to a shared pool when it is closed."""
+        with PersonalDataAPI(pool=self.pool) as api:
+            api.add_record(PersonalData("John Doe", "123 Main St", "555-908-1234"))
+            conn = api.conn
+        self.assertIsNone(api.conn)
+        self.assertFalse(self.pool.closed)
+        self.assertIs(self.pool.acquire(), conn)
+
+    def test_api_owned_pool(self) -> None:
+        """Test that an API created with a database path closes its own pool."""
+        api = PersonalDataAPI(db_path=self.db_path)
+        api.close()
+        self.assertTrue(api.pool.closed)
+
+    def test_concurrent_writers(self) -> None:
+        """Test that API objects writing from several threads wait for each other instead of failing."""
+        PersonalDataAPI(pool=self.pool).close()
+        errors = []
+
+        def add_records(thread: int) -> None:
+            try:
+                with PersonalDataAPI(pool=self.pool) as api:
+                    for i in range(25):
+                        api.add_record(PersonalData(f"Person {thread}", f"{i} Main St", f"555-{thread:03d}-{i:04d}"))
+            except sqlite3.Error as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=add_records, args=(thread,)) for thread in range(self.pool.max_connections)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT count(*) FROM personal_data").fetchone()[0], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
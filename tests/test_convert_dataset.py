@@ -1,9 +1,11 @@
+import json
 import os
 import tempfile
 import unittest
 
 from personal_data_manager.api import PersonalDataAPI
 from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.streams.compression import open_decompressed
 
 
 class TestConvertDataset(unittest.TestCase):
@@ -26,8 +28,8 @@ class TestConvertDataset(unittest.TestCase):
         self.api.cursor.execute("DELETE FROM personal_data WHERE name=?", ("Alice",))
         self.api.conn.commit()
 
-        # Delete the PersonalDataAPI instance to close the database connection
-        del self.api
+        # Close the PersonalDataAPI instance to release the database connection
+        self.api.close()
 
     def test_convert_dataset_csv(self):
         """Test converting the dataset to CSV format."""
@@ -97,3 +99,154 @@ class TestConvertDataset(unittest.TestCase):
             with open(file_path, "r") as f:
                 self.assertEqual(f.read(), '- address: 123 Main St\n  name: Alice\n  phone_number: 555-123-4567\n')
 
+
+    def test_convert_dataset_multiple_formats(self):
+        """Test converting the dataset to several formats at once, in parallel."""
+        with tempfile.TemporaryDirectory() as tempdir:
+            self.api.convert_dataset(["csv", "json", "xml", "yaml"], os.path.join(tempdir, "address_book"))
+
+            # Verify that each format was written to its own file with the same content as a single export
+            self.assertEqual(sorted(os.listdir(tempdir)),
+                             ["address_book.csv", "address_book.json", "address_book.xml", "address_book.yaml"])
+            with open(os.path.join(tempdir, "address_book.json"), "r") as f:
+                self.assertEqual(f.read(),
+                                 '[{"name": "Alice", "address": "123 Main St", "phone_number": "555-123-4567"}]')
+
+    def test_convert_dataset_partitioned(self):
+        """Test that exporting a single format with several workers matches a single-worker export."""
+        records = [PersonalData(name=f"Worker {i}", address=f"{i} Main St", phone_number=f"555-300-{i:04d}")
+                   for i in range(10)]
+        self.api.add_records(records)
+        try:
+            for fmt in ["csv", "json", "xml", "text"]:
+                with tempfile.TemporaryDirectory() as tempdir:
+                    self.api.convert_dataset(fmt, os.path.join(tempdir, "single"))
+                    self.api.convert_dataset(fmt, os.path.join(tempdir, "partitioned"), workers=4, use_cache=False)
+
+                    # Verify that the fragments were stitched into the second file and removed
+                    self.assertEqual(sorted(os.listdir(tempdir)), [f"address_book.{fmt}", f"address_book_1.{fmt}"])
+                    with open(os.path.join(tempdir, f"address_book.{fmt}"), "rb") as single, \
+                            open(os.path.join(tempdir, f"address_book_1.{fmt}"), "rb") as partitioned:
+                        self.assertEqual(partitioned.read(), single.read())
+        finally:
+            self.api.cursor.execute("DELETE FROM personal_data WHERE name LIKE 'Worker %'")
+            self.api.conn.commit()
+
+    def test_convert_dataset_binary(self):
+        """Test converting the dataset to the binary format, with one and several workers."""
+        records = [PersonalData(name=f"Binary {i}", address=f"{i} Main St", phone_number=f"555-301-{i:04d}")
+                   for i in range(10)]
+        self.api.add_records(records)
+        serializer = self.api.serializer_factory.create_serializer("binary")
+        try:
+            with tempfile.TemporaryDirectory() as tempdir:
+                self.api.convert_dataset("binary", os.path.join(tempdir, "single"))
+                self.api.convert_dataset("binary", os.path.join(tempdir, "partitioned"), workers=4, use_cache=False)
+
+                # Verify that both files hold every record, although their blocks may differ
+                expected = [str(record) for record in self.api.get_all_records()]
+                for file_name in ["address_book.binary", "address_book_1.binary"]:
+                    with open(os.path.join(tempdir, file_name), "rb") as f:
+                        self.assertEqual([str(record) for record in serializer.deserialize_iter(f)], expected)
+        finally:
+            self.api.cursor.execute("DELETE FROM personal_data WHERE name LIKE 'Binary %'")
+            self.api.conn.commit()
+
+    def test_convert_dataset_compressed(self):
+        """Test that compressed exports hold the same document as uncompressed ones."""
+        with tempfile.TemporaryDirectory() as tempdir:
+            self.api.convert_dataset("json", os.path.join(tempdir, "address_book"))
+            self.api.convert_dataset("json", os.path.join(tempdir, "address_book.gz"))
+            self.api.convert_dataset(["json", "text"], os.path.join(tempdir, "address_book"), compression="bz2",
+                                     compression_level=1)
+            self.assertEqual(sorted(os.listdir(tempdir)), ["address_book.json", "address_book.json.bz2",
+                                                           "address_book.json.gz", "address_book.text.bz2"])
+
+            with open(os.path.join(tempdir, "address_book.json"), "r") as f:
+                expected = f.read()
+            for file_name, compression in [("address_book.json.gz", "gzip"), ("address_book.json.bz2", "bz2")]:
+                with open_decompressed(os.path.join(tempdir, file_name), "r", compression) as f:
+                    self.assertEqual(f.read(), expected)
+
+    def test_convert_dataset_since_checkpoint(self):
+        """Test that a delta export saves the records changed since a checkpoint, the deletions and a new checkpoint."""
+        self.api.add_record(PersonalData(name="Carol", address="1 Elm St", phone_number="555-123-8888"))
+        checkpoint = self.api.change_log.checkpoint()
+        try:
+            self.api.update_record("555-123-4567", PersonalData("Alice", "9 New St", "555-123-4567"))
+            self.api.delete_record("555-123-8888")
+            self.api.add_record(PersonalData(name="Dave", address="2 Oak St", phone_number="555-123-7777"))
+
+            with tempfile.TemporaryDirectory() as tempdir:
+                self.api.convert_dataset("json", os.path.join(tempdir, "address_book"), since=checkpoint)
+                with open(os.path.join(tempdir, "address_book_delta.json"), "r") as f:
+                    self.assertEqual([record["name"] for record in json.load(f)], ["Alice", "Dave"])
+                with open(os.path.join(tempdir, "address_book_delta.json.checkpoint.json"), "r") as f:
+                    manifest = json.load(f)
+                self.assertEqual((manifest["since"], manifest["records"], manifest["deleted"]),
+                                 (checkpoint, 2, ["555-123-8888"]))
+                self.assertEqual(manifest["checkpoint"], self.api.change_log.checkpoint())
+
+                # Verify that nothing changed since the new checkpoint
+                self.api.convert_dataset("csv", os.path.join(tempdir, "address_book"), since=manifest["checkpoint"])
+                with open(os.path.join(tempdir, "address_book_delta.csv.checkpoint.json"), "r") as f:
+                    manifest = json.load(f)
+                self.assertEqual((manifest["records"], manifest["deleted"]), (0, []))
+        finally:
+            self.api.delete_record("555-123-8888")
+            self.api.delete_record("555-123-7777")
+
+    def test_convert_dataset_since_invalid_checkpoint(self):
+        """Test that a delta export since an invalid checkpoint raises a ValueError and saves no file."""
+        with tempfile.TemporaryDirectory() as tempdir:
+            for checkpoint in ["not a checkpoint", "another-dataset:0:0"]:
+                with self.subTest(checkpoint=checkpoint), self.assertRaises(ValueError):
+                    self.api.convert_dataset("json", os.path.join(tempdir, "address_book"), since=checkpoint)
+            with self.assertRaises(ValueError):
+                self.api.convert_dataset("json", preview=True, since="not a checkpoint")
+            self.assertEqual(os.listdir(tempdir), [])
+        self.assertFalse(self.api.conn.in_transaction)
+
+    def test_convert_dataset_since_in_transaction(self):
+        """Test that a delta export works within a transaction left open on the connection, and keeps it open."""
+        checkpoint = self.api.change_log.checkpoint()
+        self.api.cursor.execute("INSERT INTO personal_data (name, address, phone_number) "
+                                "VALUES ('Erin', '3 Pine St', '555-123-6666')")
+        try:
+            self.assertTrue(self.api.conn.in_transaction)
+            with tempfile.TemporaryDirectory() as tempdir:
+                self.api.convert_dataset("json", os.path.join(tempdir, "address_book"), since=checkpoint)
+                with open(os.path.join(tempdir, "address_book_delta.json"), "r") as f:
+                    self.assertEqual([record["name"] for record in json.load(f)], ["Erin"])
+            self.assertTrue(self.api.conn.in_transaction)
+        finally:
+            self.api.conn.rollback()
+
+    def test_convert_dataset_cache(self):
+        """Test that exporting an unchanged dataset again copies the cached file, until a record is added."""
+        # Verify that exports are not cached unless a cache directory is given
+        self.assertIsNone(self.api.export_cache)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_dir = os.path.join(tempdir, "cache")
+            with PersonalDataAPI(export_cache_dir=cache_dir) as api:
+                api.convert_dataset("json", os.path.join(tempdir, "address_book"))
+                api.convert_dataset("json", os.path.join(tempdir, "address_book"))
+                self.assertEqual((api.export_cache.stats.hits, api.export_cache.stats.misses), (1, 1))
+                with open(os.path.join(tempdir, "address_book.json"), "r") as first, \
+                        open(os.path.join(tempdir, "address_book_1.json"), "r") as second:
+                    self.assertEqual(second.read(), first.read())
+
+                # Verify that other serializer options and new records are not served from the cache
+                api.convert_dataset("xml", os.path.join(tempdir, "address_book"))
+                api.convert_dataset("xml", os.path.join(tempdir, "address_book"),
+                                    format_options={"xml": {"pretty": False}})
+                api.add_record(PersonalData(name="Bob", address="456 Second St", phone_number="555-123-9999"))
+                try:
+                    api.convert_dataset("json", os.path.join(tempdir, "address_book"))
+                finally:
+                    api.delete_record("555-123-9999")
+                self.assertEqual(api.export_cache.stats.hits, 1)
+                self.assertEqual(len(api.export_cache), 4)
+                with open(os.path.join(tempdir, "address_book_2.json"), "r") as f:
+                    self.assertIn("Bob", f.read())
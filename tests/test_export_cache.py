@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+import unittest
+
+from personal_data_manager.export_cache import ExportCache
+from personal_data_manager.serializers import XMLSerializer
+
+
+class TestExportCache(unittest.TestCase):
+    """Test the ExportCache class."""
+
+    def setUp(self) -> None:
+        """Set up an empty cache in a temporary directory."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = ExportCache(os.path.join(self.tempdir.name, "cache"), max_bytes=100, max_entries=3)
+
+    def tearDown(self) -> None:
+        """Tear down the test case."""
+        self.tempdir.cleanup()
+
+    def _export(self, name: str, size: int) -> str:
+        """Write an exported file of the given size."""
+        file_name = os.path.join(self.tempdir.name, name)
+        with open(file_name, "w") as f:
+            f.write("x" * size)
+        return file_name
+
+    def test_key(self) -> None:
+        """
+        Test that the key depends on the format, the serializer options and the dataset version.
+        """
+        key = ExportCache.key("xml", XMLSerializer(), "id:0:1:1")
+        self.assertEqual(key, ExportCache.key("xml", XMLSerializer(), "id:0:1:1"))
+        self.assertNotEqual(key, ExportCache.key("xml", XMLSerializer(pretty=False), "id:0:1:1"))
+        self.assertNotEqual(key, ExportCache.key("xml", XMLSerializer(), "id:0:2:2"))
+
+    def test_store_and_fetch(self) -> None:
+        """
+        Test that a stored export is copied back on a hit, and that unknown keys are misses.
+        """
+        self.cache.store("a", self._export("a.json", 10))
+        copy = os.path.join(self.tempdir.name, "copy.json")
+
+        self.assertTrue(self.cache.fetch("a", copy))
+        self.assertFalse(self.cache.fetch("b", copy))
+        with open(copy, "r") as f:
+            self.assertEqual(f.read(), "x" * 10)
+        self.assertEqual((self.cache.stats.hits, self.cache.stats.misses), (1, 1))
+
+    def test_eviction(self) -> None:
+        """
+        Test that the least recently used exports are evicted beyond the size and entry limits.
+        """
+        for key in ["a", "b", "c"]:
+            self.cache.store(key, self._export(f"{key}.json", 30))
+            time.sleep(0.01)
+
+        # Use "a" so that "b" is the least recently used export
+        self.cache.fetch("a", os.path.join(self.tempdir.name, "copy.json"))
+        time.sleep(0.01)
+        self.cache.store("d", self._export("d.json", 30))
+        self.assertEqual(len(self.cache), 3)
+        self.assertFalse(self.cache.fetch("b", os.path.join(self.tempdir.name, "copy.json")))
+
+        # Verify that the size limit evicts exports and that larger exports are not cached
+        self.cache.store("e", self._export("e.json", 60))
+        self.assertEqual(len(self.cache), 2)
+        self.cache.store("f", self._export("f.json", 101))
+        self.assertFalse(self.cache.fetch("f", os.path.join(self.tempdir.name, "copy.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from personal_data_manager.database import ChangeLog, DatasetVersion, FullTextIndex, IndexRegistry, Migrator
+from personal_data_manager.main import main
+
+
+class TestMigrations(unittest.TestCase):
+    """Test the schema migrations of the personal data database."""
+
+    def setUp(self) -> None:
+        """Set up an in-memory database with the original schema and unconstrained data."""
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE personal_data (name TEXT, address TEXT, phone_number TEXT)")
+        self.conn.executemany(
+            "INSERT INTO personal_data VALUES (?, ?, ?)",
+            [
+                ("John", "123 Main St", "555-908-1234"),
+                ("Jane", "456 Second St", "555-908-5678"),
+                ("Johnny", "789 Third St", "555-908-1234"),   # duplicate phone number
+                ("", "1 Empty St", "555-908-0000"),           # empty name
+                ("Jack", None, "555-908-9012"),               # missing address
+                ("Jill", "10 Fourth St", "555-908-3456"),
+            ],
+        )
+        self.conn.commit()
+        self.migrator = Migrator(self.conn)
+
+    def tearDown(self) -> None:
+        """Tear down the test case."""
+        self.conn.close()
+
+    def test_upgrade_original_database(self):
+        """
+        Test that an original database is upgraded in place in batches, keeping the valid rows and their rowids.
+        """
+        progress = []
+        applied = self.migrator.upgrade(batch_size=2,
+                                        progress=lambda copied, rejected: progress.append((copied, rejected)))
+
+        # Verify that every migration was applied and that the copy ran in batches
+        self.assertEqual([migration.version for migration in applied], [1, 2, 3, 4])
+        self.assertEqual(self.migrator.current_version(), self.migrator.latest_version)
+        self.assertEqual(self.migrator.pending(), [])
+        self.assertEqual(progress, [(2, 0), (2, 2), (3, 3)])
+
+        # Verify that the rows violating the new constraints were not copied and the others kept their rowids
+        rows = self.conn.execute("SELECT id, name, phone_digits FROM personal_data ORDER BY id").fetchall()
+        self.assertEqual(rows, [(1, "John", "5559081234"), (2, "Jane", "5559085678"), (6, "Jill", "5559083456")])
+
+        # Verify that the rows violating the new constraints were kept in the rejected table
+        rejected = self.conn.execute("SELECT id, name, reason, duplicate_of FROM personal_data_rejected ORDER BY id")
+        self.assertEqual(rejected.fetchall(), [(3, "Johnny", "duplicate phone number", 1), (4, "", "empty field", None),
+                                               (5, "Jack", "empty field", None)])
+        self.assertEqual(self.migrator.rejected_rows(), 3)
+
+        # Verify that the new constraints are enforced
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.conn.execute("INSERT INTO personal_data (name, address, phone_number) VALUES ('A', 'B', '5559081234')")
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.conn.execute("INSERT INTO personal_data (name, address, phone_number) VALUES ('A', NULL, '1')")
+
+    def test_upgrade_is_idempotent(self):
+        """
+        Test that upgrading an up-to-date database does nothing.
+        """
+        self.migrator.upgrade()
+        self.assertEqual(self.migrator.upgrade(), [])
+
+    def test_upgrade_keeps_full_text_index(self):
+        """
+        Test that the full-text index triggers survive the table rebuild.
+        """
+        if not FullTextIndex.is_available(self.conn):
+            self.skipTest("SQLite was compiled without FTS5")
+
+        self.conn.execute("PRAGMA user_version = 1")
+        full_text_index = FullTextIndex(self.conn)
+        full_text_index.enable()
+        self.migrator.upgrade()
+
+        with self.conn:
+            self.conn.execute("INSERT INTO personal_data (name, address, phone_number) VALUES ('Ann', 'Maple', '1')")
+        self.assertEqual(full_text_index.search("maple"), [("Ann", "Maple", "1")])
+        self.assertEqual(full_text_index.search("john"), [("John", "123 Main St", "555-908-1234")])
+
+    def test_dataset_version_changes(self):
+        """
+        Test that the dataset version changes with every insert, update and delete, but not with reads.
+        """
+        self.migrator.upgrade()
+        dataset_version = DatasetVersion(self.conn)
+        versions = [dataset_version.current()]
+
+        with self.conn:
+            self.conn.execute("INSERT INTO personal_data (name, address, phone_number) VALUES ('Ann', 'Maple', '1')")
+        versions.append(dataset_version.current())
+        with self.conn:
+            self.conn.execute("UPDATE personal_data SET address = 'Oak' WHERE name = 'Ann'")
+        versions.append(dataset_version.current())
+
+        # Replace the last row by a row reusing its id
+        with self.conn:
+            self.conn.execute("DELETE FROM personal_data WHERE name = 'Ann'")
+            self.conn.execute("INSERT INTO personal_data (name, address, phone_number) VALUES ('Bob', 'Elm', '2')")
+        versions.append(dataset_version.current())
+
+        # Delete a row other than the last one
+        with self.conn:
+            self.conn.execute("INSERT INTO personal_data (name, address, phone_number) VALUES ('Cy', 'Ash', '3')")
+        versions.append(dataset_version.current())
+        with self.conn:
+            self.conn.execute("DELETE FROM personal_data WHERE name = 'Bob'")
+        versions.append(dataset_version.current())
+
+        self.assertEqual(len(set(versions)), 6)
+        self.assertEqual(dataset_version.current(), versions[-1])
+
+
+    def test_change_log(self):
+        """
+        Test that the rows changed since a checkpoint are found through the log, including reused ids.
+        """
+        self.migrator.upgrade()
+        change_log = ChangeLog(self.conn)
+        checkpoint = change_log.checkpoint()
+
+        # Update a row, then delete the last row and insert a row reusing an id below the largest id of the checkpoint
+        with self.conn:
+            self.conn.execute("UPDATE personal_data SET address = 'Oak' WHERE name = 'John'")
+            self.conn.execute("DELETE FROM personal_data WHERE name = 'Jill'")
+            self.conn.execute("INSERT INTO personal_data (name, address, phone_number) VALUES ('Bob', 'Elm', '2')")
+
+        query, parameters = change_log.changed_rows_query(checkpoint, columns="id, name")
+        self.assertEqual(self.conn.execute(query, parameters).fetchall(), [(1, "John"), (3, "Bob")])
+        self.assertEqual(change_log.deleted_phone_numbers(checkpoint), ["555-908-3456"])
+
+        # Verify that pruning the log invalidates the older checkpoints
+        with self.conn:
+            self.assertEqual(change_log.prune(change_log.checkpoint()), 2)
+        with self.assertRaises(ValueError):
+            change_log.changed_rows_query(checkpoint)
+        query, parameters = change_log.changed_rows_query(change_log.checkpoint())
+        self.assertEqual(self.conn.execute(query, parameters).fetchall(), [])
+
+class TestMigrateCommand(unittest.TestCase):
+    """Test the migrate command of the command-line interface."""
+
+    def setUp(self) -> None:
+        """Set up a database path in a temporary directory."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.tempdir.name, "address_book.db")
+
+    def tearDown(self) -> None:
+        """Tear down the test case."""
+        self.tempdir.cleanup()
+
+    def run_migrate(self, *args: str) -> str:
+        """
+        Run the migrate command on the database.
+
+        Args:
+            *args (str): The arguments of the command.
+
+        Returns:
+            str: The output of the command.
+        """
+        argv = ["personal_data_manager", "--database", self.database, "migrate", *args]
+        with mock.patch.object(sys, "argv", argv), redirect_stdout(io.StringIO()) as output:
+            main()
+        return output.getvalue()
+
+    def test_migrate_new_database(self):
+        """
+        Test that a new database is migrated to the latest version, with its indexes created afterwards.
+        """
+        latest_version = Migrator(sqlite3.connect(":memory:")).latest_version
+        self.assertIn(f"Schema version: 0 (latest: {latest_version})", self.run_migrate("--status"))
+
+        output = self.run_migrate()
+        self.assertIn(f"Applied migration {latest_version}:", output)
+        self.assertIn("The database schema is up to date.", self.run_migrate())
+
+        conn = sqlite3.connect(self.database)
+        try:
+            indexes = IndexRegistry(conn, install=False)
+            for name, _, _ in indexes.definitions():
+                self.assertIn(name, indexes.existing_indexes())
+        finally:
+            conn.close()
+
+    def test_migrate_reports_rejected_rows(self):
+        """
+        Test that the command reports the rows moved to the rejected table.
+        """
+        conn = sqlite3.connect(self.database)
+        with conn:
+            conn.execute("CREATE TABLE personal_data (name TEXT, address TEXT, phone_number TEXT)")
+            conn.executemany("INSERT INTO personal_data VALUES (?, ?, ?)",
+                             [("John", "123 Main St", "555-908-1234"), ("Johnny", "789 Third St", "555 908 1234")])
+        conn.close()
+
+        self.assertIn("1 records with an empty field or a duplicate phone number were moved", self.run_migrate())
+
+if __name__ == "__main__":
+    unittest.main()
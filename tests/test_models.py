@@ -1,3 +1,4 @@
+import sqlite3
 import unittest
 
 from personal_data_manager.models.personal_data import PersonalData
@@ -48,6 +49,34 @@ class TestPersonalData(unittest.TestCase):
         with self.assertRaises(TypeError):
             PersonalData("John Doe", "123 Main St", 5551234)
 
+    def test_from_row(self):
+        """
+        Test that creating a PersonalData object from a trusted row sets its attributes without a __dict__.
+        """
+        person = PersonalData.from_row(("John Doe", "123 Main St", "555-908-1234"))
+
+        # Verify that the object was created with the correct attributes
+        self.assertEqual(str(person), "John Doe, 123 Main St, 555-908-1234")
+        self.assertEqual(person.to_dict(), {"name": "John Doe", "address": "123 Main St", "phone_number": "555-908-1234"})
+
+        # Verify that the attributes are stored in slots
+        self.assertFalse(hasattr(person, "__dict__"))
+
+    def test_row_factory(self):
+        """
+        Test that the row factory returns the rows of an SQLite cursor as PersonalData objects.
+        """
+        conn = sqlite3.connect(":memory:")
+        cursor = conn.cursor()
+        cursor.row_factory = PersonalData.row_factory
+        cursor.execute("SELECT 'John Doe', '123 Main St', '555-908-1234'")
+
+        person = cursor.fetchone()
+        conn.close()
+
+        self.assertIsInstance(person, PersonalData)
+        self.assertEqual(person.phone_number, "555-908-1234")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,13 @@
 import unittest
 import textwrap
+from io import StringIO
 
 from personal_data_manager.models.personal_data import PersonalData
 from personal_data_manager.display_formatters.csv_display_fmt import CSVDisplayFormatter
 from personal_data_manager.display_formatters.html_display_fmt import HTMLDisplayFormatter
 from personal_data_manager.display_formatters.display_fmt_factory import DisplayFormatterFactory
 from personal_data_manager.display_formatters.text_display_fmt import TextDisplayFormatter
+from personal_data_manager.streams import ChunkWriter
 
 
 class TestOutputFormatters(unittest.TestCase):
@@ -115,3 +117,22 @@ class TestOutputFormatters(unittest.TestCase):
         """
         with self.assertRaises(ValueError):
             DisplayFormatterFactory.create_formatter("invalid_format", [])
+
+    def test_write_to_stream(self):
+        """
+        Test that writing formatted records to a stream in small chunks produces the same output as display_format.
+        """
+        records = [PersonalData(f"Person {i}", f"{i} Main St", "555-908-1234") for i in range(50)]
+        for output_format in ["text", "html", "csv", "yaml"]:
+            formatter = DisplayFormatterFactory.create_formatter(output_format, records)
+
+            # Write through a chunk writer with a small buffer, so it is flushed several times
+            stream = StringIO()
+            with ChunkWriter(stream, buffer_size=100) as writer:
+                formatter.write_records(writer, records)
+            self.assertEqual(stream.getvalue(), formatter.display_format(records))
+
+            # Write through the formatter's own stream method
+            stream = StringIO()
+            formatter.write_to(stream, records)
+            self.assertEqual(stream.getvalue(), formatter.display_format(records))
@@ -0,0 +1,167 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from personal_data_manager import plugins
+from personal_data_manager.display_formatters.display_fmt_factory import DisplayFormatterFactory
+from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.serializers import JSONSerializer, SerializerFactory
+
+# The module of an installed distribution providing a serializer and a display formatter
+PLUGIN_MODULE = '''
+from personal_data_manager.display_formatters.text_display_fmt import TextDisplayFormatter
+from personal_data_manager.models.record_batch import iter_rows
+from personal_data_manager.serializers.text_ser import TextSerializer
+
+
+class PipeSerializer(TextSerializer):
+    def serialize_chunk(self, records):
+        return "".join(f"{name}|{address}|{phone_number}\\n" for name, address, phone_number in iter_rows(records))
+
+    @staticmethod
+    def _parse_line(line):
+        return TextSerializer._parse_line(line.replace("|", ","))
+
+
+class PipeDisplayFormatter(TextDisplayFormatter):
+    pass
+
+
+class NotASerializer:
+    pass
+'''
+
+# The entry points of the distribution, including a format shadowed by a built-in one and broken formats
+ENTRY_POINTS = """
+[personal_data_manager.serializers]
+pipe = pipe_formats:PipeSerializer
+json = pipe_formats:PipeSerializer
+missing = pipe_formats:MissingSerializer
+invalid = pipe_formats:NotASerializer
+broken = broken_formats:BrokenSerializer
+
+[personal_data_manager.display_formatters]
+pipe = pipe_formats:PipeDisplayFormatter
+"""
+
+
+class TestPlugins(unittest.TestCase):
+    """Test the formats added by installed distributions through entry points."""
+
+    def setUp(self) -> None:
+        """Install a distribution with format plugins in a temporary sys.path entry."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.site = os.path.join(self.tempdir.name, "site")
+        self.cache_path = os.path.join(self.tempdir.name, "cache", "entry_points.json")
+        self._install("pipe_formats", ENTRY_POINTS)
+        with open(os.path.join(self.site, "pipe_formats.py"), "w") as f:
+            f.write(PLUGIN_MODULE)
+        with open(os.path.join(self.site, "broken_formats.py"), "w") as f:
+            f.write("import pdm_missing_dependency\n")
+
+        sys.path.insert(0, self.site)
+        self._rediscover()
+
+    def tearDown(self) -> None:
+        """Uninstall the distribution and forget its plugins."""
+        sys.path.remove(self.site)
+        sys.modules.pop("pipe_formats", None)
+        sys.modules.pop("broken_formats", None)
+        self._rediscover()
+        self.tempdir.cleanup()
+
+    def _install(self, name: str, entry_points: str) -> None:
+        """Write the metadata of a distribution declaring entry points."""
+        dist_info = os.path.join(self.site, f"{name}-1.0.dist-info")
+        os.makedirs(dist_info)
+        with open(os.path.join(dist_info, "METADATA"), "w") as f:
+            f.write(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n")
+        with open(os.path.join(dist_info, "entry_points.txt"), "w") as f:
+            f.write(entry_points)
+
+    def _rediscover(self) -> None:
+        """Scan the installed distributions again and forget the loaded classes."""
+        plugins.discover_entry_points(cache_path=self.cache_path, refresh=True)
+        SerializerFactory.registry.clear()
+        DisplayFormatterFactory.registry.clear()
+
+    def test_supported_formats(self) -> None:
+        """
+        Test that the formats of plugins are listed after the built-in formats, which shadow them.
+        """
+        formats = SerializerFactory.get_supported_formats()
+        self.assertEqual(formats[:len(SerializerFactory.SERIALIZERS)], list(SerializerFactory.SERIALIZERS))
+        self.assertEqual(formats[len(SerializerFactory.SERIALIZERS):], ["pipe", "missing", "invalid", "broken"])
+        self.assertIn("pipe", DisplayFormatterFactory.get_supported_formats())
+        self.assertEqual(SerializerFactory.registry.plugins()["pipe"], "pipe_formats:PipeSerializer")
+
+    def test_create_plugin_serializer(self) -> None:
+        """
+        Test that a plugin serializer is imported on first use and round-trips records.
+        """
+        self.assertNotIn("pipe_formats", sys.modules)
+        serializer = SerializerFactory.create_serializer("pipe")
+        self.assertIs(SerializerFactory.get_serializer_class("pipe"), type(serializer))
+
+        records = [PersonalData("John Doe", "123 Main St", "555-908-1234")]
+        serialized = serializer.serialize(records)
+        self.assertEqual(serialized, "John Doe|123 Main St|555-908-1234\n")
+        self.assertEqual(serializer.deserialize(serialized)[0].phone_number, "555-908-1234")
+
+        formatter = DisplayFormatterFactory.create_formatter("pipe", records)
+        self.assertEqual(type(formatter).__name__, "PipeDisplayFormatter")
+
+    def test_builtin_format_precedence(self) -> None:
+        """
+        Test that a plugin cannot replace a built-in format.
+        """
+        self.assertIsInstance(SerializerFactory.create_serializer("json"), JSONSerializer)
+
+    def test_broken_plugins(self) -> None:
+        """
+        Test that plugins which cannot be loaded raise a ValueError naming the plugin and its error.
+        """
+        with self.assertRaises(ValueError):
+            SerializerFactory.create_serializer("missing")
+        with self.assertRaises(ValueError):
+            SerializerFactory.create_serializer("invalid")
+        with self.assertRaises(ValueError):
+            SerializerFactory.create_serializer("unknown")
+
+        # Verify that a broken plugin is not reported as an unsupported format
+        self.assertIsNone(SerializerFactory.get_serializer_instance("unknown"))
+        with self.assertRaises(ValueError) as context:
+            SerializerFactory.get_serializer_instance("broken")
+        self.assertIn("broken_formats:BrokenSerializer", str(context.exception))
+        self.assertIn("ModuleNotFoundError: No module named 'pdm_missing_dependency'", str(context.exception))
+        with self.assertRaises(ValueError):
+            SerializerFactory.get_serializer_instance("invalid")
+
+    def test_discovery_cache(self) -> None:
+        """
+        Test that the discovered entry points are read from the cache file until a distribution is installed.
+        """
+        with open(self.cache_path, "r") as f:
+            cache = json.load(f)
+        self.assertEqual(cache["entry_points"][plugins.SERIALIZER_GROUP]["pipe"], "pipe_formats:PipeSerializer")
+
+        # Entries of an unchanged environment are served from the cache file without scanning
+        cache["entry_points"][plugins.SERIALIZER_GROUP]["cached"] = "pipe_formats:PipeSerializer"
+        with open(self.cache_path, "w") as f:
+            json.dump(cache, f)
+        plugins._discovered = None
+        self.assertIn("cached", plugins.discover_entry_points(cache_path=self.cache_path)[plugins.SERIALIZER_GROUP])
+
+        # Installing a distribution changes the modification time of its sys.path entry
+        self._install("more_formats", "[personal_data_manager.serializers]\nmore = pipe_formats:PipeSerializer\n")
+        os.utime(self.site, ns=(0, 0))
+        plugins._discovered = None
+        discovered = plugins.discover_entry_points(cache_path=self.cache_path)[plugins.SERIALIZER_GROUP]
+        self.assertIn("more", discovered)
+        self.assertNotIn("cached", discovered)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+from personal_data_manager.database import QueryCache
+
+
+class FakeClock:
+    """A manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestQueryCache(unittest.TestCase):
+    """Test the QueryCache class."""
+
+    def test_hits_and_misses(self) -> None:
+        """
+        Test that lookups are counted as hits or misses.
+        """
+        cache = QueryCache(max_entries=2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+        self.assertEqual(cache.stats.hit_ratio, 0.5)
+
+    def test_least_recently_used_eviction(self) -> None:
+        """
+        Test that the least recently used entry is evicted when the cache is full.
+        """
+        cache = QueryCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_ttl_expiry(self) -> None:
+        """
+        Test that entries expire after the TTL.
+        """
+        clock = FakeClock()
+        cache = QueryCache(ttl=10, clock=clock)
+        cache.put("a", 1)
+
+        clock.now = 9.9
+        self.assertEqual(cache.get("a"), 1)
+        clock.now = 10
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_version_change_invalidates(self) -> None:
+        """
+        Test that a change of the data version drops every entry.
+        """
+        cache = QueryCache()
+        cache.check_version((1, 0))
+        cache.put("a", 1)
+        cache.check_version((1, 0))
+        self.assertEqual(cache.get("a"), 1)
+
+        cache.check_version((2, 0))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats.invalidations, 1)
+
+    def test_disabled_cache(self) -> None:
+        """
+        Test that a cache without entries stores nothing, and that invalid limits raise a ValueError.
+        """
+        cache = QueryCache(max_entries=0)
+        cache.put("a", 1)
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.get("a"))
+
+        with self.assertRaises(ValueError):
+            QueryCache(max_entries=-1)
+        with self.assertRaises(ValueError):
+            QueryCache(ttl=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
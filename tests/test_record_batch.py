@@ -0,0 +1,86 @@
+import unittest
+
+from personal_data_manager.display_formatters.display_fmt_factory import DisplayFormatterFactory
+from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.record_batch import RecordBatch, RecordView
+from personal_data_manager.serializers.ser_factory import SerializerFactory
+
+
+class TestRecordBatch(unittest.TestCase):
+    """
+    A class for testing the RecordBatch class.
+    """
+
+    def setUp(self) -> None:
+        """Set up a list of records and the equivalent batch."""
+        self.records = [
+            PersonalData("John Doe", "123 Main St", "555-908-1234"),
+            PersonalData("Jane Smith", "456 Second St", "555-908-5678"),
+            PersonalData("Jack Brown", "789 Third St", "555-908-9012"),
+        ]
+        self.batch = RecordBatch.from_records(self.records)
+
+    def test_columns_and_views(self):
+        """
+        Test that a batch stores its fields column-wise and returns views that behave like PersonalData.
+        """
+        self.assertEqual(self.batch.names, ["John Doe", "Jane Smith", "Jack Brown"])
+        self.assertEqual(len(self.batch), 3)
+
+        # Verify that views read the values from the columns
+        view = self.batch[-1]
+        self.assertIsInstance(view, RecordView)
+        self.assertEqual(str(view), str(self.records[-1]))
+        self.assertEqual(view.to_dict(), self.records[-1].to_dict())
+        self.batch.addresses[2] = "1 New St"
+        self.assertEqual(view.address, "1 New St")
+
+        # Verify that slices are batches and that out of range indexes raise an IndexError
+        self.assertEqual(self.batch[1:].names, ["Jane Smith", "Jack Brown"])
+        with self.assertRaises(IndexError):
+            self.batch[3]
+
+    def test_from_rows(self):
+        """
+        Test that a batch can be created from rows and converted back to PersonalData objects.
+        """
+        batch = RecordBatch.from_rows(list(self.batch.rows()))
+        self.assertEqual([str(record) for record in batch.to_records()], [str(record) for record in self.records])
+        self.assertEqual(len(RecordBatch.from_rows([])), 0)
+
+    def test_mismatched_columns_value_error(self):
+        """
+        Test that creating a batch with columns of different lengths raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            RecordBatch(["John Doe"], [], ["555-908-1234"])
+
+    def test_serializers_accept_batches(self):
+        """
+        Test that serializing a batch, or a stream of batches, produces the same output as a list of records.
+        """
+        for output_format in ["json", "yaml", "xml", "csv", "text", "html"]:
+            serializer = SerializerFactory.create_serializer(output_format)
+            expected = serializer.serialize(self.records)
+
+            self.assertEqual(serializer.serialize(self.batch), expected)
+            self.assertEqual(serializer.serialize(iter([self.batch[:1], RecordBatch(), self.batch[1:]])), expected)
+
+        # Verify that an empty batch cannot be serialized
+        with self.assertRaises(ValueError):
+            SerializerFactory.create_serializer("json").serialize(RecordBatch())
+
+    def test_formatters_accept_batches(self):
+        """
+        Test that formatting a batch, or a stream of batches, produces the same output as a list of records.
+        """
+        for output_format in ["text", "html", "csv", "yaml"]:
+            formatter = DisplayFormatterFactory.create_formatter(output_format, self.batch)
+            expected = formatter.display_format(self.records)
+            self.assertEqual(formatter.display_format(self.batch), expected)
+            self.assertEqual(formatter.display_format(iter([self.batch[:1], RecordBatch(), self.batch[1:]])), expected)
+            self.assertEqual(formatter.display_format(iter(self.records)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
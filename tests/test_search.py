@@ -0,0 +1,86 @@
+import unittest
+
+from personal_data_manager.api import PersonalDataAPI
+from personal_data_manager.database import FullTextIndex
+from personal_data_manager.models.personal_data import PersonalData
+
+
+class TestSearch(unittest.TestCase):
+    """Test the full-text search of the PersonalDataAPI class."""
+
+    api = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up the test fixture."""
+        cls.api = PersonalDataAPI()
+        if not FullTextIndex.is_available(cls.api.conn):
+            raise unittest.SkipTest("SQLite was compiled without FTS5")
+
+    def setUp(self) -> None:
+        """Set up the test case with full-text search enabled and three records."""
+        self.api.cursor.execute("DELETE FROM personal_data")
+        self.api.conn.commit()
+        self.api.enable_full_text_search()
+        self.api.add_records([
+            PersonalData("John Maple", "12 Maple Avenue Springfield", "555-908-1234"),
+            PersonalData("Jane Oak", "34 Oak Street Springfield", "555-908-5678"),
+            PersonalData("Jack Elm", "56 Maplewood Road Shelbyville", "555-908-9012"),
+        ])
+
+    def tearDown(self) -> None:
+        """Tear down the test case."""
+        self.api.disable_full_text_search()
+        self.api.cursor.execute("DELETE FROM personal_data")
+        self.api.conn.commit()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Tear down the test fixture."""
+        cls.api.close()
+
+    def test_search_tokens(self):
+        """
+        Test that a token search returns the records containing every word, best match first.
+        """
+        records = self.api.search("maple springfield")
+        self.assertEqual([record.name for record in records], ["John Maple"])
+
+    def test_search_prefix_and_phrase(self):
+        """
+        Test that prefix searches match the beginning of words and phrase searches match consecutive words.
+        """
+        self.assertEqual(len(self.api.search("map", mode="prefix")), 2)
+        self.assertEqual([r.name for r in self.api.search("oak street", mode="phrase")], ["Jane Oak"])
+        self.assertEqual(self.api.search("street oak", mode="phrase"), [])
+
+    def test_search_field_and_limit(self):
+        """
+        Test that searches can be restricted to a field and limited in size.
+        """
+        self.assertEqual([r.name for r in self.api.search("maple", field="name")], ["John Maple"])
+        self.assertEqual(len(self.api.search("springfield", limit=1)), 1)
+
+    def test_search_follows_updates_and_deletes(self):
+        """
+        Test that the triggers keep the full-text index in sync with the table.
+        """
+        self.api.cursor.execute("UPDATE personal_data SET address = '1 Birch Lane' WHERE name = 'Jane Oak'")
+        self.api.cursor.execute("DELETE FROM personal_data WHERE name = 'John Maple'")
+        self.api.conn.commit()
+
+        self.assertEqual(self.api.search("springfield"), [])
+        self.assertEqual([r.name for r in self.api.search("birch")], ["Jane Oak"])
+
+    def test_search_invalid_query(self):
+        """
+        Test that empty queries and unknown modes raise a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.api.search("   ")
+        with self.assertRaises(ValueError):
+            self.api.search("maple", mode="fuzzy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
+import os
+import tempfile
 import unittest
+from io import BytesIO, StringIO
 
-from personal_data_manager.models.personal_data import PersonalData
+from personal_data_manager.models.personal_data import InvalidRecord, PersonalData
+from personal_data_manager.serializers.binary_ser import BinaryReader
 from personal_data_manager.serializers.ser_factory import SerializerFactory
 
 
@@ -77,6 +81,241 @@ class TestSerializers(unittest.TestCase):
             for i in range(len(records)):
                 self.assertEqual(str(deserialized[i]), str(records[i]))
 
+    def test_deserialize_iter(self):
+        """
+        Test that deserializing records from a stream yields the same records as deserializing a string.
+        """
+        records = [
+            PersonalData("John Doe", "123 Main St", "555-908-1234"),
+            PersonalData("Jane Smith", "456 Second St", "555-908-5678")
+        ]
+        for output_format in ["json", "jsonl", "yaml", "xml", "csv", "text"]:
+            # Create a serializer for the current format.
+            serializer = SerializerFactory.create_serializer(output_format)
+
+            # Deserialize the serialized data from a stream.
+            deserialized = list(serializer.deserialize_iter(StringIO(serializer.serialize(records))))
+
+            # Check that the streamed records match the original list of records.
+            self.assertEqual([str(record) for record in deserialized], [str(record) for record in records])
+
+    def test_deserialize_iter_keep_invalid(self):
+        """
+        Test that serializers keeping invalid records yield them in place and read the following records.
+        """
+        records = [
+            PersonalData("John Doe", "123 Main St", "555-908-1234"),
+            PersonalData.from_row(("Jane Smith", "456 Second St", "12345")),
+            PersonalData("Jack Brown", "789 Third St", "555-908-9012"),
+        ]
+        for output_format in ["json", "jsonl", "yaml", "xml", "csv", "text", "html"]:
+            serializer = SerializerFactory.create_serializer(output_format)
+            serialized = serializer.serialize(records)
+            with self.assertRaises(ValueError):
+                list(serializer.deserialize_iter(StringIO(serialized)))
+
+            serializer.keep_invalid = True
+            deserialized = list(serializer.deserialize_iter(StringIO(serialized)))
+            self.assertEqual([type(record) for record in deserialized], [PersonalData, InvalidRecord, PersonalData],
+                             output_format)
+            self.assertIn("###-###-####", deserialized[1].error)
+
+        # A malformed JSON line only invalidates its own record
+        serializer = SerializerFactory.create_serializer("jsonl")
+        serializer.keep_invalid = True
+        deserialized = list(serializer.deserialize_iter(StringIO(
+            '{"name": "John", "address": "1 St", "phone_number": "555-908-1234"}\n{"name": \n[1, 2]\n'
+        )))
+        self.assertIsInstance(deserialized[0], PersonalData)
+        self.assertIn("line 2", deserialized[1].error)
+        self.assertIn("expected name, address and phone_number", deserialized[2].error)
+
+    def test_serialize_iter_chunks(self):
+        """
+        Test that streaming records in small chunks produces the same document as serializing them at once.
+        """
+        records = [PersonalData(f"Person {i}", f"{i} Main St", "555-908-1234") for i in range(5)]
+        for output_format in ["json", "jsonl", "yaml", "xml", "csv", "text", "html"]:
+            # Create a serializer for the current format and a second one with a small chunk size.
+            serializer = SerializerFactory.create_serializer(output_format)
+            chunked_serializer = SerializerFactory.create_serializer(output_format)
+            chunked_serializer.chunk_size = 2
+
+            # Write the records to a stream from a generator, which cannot be traversed twice.
+            stream = StringIO()
+            chunked_serializer.write_to(stream, (record for record in records))
+
+            # Check that the streamed output matches the serialized string.
+            self.assertEqual(stream.getvalue(), serializer.serialize(records))
+
+
+    def test_xml_pretty_and_compact(self):
+        """
+        Test that XML is indented by default, written without whitespace when compact, and read back either way.
+        """
+        records = [PersonalData("John & Jane", "<123> Main St", "555-908-1234"),
+                   PersonalData("Jill", "456 Elm St", "555-908-5678")]
+        pretty_serializer = SerializerFactory.create_serializer("xml")
+        compact_serializer = SerializerFactory.create_serializer("xml", pretty=False)
+
+        # Check the layout of both outputs.
+        pretty = pretty_serializer.serialize(records[:1])
+        self.assertEqual(pretty, '<?xml version="1.0" ?>\n<records>\n  <record>\n    <name>John &amp; Jane</name>\n'
+                                 '    <address>&lt;123&gt; Main St</address>\n'
+                                 '    <phone_number>555-908-1234</phone_number>\n  </record>\n</records>\n')
+        compact = compact_serializer.serialize(records)
+        self.assertNotIn("\n", compact.split("\n", 1)[1])
+
+        # Check that both outputs are read back to the original records, one record at a time.
+        for serialized in [pretty_serializer.serialize(records), compact]:
+            deserialized = list(pretty_serializer.deserialize_iter(StringIO(serialized)))
+            self.assertEqual([str(record) for record in deserialized], [str(record) for record in records])
+
+    def test_xml_deserialize_invalid(self):
+        """
+        Test that deserializing malformed XML raises a ValueError.
+        """
+        serializer = SerializerFactory.create_serializer("xml")
+        with self.assertRaises(ValueError):
+            serializer.deserialize("<records><record><name>John</name></records>")
+
+    def test_json_deserialize_iter_blocks(self):
+        """
+        Test that the incremental JSON parser handles items split across blocks and arbitrary whitespace.
+        """
+        records = [PersonalData(f"Person {i}", f"{i} Main St, \"Apt\" [{i}]", "555-908-1234") for i in range(20)]
+        serializer = SerializerFactory.create_serializer("json")
+        serialized = serializer.serialize(records)
+
+        # Read the documents a few characters at a time, so that every item spans several blocks.
+        serializer.read_size = 7
+        for document in [serialized, "\n[\n  " + serialized[1:-1].replace("}, {", "} ,\n  {") + "\n]\n"]:
+            deserialized = list(serializer.deserialize_iter(StringIO(document)))
+            self.assertEqual([str(record) for record in deserialized], [str(record) for record in records])
+
+        # Check that an empty array yields no records.
+        self.assertEqual(list(serializer.deserialize_iter(StringIO(" [ ] "))), [])
+
+    def test_json_deserialize_iter_invalid(self):
+        """
+        Test that the incremental JSON parser rejects malformed documents.
+        """
+        serializer = SerializerFactory.create_serializer("json")
+        item = '{"name": "John Doe", "address": "123 Main St", "phone_number": "555-908-1234"}'
+        for document in ["", item, f"[{item}", f"[{item} {item}]", f"[{item}] x", '[{"name": "John Doe"}]',
+                         '[{"name": "John']:
+            with self.assertRaises(ValueError, msg=document):
+                list(serializer.deserialize_iter(StringIO(document)))
+
+    def test_jsonl_one_record_per_line(self):
+        """
+        Test that JSON Lines output holds one JSON object per line and that invalid lines are reported.
+        """
+        records = [PersonalData("John Doe", "123 Main St", "555-908-1234"),
+                   PersonalData("Jane Smith", "456 Second St", "555-908-5678")]
+        serializer = SerializerFactory.create_serializer("jsonl")
+        self.assertEqual(serializer.serialize(records),
+                         '{"name": "John Doe", "address": "123 Main St", "phone_number": "555-908-1234"}\n'
+                         '{"name": "Jane Smith", "address": "456 Second St", "phone_number": "555-908-5678"}\n')
+
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            list(serializer.deserialize_iter(StringIO(serializer.serialize(records[:1]) + "{not json}\n")))
+
+    def test_yaml_multi_document(self):
+        """
+        Test that multi-document YAML holds one document per chunk and is read back one document at a time.
+        """
+        records = [PersonalData(f"Person {i}", f"{i} Main St", "555-908-1234") for i in range(5)]
+        serializer = SerializerFactory.create_serializer("yaml", multi_document=True)
+        serializer.chunk_size = 2
+
+        # Check that each chunk of records starts a new document.
+        serialized = serializer.serialize(records)
+        self.assertEqual(serialized.count("---"), 3)
+
+        # Check that both single and multi-document YAML are read back to the original records.
+        single = SerializerFactory.create_serializer("yaml").serialize(records)
+        for document in [serialized, single]:
+            deserialized = list(serializer.deserialize_iter(StringIO(document)))
+            self.assertEqual([str(record) for record in deserialized], [str(record) for record in records])
+
+    def test_html_escaping_and_streaming(self):
+        """
+        Test that HTML cells are escaped and that table rows split across blocks are read back.
+        """
+        records = [PersonalData("Smith & Sons <Ltd>", "1 \"Main\" St", "555-908-1234"),
+                   PersonalData("Jane Smith", "456 Second St", "555-908-5678")]
+        serializer = SerializerFactory.create_serializer("html")
+        serialized = serializer.serialize(records)
+        self.assertIn("<td>Smith &amp; Sons &lt;Ltd&gt;</td>", serialized)
+
+        # Read the document a few characters at a time, with a header row added.
+        serializer.read_size = 5
+        document = serialized.replace("<table>\n", "<table>\n<tr><th>Name</th><th>Address</th><th>Phone</th></tr>\n")
+        for html in [serialized, document]:
+            deserialized = list(serializer.deserialize_iter(StringIO(html)))
+            self.assertEqual([str(record) for record in deserialized], [str(record) for record in records])
+
+        # Check that cells and rows without closing tags are read as well.
+        deserialized = serializer.deserialize("<table><tr><td>Jane Smith<td>456 Second St<td>555-908-5678")
+        self.assertEqual([str(record) for record in deserialized], [str(records[1])])
+
+
+    def test_binary_round_trip(self):
+        """
+        Test that the binary format round-trips non-ASCII and long fields across blocks of several sizes.
+        """
+        records = [PersonalData(f"Persön {i}", f"{i} Main St" + " Apt 1" * (60 if i == 3 else 0), "555-908-1234")
+                   for i in range(5)]
+        serializer = SerializerFactory.create_serializer("binary")
+        serializer.chunk_size = 2
+
+        # Write the records to a binary stream, in blocks of two records
+        stream = BytesIO()
+        serializer.write_to(stream, iter(records))
+        serialized = stream.getvalue()
+        self.assertEqual(serialized, serializer.serialize(records))
+        self.assertTrue(serialized.startswith(b"PDMB"))
+
+        streamed = list(serializer.deserialize_iter(BytesIO(serialized)))
+        for deserialized in (serializer.deserialize(serialized), streamed):
+            self.assertEqual([str(record) for record in deserialized], [str(record) for record in records])
+
+    def test_binary_invalid_data(self):
+        """
+        Test that corrupted, truncated or foreign binary data raises a ValueError.
+        """
+        serializer = SerializerFactory.create_serializer("binary")
+        serialized = serializer.serialize([PersonalData("John Doe", "123 Main St", "555-908-1234")])
+
+        corrupted = bytearray(serialized)
+        corrupted[-20] ^= 1
+        for invalid in (b"", bytes(corrupted), serialized[:-1], serialized[:30], b"PK\x03\x04" + serialized[4:]):
+            with self.assertRaises(ValueError):
+                serializer.deserialize(invalid)
+
+    def test_binary_reader(self):
+        """
+        Test reading the blocks and records of a memory-mapped binary export in any order.
+        """
+        records = [PersonalData(f"Person {i}", f"{i} Rue Émile", f"555-908-{i:04d}") for i in range(10)]
+        serializer = SerializerFactory.create_serializer("binary")
+        serializer.chunk_size = 4
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            file_name = os.path.join(tempdir, "address_book.binary")
+            with open(file_name, "wb") as f:
+                serializer.write_to(f, records)
+
+            with BinaryReader(file_name) as reader:
+                self.assertEqual((len(reader), reader.block_count), (10, 3))
+                self.assertEqual(reader.read_block(2).phone_numbers, ["555-908-0008", "555-908-0009"])
+                self.assertEqual(str(reader[5]), str(records[5]))
+                self.assertEqual(str(reader[-1]), str(records[9]))
+                self.assertEqual([record.name for record in reader], [record.name for record in records])
+                with self.assertRaises(IndexError):
+                    reader[10]
+
 
 if __name__ == "__main__":
     # Run the test suite.
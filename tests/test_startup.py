@@ -0,0 +1,113 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# The root of the repository, added to the path of the command-line processes
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The largest allowed total import time of a command of the command-line interface, in milliseconds. The
+# time depends on the machine, so it is only checked when PDM_STARTUP_BUDGET_MS is set, e.g. to 100.
+STARTUP_BUDGET_MS = float(os.environ["PDM_STARTUP_BUDGET_MS"]) if os.environ.get("PDM_STARTUP_BUDGET_MS") else None
+
+# Modules that commands which do not serialize anything must not import
+HEAVY_MODULES = [
+    "yaml",
+    "xml.etree.ElementTree",
+    "html.parser",
+    "csv",
+    "concurrent.futures.process",
+    "multiprocessing",
+    "hashlib",
+    "personal_data_manager.serializers.yaml_ser",
+    "personal_data_manager.serializers.xml_ser",
+    "personal_data_manager.display_formatters.yaml_display_fmt",
+]
+
+# A line of the -X importtime output: "import time: <self us> | <cumulative us> | <indented module name>"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def run_cli(database: str, *args: str) -> dict:
+    """
+    Run a command of the command-line interface with -X importtime.
+
+    Args:
+        database (str): The path of the database.
+        *args (str): The command and its arguments.
+
+    Returns:
+        dict: The cumulative import time of each imported module, in microseconds, and the total import time
+              under the "total" key.
+    """
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+
+    # Let Python cache the compiled modules, as it does for an installed package
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "personal_data_manager.main", "--database", database, *args],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    import_times = {"total": 0}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            import_times[match.group(4)] = int(match.group(2))
+
+            # The modules imported at the top level account for the whole import time
+            if not match.group(3):
+                import_times["total"] += int(match.group(2))
+    return import_times
+
+
+class TestStartup(unittest.TestCase):
+    """Test the modules imported at the startup of the command-line interface."""
+
+    def setUp(self) -> None:
+        """Set up an empty database in a temporary directory."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.tempdir.name, "address_book.db")
+
+    def tearDown(self) -> None:
+        """Tear down the test case."""
+        self.tempdir.cleanup()
+
+    def assert_fast_startup(self, *commands) -> None:
+        """
+        Assert that commands only import the modules they need, within the startup budget if one is set.
+
+        Args:
+            *commands: The arguments of each run of the command, the first of which warms up the database and
+                       the compiled modules.
+        """
+        run_cli(self.database, *commands[0])
+        startup_times = []
+        for args in commands[1:]:
+            import_times = run_cli(self.database, *args)
+            for module in HEAVY_MODULES:
+                self.assertNotIn(module, import_times, f"{args[0]} imports {module}")
+            startup_times.append(import_times["total"] / 1000)
+
+        if STARTUP_BUDGET_MS is not None:
+            self.assertLess(min(startup_times), STARTUP_BUDGET_MS,
+                            f"{commands[0][0]} took {min(startup_times):.1f} ms to import")
+
+    def test_add_startup(self) -> None:
+        """
+        Test that the add command does not import the serialization modules.
+        """
+        self.assert_fast_startup(*[["add", "-n", "John", "-a", "123 Main St", "-p", f"555-908-{i:04d}"]
+                                   for i in range(2 if STARTUP_BUDGET_MS is None else 4)])
+
+    def test_filter_startup(self) -> None:
+        """
+        Test that the filter command does not import the serialization modules.
+        """
+        self.assert_fast_startup(*[["filter", "-f", "name", "-p", "Jo%"]] * (2 if STARTUP_BUDGET_MS is None else 4))
+
+
+if __name__ == "__main__":
+    unittest.main()